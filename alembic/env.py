@@ -10,14 +10,19 @@ from app.config import get_settings
 from app.database import Base
 from app.models.address import Address
 from app.models.cart_item import CartItem
+from app.models.catalog_facet import CatalogFacetCount
 from app.models.category import Category
+from app.models.image_blob import ImageBlob
 from app.models.order import Order
 from app.models.order_item import OrderItem
+from app.models.platform_stats import PlatformStatsSnapshot
 from app.models.product import Product
 from app.models.product_image import ProductImage
 from app.models.review import Review
+from app.models.sales_rollup import ProductSalesDaily, StoreSalesDaily
 from app.models.store import Store
 from app.models.user import User
+from app.models.verified_purchase import VerifiedPurchase
 
 # Alembic Config object
 config = context.config
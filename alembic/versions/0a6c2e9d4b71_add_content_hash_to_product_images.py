@@ -0,0 +1,37 @@
+"""add content hash to product images
+
+Revision ID: 0a6c2e9d4b71
+Revises: f1b2c3d4e5f6
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0a6c2e9d4b71"
+down_revision: Union[str, Sequence[str], None] = "f1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "product_images",
+        sa.Column("content_hash", sa.String(length=64), nullable=True),
+    )
+    op.add_column(
+        "product_images",
+        sa.Column("file_size", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("product_images", "file_size")
+    op.drop_column("product_images", "content_hash")
@@ -0,0 +1,54 @@
+"""add composite indexes for order, product and cart queries
+
+Revision ID: 0b4d7f2a9c6e
+Revises: f3c6a9e2d5b8
+Create Date: 2026-10-19 02:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b4d7f2a9c6e"
+down_revision: Union[str, Sequence[str], None] = "f3c6a9e2d5b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns). Built with CREATE INDEX CONCURRENTLY, which cannot
+# run inside a transaction, so writes to these tables are never blocked.
+INDEXES = [
+    ("ix_orders_user_id_created_at", "orders", ["user_id", "created_at"]),
+    ("ix_order_items_store_id_created_at", "order_items", ["store_id", "created_at"]),
+    (
+        "ix_products_category_id_is_active_price",
+        "products",
+        ["category_id", "is_active", "price"],
+    ),
+    ("ix_cart_items_product_id", "cart_items", ["product_id"]),
+]
+# Single-column indexes now covered by the leading column of a new one.
+SUPERSEDED_INDEXES = [
+    ("ix_orders_user_id", "orders", ["user_id"]),
+    ("ix_order_items_store_id", "order_items", ["store_id"]),
+    ("ix_products_category_id", "products", ["category_id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        for name, table, _ in SUPERSEDED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in SUPERSEDED_INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
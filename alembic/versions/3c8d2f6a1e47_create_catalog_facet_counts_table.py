@@ -0,0 +1,68 @@
+"""create catalog facet counts table
+
+Revision ID: 3c8d2f6a1e47
+Revises: b7e1f4a2c9d3
+Create Date: 2026-10-19 00:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c8d2f6a1e47"
+down_revision: Union[str, Sequence[str], None] = "b7e1f4a2c9d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "catalog_facet_counts",
+        sa.Column("category_id", sa.UUID(), nullable=False),
+        sa.Column("store_id", sa.UUID(), nullable=False),
+        sa.Column("price_bucket", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("product_count", sa.Integer(), nullable=False),
+        sa.CheckConstraint(
+            "product_count >= 0",
+            name="ck_catalog_facet_counts_product_count_gte_0",
+        ),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("category_id", "store_id", "price_bucket"),
+    )
+
+    # Backfill with the default CATALOG_PRICE_BUCKETS; deployments that
+    # override them should run the rebuild_catalog_facets task afterwards.
+    op.execute(
+        """
+        INSERT INTO catalog_facet_counts (category_id, store_id, price_bucket, product_count)
+        SELECT category_id, store_id, price_bucket, count(*)
+        FROM (
+            SELECT
+                category_id,
+                store_id,
+                CASE
+                    WHEN price >= 1000 THEN 1000
+                    WHEN price >= 500 THEN 500
+                    WHEN price >= 250 THEN 250
+                    WHEN price >= 100 THEN 100
+                    WHEN price >= 50 THEN 50
+                    WHEN price >= 25 THEN 25
+                    ELSE 0
+                END AS price_bucket
+            FROM products
+            WHERE is_active
+        ) AS priced
+        GROUP BY category_id, store_id, price_bucket
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("catalog_facet_counts")
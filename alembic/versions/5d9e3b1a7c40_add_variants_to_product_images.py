@@ -0,0 +1,38 @@
+"""add variants to product images
+
+Revision ID: 5d9e3b1a7c40
+Revises: 0a6c2e9d4b71
+Create Date: 2026-10-19 00:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d9e3b1a7c40"
+down_revision: Union[str, Sequence[str], None] = "0a6c2e9d4b71"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "product_images",
+        sa.Column(
+            "variants",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("product_images", "variants")
@@ -0,0 +1,45 @@
+"""backfill store product_count from active products
+
+Revision ID: 6e2a9c4d8b15
+Revises: 3c8d2f6a1e47
+Create Date: 2026-10-19 00:50:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6e2a9c4d8b15"
+down_revision: Union[str, Sequence[str], None] = "3c8d2f6a1e47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # product_count used to be whatever the vendor sent; from now on it is
+    # the number of active products, maintained by the application.
+    op.execute(
+        """
+        UPDATE stores AS s
+        SET product_count = (
+            SELECT count(*)
+            FROM products AS p
+            WHERE p.store_id = s.id AND p.is_active
+        )
+        """
+    )
+    op.create_check_constraint(
+        "ck_stores_product_count_gte_0",
+        "stores",
+        sa.text("product_count >= 0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("ck_stores_product_count_gte_0", "stores", type_="check")
@@ -0,0 +1,61 @@
+"""create image blobs table
+
+Revision ID: 8f3a5c7e1d92
+Revises: 5d9e3b1a7c40
+Create Date: 2026-10-19 00:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f3a5c7e1d92"
+down_revision: Union[str, Sequence[str], None] = "5d9e3b1a7c40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "image_blobs",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("storage_key", sa.String(length=500), nullable=False),
+        sa.Column("content_type", sa.String(length=50), nullable=False),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint("ref_count >= 0", name="ck_image_blobs_ref_count_gte_0"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("content_hash"),
+    )
+    # Images uploaded before this revision keep their own files and have no
+    # blob row; ProductImageService deletes those directly.
+    op.create_index(
+        op.f("ix_product_images_content_hash"),
+        "product_images",
+        ["content_hash"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_product_images_content_hash"), table_name="product_images")
+    op.drop_table("image_blobs")
@@ -0,0 +1,91 @@
+"""create daily sales rollup tables
+
+Revision ID: 9d4c2b7e5a13
+Revises: 6e2a9c4d8b15
+Create Date: 2026-10-19 01:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4c2b7e5a13"
+down_revision: Union[str, Sequence[str], None] = "6e2a9c4d8b15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "store_sales_daily",
+        sa.Column("store_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("units", sa.Integer(), nullable=False),
+        sa.Column("revenue", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("order_count", sa.Integer(), nullable=False),
+        sa.CheckConstraint("units >= 0", name="ck_store_sales_daily_units_gte_0"),
+        sa.CheckConstraint(
+            "order_count >= 0", name="ck_store_sales_daily_order_count_gte_0"
+        ),
+        sa.ForeignKeyConstraint(["store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("store_id", "day"),
+    )
+    op.create_table(
+        "product_sales_daily",
+        sa.Column("store_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("product_id", sa.UUID(), nullable=False),
+        sa.Column("units", sa.Integer(), nullable=False),
+        sa.Column("revenue", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("order_count", sa.Integer(), nullable=False),
+        sa.CheckConstraint("units >= 0", name="ck_product_sales_daily_units_gte_0"),
+        sa.CheckConstraint(
+            "order_count >= 0", name="ck_product_sales_daily_order_count_gte_0"
+        ),
+        sa.ForeignKeyConstraint(["store_id"], ["stores.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("store_id", "day", "product_id"),
+    )
+
+    # Backfill from the order items placed so far.
+    op.execute(
+        """
+        INSERT INTO store_sales_daily (store_id, day, units, revenue, order_count)
+        SELECT
+            store_id,
+            (created_at AT TIME ZONE 'UTC')::date,
+            sum(quantity),
+            sum(subtotal),
+            count(DISTINCT order_id)
+        FROM order_items
+        WHERE status <> 'cancelled'
+        GROUP BY 1, 2
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO product_sales_daily
+            (store_id, day, product_id, units, revenue, order_count)
+        SELECT
+            store_id,
+            (created_at AT TIME ZONE 'UTC')::date,
+            product_id,
+            sum(quantity),
+            sum(subtotal),
+            count(DISTINCT order_id)
+        FROM order_items
+        WHERE status <> 'cancelled'
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("product_sales_daily")
+    op.drop_table("store_sales_daily")
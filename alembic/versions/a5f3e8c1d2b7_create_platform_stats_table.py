@@ -0,0 +1,37 @@
+"""create platform stats table
+
+Revision ID: a5f3e8c1d2b7
+Revises: 9d4c2b7e5a13
+Create Date: 2026-10-19 01:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a5f3e8c1d2b7"
+down_revision: Union[str, Sequence[str], None] = "9d4c2b7e5a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "platform_stats",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("stats", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint("id = 1", name="ck_platform_stats_single_row"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("platform_stats")
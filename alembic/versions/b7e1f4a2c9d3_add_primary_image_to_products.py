@@ -0,0 +1,72 @@
+"""add primary image summary to products
+
+Revision ID: b7e1f4a2c9d3
+Revises: 8f3a5c7e1d92
+Create Date: 2026-10-19 00:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e1f4a2c9d3"
+down_revision: Union[str, Sequence[str], None] = "8f3a5c7e1d92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("products", sa.Column("primary_image_id", sa.UUID(), nullable=True))
+    op.add_column(
+        "products",
+        sa.Column("primary_image_url", sa.String(length=500), nullable=True),
+    )
+    op.add_column(
+        "products",
+        sa.Column(
+            "primary_image_variants",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
+    op.add_column(
+        "products",
+        sa.Column("image_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Backfill: primary image first, else the first by sort order.
+    op.execute(
+        """
+        UPDATE products AS p
+        SET primary_image_id = summary.id,
+            primary_image_url = summary.image_url,
+            primary_image_variants = summary.variants,
+            image_count = summary.image_count
+        FROM (
+            SELECT DISTINCT ON (product_id)
+                product_id,
+                id,
+                image_url,
+                variants,
+                count(*) OVER (PARTITION BY product_id) AS image_count
+            FROM product_images
+            ORDER BY product_id, is_primary DESC, sort_order, created_at
+        ) AS summary
+        WHERE summary.product_id = p.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("products", "image_count")
+    op.drop_column("products", "primary_image_variants")
+    op.drop_column("products", "primary_image_url")
+    op.drop_column("products", "primary_image_id")
@@ -0,0 +1,49 @@
+"""add reviewer_name and keyset index to reviews
+
+Revision ID: c2e7b9d4f3a8
+Revises: a5f3e8c1d2b7
+Create Date: 2026-10-19 01:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c2e7b9d4f3a8"
+down_revision: Union[str, Sequence[str], None] = "a5f3e8c1d2b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("reviews", sa.Column("reviewer_name", sa.String(length=100), nullable=True))
+    op.execute(
+        """
+        UPDATE reviews
+        SET reviewer_name = users.full_name
+        FROM users
+        WHERE users.id = reviews.user_id
+        """
+    )
+    op.alter_column("reviews", "reviewer_name", nullable=False)
+
+    op.create_index(
+        "ix_reviews_product_id_created_at_id",
+        "reviews",
+        ["product_id", "created_at", "id"],
+        unique=False,
+    )
+    # Covered by the leading column of the index above.
+    op.drop_index(op.f("ix_reviews_product_id"), table_name="reviews")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_reviews_product_id"), "reviews", ["product_id"], unique=False)
+    op.drop_index("ix_reviews_product_id_created_at_id", table_name="reviews")
+    op.drop_column("reviews", "reviewer_name")
@@ -0,0 +1,60 @@
+"""create verified purchases table
+
+Revision ID: d8a3f1c6e2b9
+Revises: c2e7b9d4f3a8
+Create Date: 2026-10-19 01:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a3f1c6e2b9"
+down_revision: Union[str, Sequence[str], None] = "c2e7b9d4f3a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "verified_purchases",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("product_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "first_delivered_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "product_id"),
+    )
+    # Everyone who could review before keeps that right: items delivered on
+    # their own, and items of orders marked delivered as a whole.
+    op.execute(
+        """
+        INSERT INTO verified_purchases (user_id, product_id, first_delivered_at)
+        SELECT orders.user_id, order_items.product_id, min(order_items.updated_at)
+        FROM order_items
+        JOIN orders ON orders.id = order_items.order_id
+        WHERE order_items.status = 'delivered' OR upper(orders.status) = 'DELIVERED'
+        GROUP BY orders.user_id, order_items.product_id
+        """
+    )
+
+    # Backs the RESTRICT foreign key check when a product is deleted.
+    op.create_index(
+        op.f("ix_order_items_product_id"), "order_items", ["product_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_order_items_product_id"), table_name="order_items")
+    op.drop_table("verified_purchases")
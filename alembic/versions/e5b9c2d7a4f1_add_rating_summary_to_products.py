@@ -0,0 +1,79 @@
+"""add rating histogram and summary to products
+
+Revision ID: e5b9c2d7a4f1
+Revises: d8a3f1c6e2b9
+Create Date: 2026-10-19 01:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b9c2d7a4f1"
+down_revision: Union[str, Sequence[str], None] = "d8a3f1c6e2b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RATING_COUNT_COLUMNS = [f"rating_{rating}_count" for rating in range(1, 6)]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in [*RATING_COUNT_COLUMNS, "review_count"]:
+        op.add_column(
+            "products",
+            sa.Column(column, sa.Integer(), server_default="0", nullable=False),
+        )
+    op.add_column(
+        "products",
+        sa.Column(
+            "average_rating",
+            sa.Numeric(precision=3, scale=2),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+    op.execute(
+        """
+        UPDATE products
+        SET rating_1_count = ratings.rating_1_count,
+            rating_2_count = ratings.rating_2_count,
+            rating_3_count = ratings.rating_3_count,
+            rating_4_count = ratings.rating_4_count,
+            rating_5_count = ratings.rating_5_count,
+            review_count = ratings.review_count,
+            average_rating = ratings.average_rating
+        FROM (
+            SELECT
+                product_id,
+                count(*) FILTER (WHERE rating = 1) AS rating_1_count,
+                count(*) FILTER (WHERE rating = 2) AS rating_2_count,
+                count(*) FILTER (WHERE rating = 3) AS rating_3_count,
+                count(*) FILTER (WHERE rating = 4) AS rating_4_count,
+                count(*) FILTER (WHERE rating = 5) AS rating_5_count,
+                count(*) AS review_count,
+                round(avg(rating), 2) AS average_rating
+            FROM reviews
+            GROUP BY product_id
+        ) AS ratings
+        WHERE products.id = ratings.product_id
+        """
+    )
+    op.create_index(
+        "ix_products_average_rating_review_count",
+        "products",
+        ["average_rating", "review_count"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_products_average_rating_review_count", table_name="products")
+    op.drop_column("products", "average_rating")
+    for column in reversed([*RATING_COUNT_COLUMNS, "review_count"]):
+        op.drop_column("products", column)
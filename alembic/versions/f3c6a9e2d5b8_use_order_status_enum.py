@@ -0,0 +1,76 @@
+"""use order_status_enum for order and order item status
+
+Revision ID: f3c6a9e2d5b8
+Revises: e5b9c2d7a4f1
+Create Date: 2026-10-19 01:50:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3c6a9e2d5b8"
+down_revision: Union[str, Sequence[str], None] = "e5b9c2d7a4f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+order_status_enum = postgresql.ENUM(
+    "pending",
+    "confirmed",
+    "shipped",
+    "delivered",
+    "cancelled",
+    name="order_status_enum",
+)
+OPEN_STATUSES = sa.text("status IN ('pending', 'confirmed')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    order_status_enum.create(op.get_bind())
+    for table in ("orders", "order_items"):
+        # lower() also accepts any value written in another case before the type existed.
+        op.alter_column(
+            table,
+            "status",
+            existing_type=sa.String(length=20),
+            type_=order_status_enum,
+            existing_nullable=False,
+            postgresql_using="lower(status)::order_status_enum",
+        )
+
+    op.create_index(
+        "ix_orders_open_user_id_created_at",
+        "orders",
+        ["user_id", "created_at"],
+        unique=False,
+        postgresql_where=OPEN_STATUSES,
+    )
+    op.create_index(
+        "ix_order_items_open_store_id_created_at",
+        "order_items",
+        ["store_id", "created_at"],
+        unique=False,
+        postgresql_where=OPEN_STATUSES,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_order_items_open_store_id_created_at", table_name="order_items")
+    op.drop_index("ix_orders_open_user_id_created_at", table_name="orders")
+    for table in ("order_items", "orders"):
+        op.alter_column(
+            table,
+            "status",
+            existing_type=order_status_enum,
+            type_=sa.String(length=20),
+            existing_nullable=False,
+            postgresql_using="status::text",
+        )
+    order_status_enum.drop(op.get_bind())
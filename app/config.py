@@ -1,3 +1,4 @@
+from decimal import Decimal
 from functools import lru_cache
 from typing import List
 
@@ -22,9 +23,41 @@ class Settings(BaseSettings):
     # App behavior
     DEBUG: bool = False
 
+    # Carts: "database" (cart_items table) or "redis" (written back by Celery beat)
+    CART_BACKEND: str = "database"
+    CART_PERSIST_INTERVAL_SECONDS: int = 60
+
+    # Catalog facets: lower bounds of the price buckets kept in
+    # catalog_facet_counts (run the rebuild_catalog_facets task after changing)
+    CATALOG_PRICE_BUCKETS: List[Decimal] = [0, 25, 50, 100, 250, 500, 1000]
+    CATALOG_FACETS_REBUILD_INTERVAL_SECONDS: int = 3600
+
+    # Stores: how often product_count is checked against products for drift
+    STORE_PRODUCT_COUNT_RECONCILE_INTERVAL_SECONDS: int = 86400
+
+    # Admin dashboard: platform stats are recomputed in the background, on
+    # STATS_DATABASE_URL (e.g. a read replica) when set, else DATABASE_URL
+    PLATFORM_STATS_REFRESH_INTERVAL_SECONDS: int = 300
+    STATS_DATABASE_URL: str | None = None
+
     # CORS
     ALLOWED_ORIGINS: List[str] = []
 
+    # Media storage: "local" (uploads/ directory) or "s3"
+    STORAGE_BACKEND: str = "local"
+    S3_BUCKET: str | None = None
+    S3_ENDPOINT_URL: str | None = None  # set for MinIO/R2 and other S3-compatibles
+    S3_PUBLIC_BASE_URL: str | None = None
+
+    # /uploads serving: None streams from this process; "x-accel-redirect"
+    # (nginx) or "x-sendfile" (Apache/lighttpd) hands the file to the proxy
+    UPLOADS_OFFLOAD: str | None = None
+    UPLOADS_ACCEL_REDIRECT_PREFIX: str = "/_uploads"
+
+    # Product image derivatives (generated by the Celery worker)
+    IMAGE_VARIANT_WIDTHS: List[int] = [150, 400, 1200]
+    IMAGE_VARIANT_FORMATS: List[str] = ["avif", "webp"]
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
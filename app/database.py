@@ -1,5 +1,8 @@
+from contextlib import asynccontextmanager
+
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 
 from app.config import get_settings
 
@@ -29,14 +32,19 @@ def _import_all_models() -> None:
     from app.models import (  # noqa: F401
         address,
         cart_item,
+        catalog_facet,
         category,
+        image_blob,
         order,
         order_item,
+        platform_stats,
         product,
         product_image,
         review,
+        sales_rollup,
         store,
         user,
+        verified_purchase,
     )
 
 
@@ -52,3 +60,23 @@ async def get_db():
             yield session
         finally:
             await session.close()
+
+
+# Session for Celery tasks
+@asynccontextmanager
+async def task_session(database_url: str | None = None):
+    # Tasks drive their coroutine with asyncio.run(), i.e. a fresh event loop
+    # per task, so they cannot reuse pooled connections bound to another loop.
+    task_engine = create_async_engine(
+        database_url or settings.DATABASE_URL, poolclass=NullPool
+    )
+    session_factory = async_sessionmaker(
+        bind=task_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    try:
+        async with session_factory() as session:
+            yield session
+    finally:
+        await task_engine.dispose()
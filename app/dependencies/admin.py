@@ -0,0 +1,10 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.repositories.platform_stats import PlatformStatsRepository
+from app.services.admin import AdminService
+
+
+def get_admin_service(db: AsyncSession = Depends(get_db)) -> AdminService:
+    return AdminService(platform_stats_repo=PlatformStatsRepository(db))
@@ -0,0 +1,14 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.repositories.sales import SalesRollupRepository
+from app.repositories.store import StoreRepository
+from app.services.analytics import AnalyticsService
+
+
+def get_analytics_service(db: AsyncSession = Depends(get_db)) -> AnalyticsService:
+    return AnalyticsService(
+        store_repo=StoreRepository(db),
+        sales_repo=SalesRollupRepository(db),
+    )
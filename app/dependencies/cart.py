@@ -1,14 +1,25 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import get_redis_client
+from app.config import get_settings
 from app.database import get_db
-from app.repositories.cart import CartRepository
-from app.repositories.product import ProductRepository
+from app.repositories.cart import CartRepository, CartStore
+from app.repositories.redis_cart import RedisCartRepository
 from app.services.cart import CartService
 
 
-def get_cart_service(db: AsyncSession = Depends(get_db)) -> CartService:
+def get_cart_repository(
+    db: AsyncSession = Depends(get_db),
+) -> CartStore:
+    if get_settings().CART_BACKEND == "redis":
+        return RedisCartRepository(db, get_redis_client())
+    return CartRepository(db)
+
+
+def get_cart_service(
+    cart_repo: CartStore = Depends(get_cart_repository),
+) -> CartService:
     return CartService(
-        cart_repo=CartRepository(db),
-        product_repo=ProductRepository(db),
+        cart_repo=cart_repo,
     )
@@ -1,10 +1,19 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import get_redis_client
 from app.database import get_db
 from app.repositories.category import CategoryRepository
+from app.repositories.category_cache import CachedCategoryRepository
 from app.services.category import CategoryService
 
 
-def get_category_service(db: AsyncSession = Depends(get_db)) -> CategoryService:
-    return CategoryService(CategoryRepository(db))
+def get_category_cache(db: AsyncSession = Depends(get_db)) -> CachedCategoryRepository:
+    return CachedCategoryRepository(db, get_redis_client())
+
+
+def get_category_service(
+    db: AsyncSession = Depends(get_db),
+    category_cache: CachedCategoryRepository = Depends(get_category_cache),
+) -> CategoryService:
+    return CategoryService(CategoryRepository(db), category_cache)
@@ -2,17 +2,19 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.repositories.category import CategoryRepository
+from app.dependencies.category import get_category_cache
+from app.repositories.category_cache import CachedCategoryRepository
 from app.repositories.product import ProductRepository
-from app.repositories.review import ReviewRepository
 from app.repositories.store import StoreRepository
 from app.services.product import ProductService
 
 
-def get_product_service(db: AsyncSession = Depends(get_db)) -> ProductService:
+def get_product_service(
+    db: AsyncSession = Depends(get_db),
+    category_cache: CachedCategoryRepository = Depends(get_category_cache),
+) -> ProductService:
     return ProductService(
         product_repo=ProductRepository(db),
         store_repo=StoreRepository(db),
-        category_repo=CategoryRepository(db),
-        review_repo=ReviewRepository(db),
+        category_repo=category_cache,
     )
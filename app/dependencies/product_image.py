@@ -2,14 +2,21 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.repositories.image_blob import ImageBlobRepository
+from app.repositories.product import ProductRepository
 from app.repositories.store import StoreRepository
 from app.services.product_image import ProductImageService
+from app.storage import StorageBackend, get_storage_backend
 
 
 def get_product_image_service(
     db: AsyncSession = Depends(get_db),
+    storage: StorageBackend = Depends(get_storage_backend),
 ) -> ProductImageService:
     return ProductImageService(
         db=db,
         store_repo=StoreRepository(db),
+        product_repo=ProductRepository(db),
+        blob_repo=ImageBlobRepository(db),
+        storage=storage,
     )
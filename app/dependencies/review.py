@@ -1,9 +1,11 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import get_redis_client
 from app.database import get_db
 from app.repositories.product import ProductRepository
 from app.repositories.review import ReviewRepository
+from app.repositories.review_cache import ReviewPageCache
 from app.services.review import ReviewService
 
 
@@ -11,4 +13,5 @@ def get_review_service(db: AsyncSession = Depends(get_db)) -> ReviewService:
     return ReviewService(
         review_repo=ReviewRepository(db),
         product_repo=ProductRepository(db),
+        review_cache=ReviewPageCache(get_redis_client()),
     )
@@ -4,7 +4,6 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
 from app.config import get_settings
 from app.database import engine, ensure_database_schema
@@ -12,6 +11,7 @@ from app.exception_handler import register_exception_handlers
 from app.middleware import RequestIDMiddleware, RequestLoggingMiddleware
 from app.routers.addresses import router as addresses_router
 from app.routers.admin import router as admin_router
+from app.routers.analytics import router as analytics_router
 from app.routers.auth import router as auth_router
 from app.routers.cart import router as cart_router
 from app.routers.categories import router as categories_router
@@ -21,6 +21,7 @@ from app.routers.product_images import router as product_images_router
 from app.routers.products import router as products_router
 from app.routers.reviews import router as reviews_router
 from app.routers.stores import router as stores_router
+from app.storage.static import UploadStaticFiles
 from app.websockets.orders import router as websocket_orders_router
 
 settings = get_settings()
@@ -67,7 +68,15 @@ app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(RequestIDMiddleware)
 
 os.makedirs("uploads", exist_ok=True)
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+app.mount(
+    "/uploads",
+    UploadStaticFiles(
+        directory="uploads",
+        offload=settings.UPLOADS_OFFLOAD,
+        accel_redirect_prefix=settings.UPLOADS_ACCEL_REDIRECT_PREFIX,
+    ),
+    name="uploads",
+)
 
 # Register exception handlers
 register_exception_handlers(app)
@@ -83,5 +92,6 @@ app.include_router(product_images_router)
 app.include_router(cart_router)
 app.include_router(addresses_router)
 app.include_router(orders_router)
+app.include_router(analytics_router)
 app.include_router(websocket_orders_router)
 app.include_router(admin_router)
@@ -26,6 +26,7 @@ class CartItem(BaseModel):
     product_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey("products.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     quantity: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=1)
 
@@ -0,0 +1,33 @@
+import uuid
+from decimal import Decimal
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class CatalogFacetCount(Base):
+    """
+    Number of active products per (category, store, price bucket), kept up to
+    date by ProductRepository so facet counts never scan products.
+    """
+
+    __tablename__ = "catalog_facet_counts"
+    __table_args__ = (
+        sa.CheckConstraint(
+            "product_count >= 0", name="ck_catalog_facet_counts_product_count_gte_0"
+        ),
+    )
+
+    category_id: Mapped[uuid.UUID] = mapped_column(
+        sa.ForeignKey("categories.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    store_id: Mapped[uuid.UUID] = mapped_column(
+        sa.ForeignKey("stores.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Lower bound of the bucket, one of settings.CATALOG_PRICE_BUCKETS.
+    price_bucket: Mapped[Decimal] = mapped_column(sa.Numeric(10, 2), primary_key=True)
+    product_count: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
@@ -0,0 +1,19 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class ImageBlob(BaseModel):
+    """A stored file shared by every product image with the same content."""
+
+    __tablename__ = "image_blobs"
+    __table_args__ = (
+        sa.CheckConstraint("ref_count >= 0", name="ck_image_blobs_ref_count_gte_0"),
+    )
+
+    content_hash: Mapped[str] = mapped_column(sa.String(64), unique=True, nullable=False)
+    storage_key: Mapped[str] = mapped_column(sa.String(500), nullable=False)
+    content_type: Mapped[str] = mapped_column(sa.String(50), nullable=False)
+    size: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    ref_count: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=1)
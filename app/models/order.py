@@ -1,3 +1,4 @@
+import enum
 import uuid
 from decimal import Decimal
 from typing import TYPE_CHECKING
@@ -13,19 +14,49 @@ if TYPE_CHECKING:
     from .user import User
 
 
+class OrderStatus(str, enum.Enum):
+    PENDING = "pending"
+    CONFIRMED = "confirmed"
+    SHIPPED = "shipped"
+    DELIVERED = "delivered"
+    CANCELLED = "cancelled"
+
+
+# Shared by orders.status and order_items.status. Stores the lowercase values
+# (what the columns held as strings), not the member names.
+order_status_enum = sa.Enum(
+    OrderStatus,
+    name="order_status_enum",
+    values_callable=lambda statuses: [status.value for status in statuses],
+)
+# Orders and items still being worked on; most status-filtered reads ask for these.
+OPEN_ORDER_STATUSES_SQL = sa.text("status IN ('pending', 'confirmed')")
+
+
 class Order(BaseModel):
     __tablename__ = "orders"
+    __table_args__ = (
+        # A customer's orders, newest first (backward scan).
+        sa.Index("ix_orders_user_id_created_at", "user_id", "created_at"),
+        sa.Index(
+            "ix_orders_open_user_id_created_at",
+            "user_id",
+            "created_at",
+            postgresql_where=OPEN_ORDER_STATUSES_SQL,
+        ),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     shipping_address_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey("addresses.id", ondelete="RESTRICT"),
         nullable=False,
     )
-    status: Mapped[str] = mapped_column(sa.String(20), nullable=False, default="pending")
+    status: Mapped[OrderStatus] = mapped_column(
+        order_status_enum, nullable=False, default=OrderStatus.PENDING
+    )
     total_amount: Mapped[Decimal] = mapped_column(sa.Numeric(12, 2), nullable=False)
     order_number: Mapped[str] = mapped_column(sa.String(20), nullable=False, unique=True)
 
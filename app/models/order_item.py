@@ -6,15 +6,26 @@ import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
+from .order import OPEN_ORDER_STATUSES_SQL, Order, OrderStatus, order_status_enum
 
 if TYPE_CHECKING:
-    from .order import Order
     from .product import Product
     from .store import Store
 
 
 class OrderItem(BaseModel):
     __tablename__ = "order_items"
+    __table_args__ = (
+        # A vendor's order items, newest first (backward scan).
+        sa.Index("ix_order_items_store_id_created_at", "store_id", "created_at"),
+        # A vendor's fulfilment queue.
+        sa.Index(
+            "ix_order_items_open_store_id_created_at",
+            "store_id",
+            "created_at",
+            postgresql_where=OPEN_ORDER_STATUSES_SQL,
+        ),
+    )
 
     order_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey("orders.id", ondelete="CASCADE"),
@@ -24,16 +35,18 @@ class OrderItem(BaseModel):
     product_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey("products.id", ondelete="RESTRICT"),
         nullable=False,
+        index=True,
     )
     store_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey("stores.id", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
     )
     quantity: Mapped[int] = mapped_column(sa.Integer, nullable=False)
     unit_price: Mapped[Decimal] = mapped_column(sa.Numeric(12, 2), nullable=False)
     subtotal: Mapped[Decimal] = mapped_column(sa.Numeric(12, 2), nullable=False)
-    status: Mapped[str] = mapped_column(sa.String(20), nullable=False, default="pending")
+    status: Mapped[OrderStatus] = mapped_column(
+        order_status_enum, nullable=False, default=OrderStatus.PENDING
+    )
 
     order: Mapped["Order"] = relationship("Order", back_populates="order_items")
     product: Mapped["Product"] = relationship("Product", back_populates="order_items")
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class PlatformStatsSnapshot(Base):
+    """
+    The admin dashboard figures, recomputed in the background by the
+    refresh_platform_stats task so requests never aggregate large tables.
+    A single row.
+    """
+
+    __tablename__ = "platform_stats"
+    __table_args__ = (sa.CheckConstraint("id = 1", name="ck_platform_stats_single_row"),)
+
+    id: Mapped[int] = mapped_column(sa.Integer, primary_key=True, autoincrement=False)
+    # app.schemas.admin.PlatformStats, JSON-encoded.
+    stats: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False)
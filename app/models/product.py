@@ -3,6 +3,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -21,6 +22,13 @@ class Product(BaseModel):
     __table_args__ = (
         sa.CheckConstraint("price > 0", name="ck_products_price_gt_0"),
         sa.CheckConstraint("stock >= 0", name="ck_products_stock_gte_0"),
+        # Category listings filtered by price range and/or sorted by price; the
+        # leading column also serves the categories foreign key.
+        sa.Index(
+            "ix_products_category_id_is_active_price", "category_id", "is_active", "price"
+        ),
+        # Serves sort_by=rating (with review_count as tie-break) and min_rating.
+        sa.Index("ix_products_average_rating_review_count", "average_rating", "review_count"),
     )
 
     name: Mapped[str] = mapped_column(sa.String(255), nullable=False, index=True)
@@ -35,9 +43,47 @@ class Product(BaseModel):
     category_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey("categories.id", ondelete="RESTRICT"),
         nullable=False,
-        index=True,
     )
     is_active: Mapped[bool] = mapped_column(sa.Boolean, nullable=False, default=True)
+    # Denormalized from product_images (see ProductRepository.sync_image_summary)
+    # so listings never have to load the images relation.
+    primary_image_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    primary_image_url: Mapped[str | None] = mapped_column(sa.String(500), nullable=True)
+    primary_image_variants: Mapped[dict[str, dict[str, str]]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        server_default=sa.text("'{}'::jsonb"),
+    )
+    image_count: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
+    # Rating histogram and summary of the product's reviews, updated with each
+    # new review (see ReviewRepository.create_review) so listings can filter
+    # and sort by rating without aggregating reviews.
+    rating_1_count: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_2_count: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_3_count: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_4_count: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_5_count: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
+    review_count: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
+    average_rating: Mapped[Decimal] = mapped_column(
+        sa.Numeric(3, 2), nullable=False, default=0, server_default="0"
+    )
 
     store: Mapped["Store"] = relationship("Store", back_populates="products")
     category: Mapped["Category"] = relationship("Category", back_populates="products")
@@ -2,6 +2,7 @@ import uuid
 from typing import TYPE_CHECKING
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -19,7 +20,18 @@ class ProductImage(BaseModel):
         index=True,
     )
     image_url: Mapped[str] = mapped_column(sa.String(500), nullable=False)
+    content_hash: Mapped[str | None] = mapped_column(
+        sa.String(64), nullable=True, index=True
+    )
+    file_size: Mapped[int | None] = mapped_column(sa.Integer, nullable=True)
     is_primary: Mapped[bool] = mapped_column(sa.Boolean, nullable=False, default=False)
     sort_order: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
+    # Downscaled encodings keyed by width then format, filled in by the worker.
+    variants: Mapped[dict[str, dict[str, str]]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        server_default=sa.text("'{}'::jsonb"),
+    )
 
     product: Mapped["Product"] = relationship("Product", back_populates="images")
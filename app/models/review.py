@@ -16,6 +16,8 @@ class Review(BaseModel):
     __table_args__ = (
         sa.CheckConstraint("rating >= 1 AND rating <= 5", name="ck_reviews_rating_between_1_and_5"),
         sa.UniqueConstraint("user_id", "product_id", name="uq_reviews_user_product"),
+        # Newest-first keyset pagination of a product's reviews.
+        sa.Index("ix_reviews_product_id_created_at_id", "product_id", "created_at", "id"),
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -26,10 +28,12 @@ class Review(BaseModel):
     product_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey("products.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     rating: Mapped[int] = mapped_column(sa.Integer, nullable=False)
     comment: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
+    # Copy of the author's full_name (kept in step by UserRepository.update),
+    # so listing reviews never joins users.
+    reviewer_name: Mapped[str] = mapped_column(sa.String(100), nullable=False)
 
     user: Mapped["User"] = relationship("User", back_populates="reviews")
     product: Mapped["Product"] = relationship("Product", back_populates="reviews")
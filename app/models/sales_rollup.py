@@ -0,0 +1,56 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class StoreSalesDaily(Base):
+    """
+    Units, revenue and distinct orders per store and (UTC) order day, over
+    order items that are not cancelled. Kept up to date by
+    OrderItemRepository as items are placed and cancelled.
+    """
+
+    __tablename__ = "store_sales_daily"
+    __table_args__ = (
+        sa.CheckConstraint("units >= 0", name="ck_store_sales_daily_units_gte_0"),
+        sa.CheckConstraint("order_count >= 0", name="ck_store_sales_daily_order_count_gte_0"),
+    )
+
+    store_id: Mapped[uuid.UUID] = mapped_column(
+        sa.ForeignKey("stores.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(sa.Date, primary_key=True)
+    units: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
+    revenue: Mapped[Decimal] = mapped_column(sa.Numeric(14, 2), nullable=False, default=0)
+    order_count: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
+
+
+class ProductSalesDaily(Base):
+    """The same figures as StoreSalesDaily, per product of the store."""
+
+    __tablename__ = "product_sales_daily"
+    __table_args__ = (
+        sa.CheckConstraint("units >= 0", name="ck_product_sales_daily_units_gte_0"),
+        sa.CheckConstraint(
+            "order_count >= 0", name="ck_product_sales_daily_order_count_gte_0"
+        ),
+    )
+
+    store_id: Mapped[uuid.UUID] = mapped_column(
+        sa.ForeignKey("stores.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(sa.Date, primary_key=True)
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        sa.ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    units: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
+    revenue: Mapped[Decimal] = mapped_column(sa.Numeric(14, 2), nullable=False, default=0)
+    order_count: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
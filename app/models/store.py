@@ -1,7 +1,14 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -14,11 +21,15 @@ if TYPE_CHECKING:
 
 class Store(BaseModel):
     __tablename__ = "stores"
-    __table_args__ = (UniqueConstraint("owner_id", name="uq_stores_owner_id"),)
+    __table_args__ = (
+        UniqueConstraint("owner_id", name="uq_stores_owner_id"),
+        CheckConstraint("product_count >= 0", name="ck_stores_product_count_gte_0"),
+    )
 
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     description: Mapped[str | None] = mapped_column(String(500), nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    # Active products; maintained by ProductRepository, never client input.
     product_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     owner_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -0,0 +1,31 @@
+import uuid
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class VerifiedPurchase(Base):
+    """
+    A user received at least one order item of the product, which makes
+    them eligible to review it. Written by OrderItemRepository when an item
+    is marked delivered; delivered is final, so rows are never removed.
+    """
+
+    __tablename__ = "verified_purchases"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        sa.ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    product_id: Mapped[uuid.UUID] = mapped_column(
+        sa.ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    first_delivered_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        server_default=sa.func.now(),
+        nullable=False,
+    )
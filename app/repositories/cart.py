@@ -1,60 +1,283 @@
 import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
-from sqlalchemy import delete, select
+import sqlalchemy as sa
+from sqlalchemy import RowMapping, Select, and_, delete, func, select, update, values
+from sqlalchemy.dialects.postgresql import UUID, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from app.models.cart_item import CartItem
 from app.models.product import Product
 
 
-class CartRepository:
+@dataclass(frozen=True)
+class CartLineState:
+    """Why a cart write was skipped: the product and any existing line."""
+
+    product_id: uuid.UUID
+    product_exists: bool
+    is_active: bool
+    stock: int
+    cart_quantity: int | None
+
+
+def select_cart_lines(quantity: sa.ColumnElement[int]) -> Select:
+    """
+    Columns for one cart line per product, named after CartItemResponse
+    fields, plus stock/is_active for availability. The image is the
+    product's denormalized primary_image_url, so product_images is not read.
+    Callers join in the source of `quantity` and filter/order.
+    """
+    return select(
+        Product.id.label("product_id"),
+        Product.name.label("product_name"),
+        Product.price.label("product_price"),
+        Product.primary_image_url.label("product_image"),
+        quantity.label("quantity"),
+        Product.stock,
+        Product.is_active,
+    ).select_from(Product)
+
+
+class CartStore(ABC):
+    """
+    What CartService and OrderService need from a cart backend: the
+    PostgreSQL-backed CartRepository or the Redis-resident
+    RedisCartRepository (CART_BACKEND).
+    """
+
+    @abstractmethod
+    async def get_cart_items(self, user_id: uuid.UUID) -> list[CartItem]:
+        ...
+
+    @abstractmethod
+    async def get_cart_lines(self, user_id: uuid.UUID) -> list[RowMapping]:
+        ...
+
+    @abstractmethod
+    async def upsert_cart_items(
+        self,
+        user_id: uuid.UUID,
+        lines: dict[uuid.UUID, int],
+        replace: bool = False,
+    ) -> set[uuid.UUID]:
+        """Returns the product ids that were written."""
+
+    @abstractmethod
+    async def set_cart_item_quantity(
+        self,
+        user_id: uuid.UUID,
+        product_id: uuid.UUID,
+        quantity: int,
+    ) -> bool:
+        ...
+
+    @abstractmethod
+    async def delete_cart_item(self, user_id: uuid.UUID, product_id: uuid.UUID) -> bool:
+        ...
+
+    @abstractmethod
+    async def clear_cart(self, user_id: uuid.UUID, commit: bool = True) -> None:
+        ...
+
+    @abstractmethod
+    async def clear_cached_cart(self, user_id: uuid.UUID) -> None:
+        """Drop any copy kept outside PostgreSQL, once checkout has committed."""
+
+    @abstractmethod
+    async def get_line_states(
+        self,
+        user_id: uuid.UUID,
+        product_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, CartLineState]:
+        ...
+
+
+class CartRepository(CartStore):
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_cart_items(self, user_id: uuid.UUID) -> list[CartItem]:
         result = await self.db.execute(
             select(CartItem)
-            .options(joinedload(CartItem.product).joinedload(Product.images))
             .where(CartItem.user_id == user_id)
             .order_by(CartItem.created_at.asc())
         )
-        return list(result.unique().scalars().all())
+        return list(result.scalars().all())
+
+    async def get_cart_lines(self, user_id: uuid.UUID) -> list[RowMapping]:
+        result = await self.db.execute(
+            select_cart_lines(CartItem.quantity)
+            .join(CartItem, CartItem.product_id == Product.id)
+            .where(CartItem.user_id == user_id)
+            .order_by(CartItem.created_at.asc())
+        )
+        return list(result.mappings())
 
-    async def get_cart_item(
+    async def upsert_cart_items(
         self,
         user_id: uuid.UUID,
-        product_id: uuid.UUID,
-    ) -> CartItem | None:
-        result = await self.db.execute(
-            select(CartItem)
-            .options(joinedload(CartItem.product).joinedload(Product.images))
-            .where(CartItem.user_id == user_id, CartItem.product_id == product_id)
+        lines: dict[uuid.UUID, int],
+        replace: bool = False,
+    ) -> set[uuid.UUID]:
+        """
+        Add `lines` (product_id -> quantity) to the cart in one statement, or
+        set those quantities when `replace` is true.
+
+        Lines for missing or inactive products, or whose resulting quantity
+        would exceed stock, are skipped. The stock check on existing lines
+        runs against the locked row, so concurrent adds cannot overshoot.
+        Returns the product ids that were written.
+        """
+        requested = values(
+            sa.column("product_id", UUID(as_uuid=True)),
+            sa.column("quantity", sa.Integer),
+            name="requested",
+        ).data(list(lines.items()))
+        source = (
+            select(
+                func.gen_random_uuid(),
+                sa.literal(user_id, UUID(as_uuid=True)),
+                Product.id,
+                requested.c.quantity,
+            )
+            .join(requested, requested.c.product_id == Product.id)
+            .where(Product.is_active.is_(True), Product.stock >= requested.c.quantity)
         )
-        return result.unique().scalar_one_or_none()
 
-    async def create_cart_item(
+        statement = insert(CartItem).from_select(
+            ["id", "user_id", "product_id", "quantity"],
+            source,
+        )
+        target_quantity = (
+            statement.excluded.quantity
+            if replace
+            else CartItem.quantity + statement.excluded.quantity
+        )
+        statement = statement.on_conflict_do_update(
+            constraint="uq_cart_items_user_product",
+            set_={"quantity": target_quantity, "updated_at": func.now()},
+            where=target_quantity
+            <= select(Product.stock)
+            .where(Product.id == statement.excluded.product_id)
+            .scalar_subquery(),
+        ).returning(CartItem.product_id)
+
+        result = await self.db.execute(statement)
+        written = set(result.scalars().all())
+        await self.db.commit()
+        return written
+
+    async def set_cart_item_quantity(
         self,
         user_id: uuid.UUID,
         product_id: uuid.UUID,
         quantity: int,
-    ) -> CartItem:
-        cart_item = CartItem(user_id=user_id, product_id=product_id, quantity=quantity)
-        self.db.add(cart_item)
-        await self.db.commit()
-        await self.db.refresh(cart_item)
-        return cart_item
-
-    async def update_cart_item_quantity(self, cart_item: CartItem, quantity: int) -> CartItem:
-        cart_item.quantity = quantity
+    ) -> bool:
+        """Set an existing line's quantity if stock allows; True if updated."""
+        result = await self.db.execute(
+            update(CartItem)
+            .where(
+                CartItem.user_id == user_id,
+                CartItem.product_id == product_id,
+                CartItem.product_id == Product.id,
+                Product.stock >= quantity,
+            )
+            .values(quantity=quantity)
+            .returning(CartItem.id)
+        )
+        updated = result.scalar_one_or_none() is not None
         await self.db.commit()
-        await self.db.refresh(cart_item)
-        return cart_item
+        return updated
 
-    async def delete_cart_item(self, cart_item: CartItem) -> None:
-        await self.db.delete(cart_item)
+    async def delete_cart_item(self, user_id: uuid.UUID, product_id: uuid.UUID) -> bool:
+        result = await self.db.execute(
+            delete(CartItem)
+            .where(CartItem.user_id == user_id, CartItem.product_id == product_id)
+            .returning(CartItem.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await self.db.commit()
+        return deleted
 
-    async def clear_cart(self, user_id: uuid.UUID) -> None:
+    async def clear_cart(self, user_id: uuid.UUID, commit: bool = True) -> None:
         await self.db.execute(delete(CartItem).where(CartItem.user_id == user_id))
+        if commit:
+            await self.db.commit()
+
+    async def clear_cached_cart(self, user_id: uuid.UUID) -> None:
+        """Nothing is cached outside PostgreSQL; see RedisCartRepository."""
+
+    async def sync_cart(self, user_id: uuid.UUID, lines: dict[uuid.UUID, int]) -> None:
+        """
+        Make the stored cart match `lines` exactly, without stock checks (used
+        to write back carts that were validated elsewhere). Lines for products
+        that no longer exist are dropped.
+        """
+        await self.db.execute(
+            delete(CartItem).where(
+                CartItem.user_id == user_id,
+                CartItem.product_id.not_in(list(lines)),
+            )
+        )
+        if lines:
+            requested = values(
+                sa.column("product_id", UUID(as_uuid=True)),
+                sa.column("quantity", sa.Integer),
+                name="requested",
+            ).data(list(lines.items()))
+            statement = insert(CartItem).from_select(
+                ["id", "user_id", "product_id", "quantity"],
+                select(
+                    func.gen_random_uuid(),
+                    sa.literal(user_id, UUID(as_uuid=True)),
+                    Product.id,
+                    requested.c.quantity,
+                ).join(requested, requested.c.product_id == Product.id),
+            )
+            statement = statement.on_conflict_do_update(
+                constraint="uq_cart_items_user_product",
+                set_={"quantity": statement.excluded.quantity, "updated_at": func.now()},
+                where=CartItem.quantity != statement.excluded.quantity,
+            )
+            await self.db.execute(statement)
         await self.db.commit()
+
+    async def get_line_states(
+        self,
+        user_id: uuid.UUID,
+        product_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, CartLineState]:
+        """Product and cart state for lines a write skipped, to explain why."""
+        result = await self.db.execute(
+            select(Product.id, Product.is_active, Product.stock, CartItem.quantity)
+            .outerjoin(
+                CartItem,
+                and_(CartItem.product_id == Product.id, CartItem.user_id == user_id),
+            )
+            .where(Product.id.in_(product_ids))
+        )
+        found = {
+            row.id: CartLineState(
+                product_id=row.id,
+                product_exists=True,
+                is_active=row.is_active,
+                stock=row.stock,
+                cart_quantity=row.quantity,
+            )
+            for row in result
+        }
+        return {
+            product_id: found.get(
+                product_id,
+                CartLineState(
+                    product_id=product_id,
+                    product_exists=False,
+                    is_active=False,
+                    stock=0,
+                    cart_quantity=None,
+                ),
+            )
+            for product_id in product_ids
+        }
@@ -1,6 +1,9 @@
 import uuid
+from collections.abc import Iterable
 
-from sqlalchemy import select
+import sqlalchemy as sa
+from sqlalchemy import and_, func, or_, select, values
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.category import Category
@@ -31,6 +34,59 @@ class CategoryRepository:
         result = await self.db.execute(select(Category).where(Category.slug == slug))
         return result.scalar_one_or_none()
 
+    async def get_slug_usage(
+        self,
+        bases: Iterable[str],
+        exclude_category_id: uuid.UUID | None = None,
+    ) -> dict[str, tuple[bool, int]]:
+        """
+        For each base slug, in one query: whether the bare slug is taken and
+        the highest numeric suffix in use (`<base>-<n>`). Bases with no match
+        are omitted.
+        """
+        requested = values(sa.column("base", sa.String), name="requested").data(
+            [(base,) for base in set(bases)]
+        )
+        base = requested.c.base
+        suffixed = and_(
+            Category.slug.like(base + "-%"),
+            Category.slug.regexp_match(func.concat("^", base, "-[0-9]{1,9}$")),
+        )
+        suffix = sa.case(
+            (suffixed, sa.cast(func.substr(Category.slug, func.length(base) + 2), sa.Integer)),
+            else_=0,
+        )
+        query = (
+            select(base, func.bool_or(Category.slug == base), func.max(suffix))
+            .select_from(requested)
+            .join(Category, or_(Category.slug == base, suffixed))
+            .group_by(base)
+        )
+        if exclude_category_id is not None:
+            query = query.where(Category.id != exclude_category_id)
+
+        result = await self.db.execute(query)
+        return {row[0]: (row[1], row[2]) for row in result}
+
+    async def get_existing_names(self, names: Iterable[str]) -> set[str]:
+        result = await self.db.execute(
+            select(Category.name).where(Category.name.in_(list(names)))
+        )
+        return set(result.scalars().all())
+
+    async def create_many(self, rows: list[dict]) -> list[Category]:
+        """
+        Insert `rows` in one statement, skipping any that hit a unique name
+        or slug (e.g. a concurrent insert). Returns the categories created.
+        """
+        result = await self.db.scalars(
+            insert(Category).on_conflict_do_nothing().returning(Category),
+            rows,
+        )
+        created = list(result.all())
+        await self.db.commit()
+        return created
+
     async def list_active(self) -> list[Category]:
         result = await self.db.execute(
             select(Category)
@@ -0,0 +1,141 @@
+import logging
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.category import Category
+
+logger = logging.getLogger(__name__)
+
+CATEGORY_VERSION_KEY = "categories:version"
+# Safety net for a version bump that never reached Redis.
+MAX_SNAPSHOT_AGE_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class CachedCategory:
+    """Detached copy of a categories row, safe to share across sessions."""
+
+    id: uuid.UUID
+    name: str
+    slug: str
+    description: str | None
+    is_active: bool
+
+
+@dataclass
+class _CategorySnapshot:
+    version: str | None = None
+    loaded_at: float = 0.0
+    by_id: dict[uuid.UUID, CachedCategory] = field(default_factory=dict)
+    by_slug: dict[str, CachedCategory] = field(default_factory=dict)
+    active: list[CachedCategory] = field(default_factory=list)
+
+
+# One per process; replaced wholesale on reload, never mutated in place.
+_snapshot = _CategorySnapshot()
+
+
+def reset_category_cache() -> None:
+    global _snapshot
+    _snapshot = _CategorySnapshot()
+
+
+class CachedCategoryRepository:
+    """
+    Read-only category lookups served from a process-local snapshot of the
+    whole (small, rarely changing) categories table.
+
+    Each read costs one Redis GET of a version counter; the snapshot is
+    reloaded with a single query when the counter moved since it was taken.
+    Writers call `bump_version` after committing. Without Redis, reads go to
+    PostgreSQL.
+    """
+
+    def __init__(self, db: AsyncSession, redis: Redis):
+        self.db = db
+        self.redis = redis
+
+    async def _current_version(self) -> str:
+        version = await self.redis.get(CATEGORY_VERSION_KEY)
+        if version is None:
+            # Seed a missing counter (e.g. Redis was flushed) with a value no
+            # process can have cached, then keep INCR-ing from there.
+            await self.redis.set(CATEGORY_VERSION_KEY, time.time_ns(), nx=True)
+            version = await self.redis.get(CATEGORY_VERSION_KEY)
+        return version
+
+    async def _load(self) -> _CategorySnapshot:
+        result = await self.db.execute(select(Category).order_by(Category.name.asc()))
+        categories = [
+            CachedCategory(
+                id=category.id,
+                name=category.name,
+                slug=category.slug,
+                description=category.description,
+                is_active=category.is_active,
+            )
+            for category in result.scalars()
+        ]
+        return _CategorySnapshot(
+            loaded_at=time.monotonic(),
+            by_id={category.id: category for category in categories},
+            by_slug={category.slug: category for category in categories},
+            active=[category for category in categories if category.is_active],
+        )
+
+    async def _get_snapshot(self) -> _CategorySnapshot:
+        global _snapshot
+        try:
+            version = await self._current_version()
+        except RedisError:
+            logger.warning("Category cache version unavailable; reading from database")
+            return await self._load()
+
+        snapshot = _snapshot
+        if (
+            snapshot.version == version
+            and time.monotonic() - snapshot.loaded_at < MAX_SNAPSHOT_AGE_SECONDS
+        ):
+            return snapshot
+
+        # Tagged with the version read before loading: a bump that lands
+        # while loading makes the next read reload again.
+        snapshot = await self._load()
+        snapshot.version = version
+        _snapshot = snapshot
+        return snapshot
+
+    async def get_by_id(self, category_id: uuid.UUID) -> CachedCategory | None:
+        return (await self._get_snapshot()).by_id.get(category_id)
+
+    async def get_many(
+        self, category_ids: Iterable[uuid.UUID]
+    ) -> dict[uuid.UUID, CachedCategory]:
+        """The categories among `category_ids` that exist, from one snapshot."""
+        by_id = (await self._get_snapshot()).by_id
+        return {
+            category_id: by_id[category_id]
+            for category_id in category_ids
+            if category_id in by_id
+        }
+
+    async def get_by_slug(self, slug: str) -> CachedCategory | None:
+        return (await self._get_snapshot()).by_slug.get(slug)
+
+    async def list_active(self) -> list[CachedCategory]:
+        return list((await self._get_snapshot()).active)
+
+    async def bump_version(self) -> None:
+        """Invalidate every process's snapshot; call after committing a change."""
+        reset_category_cache()
+        try:
+            await self.redis.incr(CATEGORY_VERSION_KEY)
+        except RedisError:
+            logger.exception("Failed to bump category cache version")
@@ -0,0 +1,66 @@
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.image_blob import ImageBlob
+
+
+class ImageBlobRepository:
+    """
+    Reference counts for content-addressed blobs.
+
+    Neither method commits: the count must change in the same transaction as
+    the product_images row that holds (or drops) the reference.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def acquire(
+        self,
+        content_hash: str,
+        storage_key: str,
+        content_type: str,
+        size: int,
+    ) -> bool:
+        """Add a reference; returns True if this created the blob."""
+        statement = insert(ImageBlob).values(
+            content_hash=content_hash,
+            storage_key=storage_key,
+            content_type=content_type,
+            size=size,
+            ref_count=1,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[ImageBlob.content_hash],
+            set_={"ref_count": ImageBlob.ref_count + 1},
+        ).returning(ImageBlob.ref_count)
+        result = await self.db.execute(statement)
+        return result.scalar_one() == 1
+
+    async def release(self, content_hash: str) -> int | None:
+        """
+        Drop a reference and return how many remain, or None if there is no
+        blob row (images uploaded before content addressing). A row left at
+        zero is removed by `purge_unreferenced` once this transaction commits.
+        """
+        result = await self.db.execute(
+            update(ImageBlob)
+            .where(ImageBlob.content_hash == content_hash)
+            .values(ref_count=ImageBlob.ref_count - 1)
+            .returning(ImageBlob.ref_count)
+        )
+        return result.scalar_one_or_none()
+
+    async def purge_unreferenced(self, content_hash: str) -> bool:
+        """
+        Delete the blob row if it still has no references; returns True if it
+        did. Its lock is held until commit, so a concurrent `acquire` of the
+        same content waits: remove the stored files before committing.
+        """
+        result = await self.db.execute(
+            delete(ImageBlob)
+            .where(ImageBlob.content_hash == content_hash, ImageBlob.ref_count == 0)
+            .returning(ImageBlob.id)
+        )
+        return result.scalar_one_or_none() is not None
@@ -1,11 +1,18 @@
 import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import RowMapping, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from app.models.order import Order
+from app.models.address import Address
+from app.models.order import Order, OrderStatus
 from app.models.order_item import OrderItem
+from app.models.product import Product
+from app.models.user import User
+from app.repositories.sales import SalesRollupRepository
+from app.repositories.verified_purchase import VerifiedPurchaseRepository
 
 
 class OrderRepository:
@@ -22,7 +29,7 @@ class OrderRepository:
         order = Order(
             user_id=user_id,
             shipping_address_id=shipping_address_id,
-            status="pending",
+            status=OrderStatus.PENDING,
             total_amount=total_amount,
             order_number=order_number,
         )
@@ -36,7 +43,7 @@ class OrderRepository:
         user_id: uuid.UUID,
         page: int,
         size: int,
-        status: str | None = None,
+        status: OrderStatus | None = None,
     ) -> tuple[list[Order], int]:
         filters = [Order.user_id == user_id]
         if status:
@@ -73,7 +80,7 @@ class OrderRepository:
         )
         return result.scalar_one_or_none()
 
-    async def update_order_status(self, order: Order, status: str) -> Order:
+    async def update_order_status(self, order: Order, status: OrderStatus) -> Order:
         order.status = status
         await self.db.flush()
         return order
@@ -82,11 +89,14 @@ class OrderRepository:
 class OrderItemRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.sales_repo = SalesRollupRepository(db)
+        self.purchase_repo = VerifiedPurchaseRepository(db)
 
     async def create_order_items(self, items: list[dict]) -> list[OrderItem]:
         order_items = [OrderItem(**item) for item in items]
         self.db.add_all(order_items)
         await self.db.flush()
+        await self.sales_repo.record([item.id for item in order_items])
         return order_items
 
     async def get_vendor_order_items(
@@ -113,8 +123,66 @@ class OrderItemRepository:
         )
         return list(result.unique().scalars().all()), total
 
-    async def get_order_item_by_id(self, order_item_id: uuid.UUID) -> OrderItem | None:
-        result = await self.db.execute(
+    async def stream_vendor_order_items(
+        self,
+        store_id: uuid.UUID,
+        status: OrderStatus | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[RowMapping]:
+        """
+        A store's order items with what fulfillment needs (order number,
+        customer, product, shipping address), oldest first, as plain rows
+        read through a server-side cursor `batch_size` at a time.
+        `created_from` is inclusive, `created_to` exclusive.
+        """
+        query = (
+            select(
+                OrderItem.id.label("order_item_id"),
+                Order.order_number,
+                OrderItem.status.label("item_status"),
+                OrderItem.created_at,
+                User.full_name.label("customer_name"),
+                OrderItem.product_id,
+                Product.name.label("product_name"),
+                OrderItem.quantity,
+                OrderItem.unit_price,
+                OrderItem.subtotal,
+                Address.address_line_1,
+                Address.address_line_2,
+                Address.city,
+                Address.state,
+                Address.postal_code,
+                Address.country,
+            )
+            .join(Order, Order.id == OrderItem.order_id)
+            .join(User, User.id == Order.user_id)
+            .join(Product, Product.id == OrderItem.product_id)
+            .join(Address, Address.id == Order.shipping_address_id)
+            .where(OrderItem.store_id == store_id)
+        )
+        if status is not None:
+            query = query.where(OrderItem.status == status)
+        if created_from is not None:
+            query = query.where(OrderItem.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(OrderItem.created_at < created_to)
+
+        result = await self.db.stream(
+            query.order_by(OrderItem.created_at.asc(), OrderItem.id.asc()).execution_options(
+                yield_per=batch_size
+            )
+        )
+        async for row in result.mappings():
+            yield row
+
+    async def get_order_item_by_id(
+        self,
+        order_item_id: uuid.UUID,
+        for_update: bool = False,
+    ) -> OrderItem | None:
+        query = (
             select(OrderItem)
             .options(
                 joinedload(OrderItem.order).joinedload(Order.user),
@@ -122,6 +190,33 @@ class OrderItemRepository:
             )
             .where(OrderItem.id == order_item_id)
         )
+        if for_update:
+            # Serializes status changes of the store's items of this order (in
+            # id order, so concurrent callers cannot deadlock): a cancellation
+            # decides from its siblings' statuses whether the store's order
+            # still counts, and each transition is applied to the current
+            # status once.
+            scope = (
+                select(OrderItem.order_id, OrderItem.store_id)
+                .where(OrderItem.id == order_item_id)
+                .subquery()
+            )
+            await self.db.execute(
+                select(OrderItem.id)
+                .join(
+                    scope,
+                    and_(
+                        OrderItem.order_id == scope.c.order_id,
+                        OrderItem.store_id == scope.c.store_id,
+                    ),
+                )
+                .order_by(OrderItem.id)
+                .with_for_update(of=OrderItem)
+            )
+            query = query.with_for_update(of=OrderItem).execution_options(
+                populate_existing=True
+            )
+        result = await self.db.execute(query)
         return result.unique().scalar_one_or_none()
 
     async def get_order_items_by_order_id(self, order_id: uuid.UUID) -> list[OrderItem]:
@@ -130,7 +225,14 @@ class OrderItemRepository:
         )
         return list(result.scalars().all())
 
-    async def update_item_status(self, order_item: OrderItem, status: str) -> OrderItem:
+    async def update_item_status(
+        self, order_item: OrderItem, status: OrderStatus
+    ) -> OrderItem:
+        was_cancelled = order_item.status == OrderStatus.CANCELLED
         order_item.status = status
         await self.db.flush()
+        if status == OrderStatus.CANCELLED and not was_cancelled:
+            await self.sales_repo.record([order_item.id], sign=-1)
+        elif status == OrderStatus.DELIVERED:
+            await self.purchase_repo.record([order_item.id])
         return order_item
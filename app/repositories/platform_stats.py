@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.order import Order
+from app.models.platform_stats import PlatformStatsSnapshot
+from app.models.product import Product
+from app.models.sales_rollup import ProductSalesDaily, StoreSalesDaily
+from app.models.store import Store
+from app.models.user import User
+
+SNAPSHOT_ID = 1
+TOP_PRODUCTS_LIMIT = 10
+
+
+class PlatformStatsRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def compute(self, now: datetime | None = None) -> dict[str, Any]:
+        """
+        Aggregate the platform-wide dashboard figures. Sales come from the
+        daily rollups; order, store and user counts scan their tables, so run
+        this from the background task only (ideally against a replica).
+        """
+        now = now or datetime.now(timezone.utc)
+        month_start = (now - timedelta(days=29)).date()
+
+        gmv_result = await self.db.execute(
+            select(
+                func.coalesce(func.sum(StoreSalesDaily.revenue), 0),
+                func.coalesce(
+                    func.sum(StoreSalesDaily.revenue).filter(
+                        StoreSalesDaily.day >= month_start
+                    ),
+                    0,
+                ),
+            )
+        )
+        gmv, gmv_last_30d = gmv_result.one()
+
+        status_result = await self.db.execute(
+            select(Order.status, func.count()).group_by(Order.status)
+        )
+
+        stores_result = await self.db.execute(
+            select(func.count().filter(Store.is_active.is_(True)), func.count()).select_from(
+                Store
+            )
+        )
+        active_stores, total_stores = stores_result.one()
+
+        users_result = await self.db.execute(
+            select(
+                *(
+                    func.count().filter(User.created_at >= now - period)
+                    for period in (timedelta(days=1), timedelta(days=7), timedelta(days=30))
+                )
+            ).where(User.created_at >= now - timedelta(days=30))
+        )
+        last_24h, last_7d, last_30d = users_result.one()
+
+        revenue = func.sum(ProductSalesDaily.revenue)
+        top_result = await self.db.execute(
+            select(
+                Product.id.label("product_id"),
+                Product.name.label("product_name"),
+                Store.name.label("store_name"),
+                func.sum(ProductSalesDaily.units).label("units"),
+                revenue.label("revenue"),
+            )
+            .join(Product, Product.id == ProductSalesDaily.product_id)
+            .join(Store, Store.id == ProductSalesDaily.store_id)
+            .where(ProductSalesDaily.day >= month_start)
+            .group_by(Product.id, Product.name, Store.name)
+            .having(func.sum(ProductSalesDaily.units) > 0)
+            .order_by(revenue.desc(), Product.name)
+            .limit(TOP_PRODUCTS_LIMIT)
+        )
+
+        return {
+            "gmv": gmv,
+            "gmv_last_30d": gmv_last_30d,
+            "orders_by_status": {status.value: count for status, count in status_result},
+            "active_stores": active_stores,
+            "total_stores": total_stores,
+            "new_users": {"last_24h": last_24h, "last_7d": last_7d, "last_30d": last_30d},
+            "top_products_last_30d": [dict(row) for row in top_result.mappings()],
+        }
+
+    async def save(self, stats: dict[str, Any], computed_at: datetime) -> None:
+        """Replace the snapshot with JSON-encoded `stats`. Commits."""
+        statement = insert(PlatformStatsSnapshot).values(
+            id=SNAPSHOT_ID, stats=stats, computed_at=computed_at
+        )
+        await self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["id"],
+                set_={
+                    "stats": statement.excluded.stats,
+                    "computed_at": statement.excluded.computed_at,
+                },
+            )
+        )
+        await self.db.commit()
+
+    async def get_snapshot(self) -> PlatformStatsSnapshot | None:
+        return await self.db.get(PlatformStatsSnapshot, SNAPSHOT_ID)
@@ -1,24 +1,157 @@
 import uuid
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable, Sequence
 from decimal import Decimal
 
-from sqlalchemy import func, or_, select
+import sqlalchemy as sa
+from sqlalchemy import RowMapping, delete, func, or_, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.config import get_settings
+from app.models.catalog_facet import CatalogFacetCount
+from app.models.category import Category
 from app.models.product import Product
+from app.models.product_image import ProductImage
+from app.models.store import Store
+
+# (category_id, store_id, price_bucket): one catalog_facet_counts row.
+FacetKey = tuple[uuid.UUID, uuid.UUID, Decimal]
+FACET_FIELDS = ("category_id", "store_id", "price", "is_active")
+# Bounds of products.stock (integer) and products.price (numeric(10, 2)).
+MAX_STOCK = 2**31 - 1
+MAX_PRICE = Decimal("99999999.99")
 
 
 class ProductRepository:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, price_buckets: Sequence[Decimal] | None = None):
         self.db = db
+        if price_buckets is None:
+            price_buckets = get_settings().CATALOG_PRICE_BUCKETS
+        self.price_buckets = sorted(
+            Decimal(bound).quantize(Decimal("0.01")) for bound in price_buckets
+        )
+
+    def price_bucket(self, price: Decimal) -> Decimal:
+        """Lower bound of the bucket `price` falls in."""
+        return self.price_buckets[max(bisect_right(self.price_buckets, price) - 1, 0)]
+
+    def _price_bucket_expression(self) -> sa.ColumnElement[Decimal]:
+        bucket = sa.case(
+            *(
+                (Product.price >= bound, sa.literal(bound))
+                for bound in reversed(self.price_buckets[1:])
+            ),
+            else_=sa.literal(self.price_buckets[0]),
+        )
+        return sa.cast(bucket, sa.Numeric(10, 2))
+
+    def _facet_key(
+        self,
+        category_id: uuid.UUID,
+        store_id: uuid.UUID,
+        price: Decimal,
+        is_active: bool,
+    ) -> FacetKey | None:
+        if not is_active:
+            return None
+        return category_id, store_id, self.price_bucket(price)
+
+    async def _move_listings(
+        self, moves: Iterable[tuple[FacetKey | None, FacetKey | None]]
+    ) -> None:
+        """
+        Keep facet counts and Store.product_count in step with products
+        moving from listing `old` to `new` (None when inactive). Does not commit.
+        """
+        facet_deltas: Counter[FacetKey] = Counter()
+        store_deltas: Counter[uuid.UUID] = Counter()
+        for old, new in moves:
+            if old == new:
+                continue
+            if old is not None:
+                facet_deltas[old] -= 1
+                store_deltas[old[1]] -= 1
+            if new is not None:
+                facet_deltas[new] += 1
+                store_deltas[new[1]] += 1
+
+        # Single-statement increments, in sorted order so concurrent writers
+        # queue on the same rows in the same order instead of deadlocking.
+        for (category_id, store_id, price_bucket), delta in sorted(facet_deltas.items()):
+            if not delta:
+                continue
+            statement = insert(CatalogFacetCount).values(
+                category_id=category_id,
+                store_id=store_id,
+                price_bucket=price_bucket,
+                product_count=max(delta, 0),
+            )
+            await self.db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["category_id", "store_id", "price_bucket"],
+                    set_={
+                        "product_count": func.greatest(
+                            CatalogFacetCount.product_count + delta, 0
+                        )
+                    },
+                )
+            )
+        for store_id, delta in sorted(store_deltas.items()):
+            if not delta:
+                continue
+            await self.db.execute(
+                update(Store)
+                .where(Store.id == store_id)
+                .values(product_count=func.greatest(Store.product_count + delta, 0))
+            )
 
     async def create(self, data: dict) -> Product:
         product = Product(**data)
         self.db.add(product)
+        await self._move_listings(
+            [
+                (
+                    None,
+                    self._facet_key(
+                        product.category_id,
+                        product.store_id,
+                        product.price,
+                        data.get("is_active", True),
+                    ),
+                )
+            ]
+        )
         await self.db.commit()
         await self.db.refresh(product)
         return product
 
+    async def create_many(self, rows: list[dict]) -> int:
+        """
+        Insert `rows` with one multi-row INSERT and move their facet and
+        store counts, in one transaction. Returns the number inserted.
+        """
+        if not rows:
+            return 0
+        await self.db.execute(insert(Product), rows)
+        await self._move_listings(
+            (
+                None,
+                self._facet_key(
+                    row["category_id"],
+                    row["store_id"],
+                    row["price"],
+                    row.get("is_active", True),
+                ),
+            )
+            for row in rows
+        )
+        await self.db.commit()
+        return len(rows)
+
     async def get_by_id(
         self,
         product_id: uuid.UUID,
@@ -39,19 +172,16 @@ class ProductRepository:
         result = await self.db.execute(query)
         return result.unique().scalar_one_or_none()
 
-    async def list(
+    def _build_filters(
         self,
-        page: int,
-        size: int,
         category_id: uuid.UUID | None = None,
         store_id: uuid.UUID | None = None,
         min_price: Decimal | None = None,
         max_price: Decimal | None = None,
         search: str | None = None,
-        sort_by: str = "created_at",
-        sort_order: str = "desc",
         include_inactive: bool = False,
-    ) -> tuple[list[Product], int]:
+        min_rating: Decimal | None = None,
+    ) -> list[sa.ColumnElement[bool]]:
         filters = []
 
         if not include_inactive:
@@ -69,6 +199,9 @@ class ProductRepository:
         if max_price is not None:
             filters.append(Product.price <= max_price)
 
+        if min_rating is not None:
+            filters.append(Product.average_rating >= min_rating)
+
         if search:
             term = f"%{search.strip()}%"
             filters.append(
@@ -78,37 +211,411 @@ class ProductRepository:
                 )
             )
 
+        return filters
+
+    def _sort_expressions(self, sort_by: str, sort_order: str) -> list[sa.ColumnElement]:
+        sort_fields = {
+            "price": [Product.price],
+            "created_at": [Product.created_at],
+            "name": [Product.name],
+            # Among equal averages, more reviews first.
+            "rating": [Product.average_rating, Product.review_count],
+        }
+        sort_columns = sort_fields.get(sort_by, [Product.created_at])
+        if sort_order.lower() == "asc":
+            return [column.asc() for column in sort_columns]
+        return [column.desc() for column in sort_columns]
+
+    async def _count(self, filters: list[sa.ColumnElement[bool]]) -> int:
         total_query = select(func.count(Product.id))
         if filters:
             total_query = total_query.where(*filters)
         total_result = await self.db.execute(total_query)
-        total = total_result.scalar_one()
+        return total_result.scalar_one()
+
+    async def list(
+        self,
+        page: int,
+        size: int,
+        category_id: uuid.UUID | None = None,
+        store_id: uuid.UUID | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        search: str | None = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        include_inactive: bool = False,
+        min_rating: Decimal | None = None,
+    ) -> tuple[list[Product], int]:
+        filters = self._build_filters(
+            category_id, store_id, min_price, max_price, search, include_inactive, min_rating
+        )
+        total = await self._count(filters)
 
+        # Only many-to-one joins here: joining images would repeat every
+        # product row once per image under the LIMIT. Listings use the
+        # denormalized primary_image_* columns instead.
         query = select(Product).options(
             joinedload(Product.store),
             joinedload(Product.category),
-            joinedload(Product.images),
         )
         if filters:
             query = query.where(*filters)
 
-        sort_fields = {
-            "price": Product.price,
-            "created_at": Product.created_at,
-            "name": Product.name,
-        }
-        sort_column = sort_fields.get(sort_by, Product.created_at)
-        sort_expr = (
-            sort_column.asc() if sort_order.lower() == "asc" else sort_column.desc()
+        query = (
+            query.order_by(*self._sort_expressions(sort_by, sort_order))
+            .offset((page - 1) * size)
+            .limit(size)
         )
 
-        query = query.order_by(sort_expr).offset((page - 1) * size).limit(size)
-
         result = await self.db.execute(query)
-        items = list(result.unique().scalars().all())
+        items = list(result.scalars().all())
         return items, total
 
+    async def list_cards(
+        self,
+        page: int,
+        size: int,
+        category_id: uuid.UUID | None = None,
+        store_id: uuid.UUID | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        search: str | None = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        include_inactive: bool = False,
+        min_rating: Decimal | None = None,
+    ) -> tuple[Sequence[RowMapping], int]:
+        """
+        Same filtering and paging as `list`, but selects only the columns a
+        product card needs as plain rows: no ORM entities and no
+        store/category joins.
+        """
+        filters = self._build_filters(
+            category_id, store_id, min_price, max_price, search, include_inactive, min_rating
+        )
+        total = await self._count(filters)
+
+        query = select(
+            Product.id,
+            Product.name,
+            Product.price,
+            (Product.stock > 0).label("in_stock"),
+            Product.primary_image_url,
+            Product.primary_image_variants,
+            Product.average_rating,
+            Product.review_count,
+        )
+        if filters:
+            query = query.where(*filters)
+
+        query = (
+            query.order_by(*self._sort_expressions(sort_by, sort_order))
+            .offset((page - 1) * size)
+            .limit(size)
+        )
+
+        result = await self.db.execute(query)
+        return list(result.mappings()), total
+
+    async def stream_for_store(
+        self, store_id: uuid.UUID, batch_size: int = 1000
+    ) -> AsyncIterator[RowMapping]:
+        """
+        Every product of a store (inactive included), oldest first, read
+        through a server-side cursor `batch_size` rows at a time.
+        """
+        result = await self.db.stream(
+            select(
+                Product.id,
+                Product.name,
+                Product.description,
+                Product.price,
+                Product.stock,
+                Product.category_id,
+                Product.is_active,
+                Product.created_at,
+                Product.updated_at,
+            )
+            .where(Product.store_id == store_id)
+            .order_by(Product.created_at.asc(), Product.id.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for row in result.mappings():
+            yield row
+
+    async def sync_image_summary(self, product_id: uuid.UUID) -> None:
+        """
+        Recompute the denormalized primary image and image count from
+        product_images: the image flagged primary, else the first by sort
+        order. Does not commit; call it in the transaction that changed the
+        images.
+        """
+        await self.db.flush()
+        # Take the row lock first so the UPDATE below runs with a snapshot that
+        # includes images committed by concurrent uploads/deletes.
+        await self.db.execute(
+            select(Product.id).where(Product.id == product_id).with_for_update()
+        )
+
+        def primary(column):
+            return (
+                select(column)
+                .where(ProductImage.product_id == product_id)
+                .order_by(
+                    ProductImage.is_primary.desc(),
+                    ProductImage.sort_order.asc(),
+                    ProductImage.created_at.asc(),
+                )
+                .limit(1)
+                .scalar_subquery()
+            )
+
+        await self.db.execute(
+            update(Product)
+            .where(Product.id == product_id)
+            .values(
+                primary_image_id=primary(ProductImage.id),
+                primary_image_url=primary(ProductImage.image_url),
+                primary_image_variants=func.coalesce(
+                    primary(ProductImage.variants),
+                    sa.text("'{}'::jsonb"),
+                ),
+                image_count=select(func.count())
+                .where(ProductImage.product_id == product_id)
+                .scalar_subquery(),
+            )
+        )
+
+    async def rebuild_facet_counts(self) -> None:
+        """
+        Recompute catalog_facet_counts from products, e.g. after changing
+        CATALOG_PRICE_BUCKETS or to repair drift. Commits.
+        """
+        # Waits for in-flight product writes that already touched the counts
+        # and blocks new ones until the rebuilt counts are committed.
+        await self.db.execute(sa.text("LOCK TABLE catalog_facet_counts IN EXCLUSIVE MODE"))
+        await self.db.execute(delete(CatalogFacetCount))
+        priced = (
+            select(
+                Product.category_id,
+                Product.store_id,
+                self._price_bucket_expression().label("price_bucket"),
+            )
+            .where(Product.is_active.is_(True))
+            .subquery("priced")
+        )
+        await self.db.execute(
+            insert(CatalogFacetCount).from_select(
+                ["category_id", "store_id", "price_bucket", "product_count"],
+                select(
+                    priced.c.category_id,
+                    priced.c.store_id,
+                    priced.c.price_bucket,
+                    func.count(),
+                ).group_by(priced.c.category_id, priced.c.store_id, priced.c.price_bucket),
+            )
+        )
+        await self.db.commit()
+
+    def _facet_source(
+        self,
+        min_price: Decimal | None,
+        max_price: Decimal | None,
+        search: str | None,
+    ) -> sa.FromClause:
+        if search is None and min_price is None and max_price is None:
+            return CatalogFacetCount.__table__
+        # Free text and arbitrary price bounds cannot be answered from the
+        # bucketed counts: count the matching products instead.
+        return (
+            select(
+                Product.category_id,
+                Product.store_id,
+                self._price_bucket_expression().label("price_bucket"),
+                sa.literal_column("1").label("product_count"),
+            )
+            .where(
+                *self._build_filters(min_price=min_price, max_price=max_price, search=search)
+            )
+            .subquery("matching_products")
+        )
+
+    async def get_facets(
+        self,
+        category_id: uuid.UUID | None = None,
+        store_id: uuid.UUID | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        search: str | None = None,
+    ) -> dict[str, Sequence[RowMapping] | int]:
+        """
+        Active product counts for the given filters, plus counts per
+        category, store and price bucket. Each facet ignores its own filter,
+        so it lists the alternatives to the current selection.
+        """
+        search = (search or "").strip() or None
+        with_price = self._facet_source(min_price, max_price, search)
+        without_price = self._facet_source(None, None, search)
+
+        def key_filters(source, category: bool = True, store: bool = True):
+            filters = []
+            if category and category_id:
+                filters.append(source.c.category_id == category_id)
+            if store and store_id:
+                filters.append(source.c.store_id == store_id)
+            return filters
+
+        total = await self.db.scalar(
+            select(func.coalesce(func.sum(with_price.c.product_count), 0)).where(
+                *key_filters(with_price)
+            )
+        )
+
+        async def named_counts(column: str, model, **ignored) -> Sequence[RowMapping]:
+            count = func.sum(with_price.c.product_count)
+            result = await self.db.execute(
+                select(model.id, model.name, count.label("count"))
+                .join(model, model.id == with_price.c[column])
+                .where(*key_filters(with_price, **ignored))
+                .group_by(model.id, model.name)
+                .having(count > 0)
+                .order_by(model.name)
+            )
+            return list(result.mappings())
+
+        bucket_count = func.sum(without_price.c.product_count)
+        bucket_result = await self.db.execute(
+            select(without_price.c.price_bucket, bucket_count.label("count"))
+            .where(*key_filters(without_price))
+            .group_by(without_price.c.price_bucket)
+            .having(bucket_count > 0)
+            .order_by(without_price.c.price_bucket)
+        )
+        return {
+            "total": int(total),
+            "categories": await named_counts("category_id", Category, category=False),
+            "stores": await named_counts("store_id", Store, store=False),
+            "price_buckets": list(bucket_result.mappings()),
+        }
+
+    async def update_inventory(
+        self, store_id: uuid.UUID, changes: Sequence[dict]
+    ) -> set[uuid.UUID]:
+        """
+        Apply stock and price changes to products of `store_id` with a single
+        UPDATE ... FROM (VALUES ...). Each change has a product_id and any of
+        stock, stock_delta, price, price_delta; deltas are applied to the
+        row as locked by the UPDATE, so concurrent writers do not lose them.
+
+        Changes to other stores' products, or that would take stock or price
+        out of range, are skipped. Commits; returns the updated product ids.
+        """
+        requested = values(
+            sa.column("product_id", UUID(as_uuid=True)),
+            sa.column("stock", sa.BigInteger),
+            sa.column("stock_delta", sa.BigInteger),
+            sa.column("price", sa.Numeric(10, 2)),
+            sa.column("price_delta", sa.Numeric(10, 2)),
+            name="requested",
+        ).data(
+            [
+                (
+                    change["product_id"],
+                    change.get("stock"),
+                    change.get("stock_delta"),
+                    change.get("price"),
+                    change.get("price_delta"),
+                )
+                for change in changes
+            ]
+        )
+
+        # Only price changes can move a product between facet buckets. Those
+        # rows are locked up front, in id order, to read the prices they
+        # move from.
+        reprices = any(
+            change.get("price") is not None or change.get("price_delta") is not None
+            for change in changes
+        )
+        before: dict[uuid.UUID, FacetKey | None] = {}
+        if reprices:
+            result = await self.db.execute(
+                select(Product.id, *(getattr(Product, field) for field in FACET_FIELDS))
+                .join(requested, requested.c.product_id == Product.id)
+                .where(Product.store_id == store_id)
+                .order_by(Product.id)
+                .with_for_update(of=Product)
+            )
+            before = {
+                row.id: self._facet_key(
+                    **{field: row._mapping[field] for field in FACET_FIELDS}
+                )
+                for row in result
+            }
+
+        # A VALUES column that is NULL on every row is typed text: cast.
+        stock, stock_delta, price, price_delta = (
+            sa.cast(requested.c[name], requested.c[name].type)
+            for name in ("stock", "stock_delta", "price", "price_delta")
+        )
+        new_stock = func.coalesce(
+            stock, sa.cast(Product.stock, sa.BigInteger) + func.coalesce(stock_delta, 0)
+        )
+        new_price = func.coalesce(price, Product.price + func.coalesce(price_delta, 0))
+        result = await self.db.execute(
+            update(Product)
+            .where(
+                Product.id == requested.c.product_id,
+                Product.store_id == store_id,
+                new_stock.between(0, MAX_STOCK),
+                new_price > 0,
+                new_price <= MAX_PRICE,
+            )
+            .values(stock=new_stock, price=new_price)
+            .returning(Product.id, *(getattr(Product, field) for field in FACET_FIELDS))
+            .execution_options(synchronize_session=False)
+        )
+        updated = result.all()
+        if reprices:
+            await self._move_listings(
+                (
+                    before[row.id],
+                    self._facet_key(
+                        **{field: row._mapping[field] for field in FACET_FIELDS}
+                    ),
+                )
+                for row in updated
+            )
+        await self.db.commit()
+        return {row.id for row in updated}
+
+    async def get_inventory_states(
+        self, product_ids: Sequence[uuid.UUID]
+    ) -> dict[uuid.UUID, RowMapping]:
+        """store_id, stock and price of the given products that exist."""
+        result = await self.db.execute(
+            select(Product.id, Product.store_id, Product.stock, Product.price).where(
+                Product.id.in_(product_ids)
+            )
+        )
+        return {row["id"]: row for row in result.mappings()}
+
     async def update(self, product: Product, data: dict) -> Product:
+        if any(field in data for field in FACET_FIELDS):
+            # Lock the row and read the committed values so concurrent updates
+            # of the same product move its counts exactly once.
+            result = await self.db.execute(
+                select(*(getattr(Product, field) for field in FACET_FIELDS))
+                .where(Product.id == product.id)
+                .with_for_update()
+            )
+            current = dict(result.one()._mapping)
+            changed = {field: data[field] for field in FACET_FIELDS if field in data}
+            await self._move_listings(
+                [(self._facet_key(**current), self._facet_key(**{**current, **changed}))]
+            )
+
         for field, value in data.items():
             setattr(product, field, value)
         await self.db.commit()
@@ -0,0 +1,259 @@
+import logging
+import uuid
+
+import sqlalchemy as sa
+from redis.asyncio import Redis
+from sqlalchemy import RowMapping, select, values
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.cart_item import CartItem
+from app.models.product import Product
+from app.repositories.cart import (
+    CartLineState,
+    CartRepository,
+    CartStore,
+    select_cart_lines,
+)
+
+logger = logging.getLogger(__name__)
+
+DIRTY_CARTS_KEY = "cart:dirty"
+# Present in every cart hash that has been loaded from PostgreSQL, so an
+# empty-but-loaded cart is not reloaded (and resurrected) on the next read.
+LOADED_FIELD = "_loaded"
+CART_TTL_SECONDS = 30 * 24 * 60 * 60
+
+
+def _cart_key(user_id: uuid.UUID) -> str:
+    return f"cart:{user_id}"
+
+
+class RedisCartRepository(CartStore):
+    """
+    Cart store kept in one Redis hash per user (product_id -> quantity).
+
+    Redis is the source of truth for carts it holds. Mutations add the user
+    to a dirty set and `persist_dirty_carts` (run periodically by Celery)
+    writes those carts back to cart_items; checkout clears both. A cart that
+    is not in Redis yet is loaded from PostgreSQL on first access.
+    """
+
+    def __init__(self, db: AsyncSession, redis: Redis):
+        self.db = db
+        self.redis = redis
+        self.db_repo = CartRepository(db)
+
+    async def _read_lines(self, user_id: uuid.UUID) -> dict[uuid.UUID, int] | None:
+        raw = await self.redis.hgetall(_cart_key(user_id))
+        if not raw:
+            return None
+        return {
+            uuid.UUID(field): int(quantity)
+            for field, quantity in raw.items()
+            if field != LOADED_FIELD
+        }
+
+    async def _load_lines(self, user_id: uuid.UUID) -> dict[uuid.UUID, int]:
+        lines = await self._read_lines(user_id)
+        if lines is not None:
+            return lines
+
+        result = await self.db.execute(
+            select(CartItem.product_id, CartItem.quantity)
+            .where(CartItem.user_id == user_id)
+            .order_by(CartItem.created_at.asc())
+        )
+        key = _cart_key(user_id)
+        # HSETNX so a write that raced ahead of this load is not overwritten.
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hsetnx(key, LOADED_FIELD, 1)
+            for product_id, quantity in result:
+                pipe.hsetnx(key, str(product_id), quantity)
+            pipe.expire(key, CART_TTL_SECONDS)
+            await pipe.execute()
+        return await self._read_lines(user_id) or {}
+
+    async def _mark_dirty(self, user_id: uuid.UUID) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(DIRTY_CARTS_KEY, str(user_id))
+            pipe.expire(_cart_key(user_id), CART_TTL_SECONDS)
+            await pipe.execute()
+
+    async def _get_product_states(
+        self, product_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, tuple[bool, int]]:
+        result = await self.db.execute(
+            select(Product.id, Product.is_active, Product.stock).where(
+                Product.id.in_(product_ids)
+            )
+        )
+        return {row.id: (row.is_active, row.stock) for row in result}
+
+    async def get_cart_items(self, user_id: uuid.UUID) -> list[CartItem]:
+        # Transient rows: never added to the session, so never flushed.
+        return [
+            CartItem(user_id=user_id, product_id=product_id, quantity=quantity)
+            for product_id, quantity in (await self._load_lines(user_id)).items()
+        ]
+
+    async def get_cart_lines(self, user_id: uuid.UUID) -> list[RowMapping]:
+        lines = await self._load_lines(user_id)
+        if not lines:
+            return []
+
+        requested = values(
+            sa.column("product_id", UUID(as_uuid=True)),
+            sa.column("quantity", sa.Integer),
+            sa.column("position", sa.Integer),
+            name="requested",
+        ).data(
+            [
+                (product_id, quantity, position)
+                for position, (product_id, quantity) in enumerate(lines.items())
+            ]
+        )
+        result = await self.db.execute(
+            select_cart_lines(requested.c.quantity)
+            .join(requested, requested.c.product_id == Product.id)
+            .order_by(requested.c.position)
+        )
+        return list(result.mappings())
+
+    async def upsert_cart_items(
+        self,
+        user_id: uuid.UUID,
+        lines: dict[uuid.UUID, int],
+        replace: bool = False,
+    ) -> set[uuid.UUID]:
+        await self._load_lines(user_id)
+        states = await self._get_product_states(list(lines))
+        eligible = [
+            product_id
+            for product_id, quantity in lines.items()
+            if product_id in states
+            and states[product_id][0]
+            and states[product_id][1] >= quantity
+        ]
+        if not eligible:
+            return set()
+
+        key = _cart_key(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for product_id in eligible:
+                if replace:
+                    pipe.hset(key, str(product_id), lines[product_id])
+                else:
+                    pipe.hincrby(key, str(product_id), lines[product_id])
+            results = await pipe.execute()
+
+        written = set(eligible)
+        if not replace:
+            # HINCRBY is atomic, so undoing an increment that overshot stock
+            # is safe even when other adds for the same line interleave.
+            over_stock = [
+                product_id
+                for product_id, quantity in zip(eligible, results)
+                if quantity > states[product_id][1]
+            ]
+            if over_stock:
+                async with self.redis.pipeline(transaction=True) as pipe:
+                    for product_id in over_stock:
+                        pipe.hincrby(key, str(product_id), -lines[product_id])
+                    reverted = await pipe.execute()
+                emptied = [
+                    str(product_id)
+                    for product_id, quantity in zip(over_stock, reverted)
+                    if quantity <= 0
+                ]
+                if emptied:
+                    await self.redis.hdel(key, *emptied)
+                written -= set(over_stock)
+
+        await self._mark_dirty(user_id)
+        return written
+
+    async def set_cart_item_quantity(
+        self,
+        user_id: uuid.UUID,
+        product_id: uuid.UUID,
+        quantity: int,
+    ) -> bool:
+        lines = await self._load_lines(user_id)
+        if product_id not in lines:
+            return False
+
+        states = await self._get_product_states([product_id])
+        if product_id not in states or states[product_id][1] < quantity:
+            return False
+
+        await self.redis.hset(_cart_key(user_id), str(product_id), quantity)
+        await self._mark_dirty(user_id)
+        return True
+
+    async def delete_cart_item(self, user_id: uuid.UUID, product_id: uuid.UUID) -> bool:
+        await self._load_lines(user_id)
+        deleted = await self.redis.hdel(_cart_key(user_id), str(product_id))
+        if deleted:
+            await self._mark_dirty(user_id)
+        return bool(deleted)
+
+    async def clear_cart(self, user_id: uuid.UUID, commit: bool = True) -> None:
+        # With commit=False (checkout) only the rows are deleted, inside the
+        # caller's transaction; the caller clears Redis with clear_cached_cart
+        # once that commits, so a rolled-back checkout keeps the cart.
+        await self.db_repo.clear_cart(user_id, commit=commit)
+        if commit:
+            await self.clear_cached_cart(user_id)
+
+    async def clear_cached_cart(self, user_id: uuid.UUID) -> None:
+        """Empty the Redis copy of the cart and mark it dirty."""
+        key = _cart_key(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, LOADED_FIELD, 1)
+            pipe.expire(key, CART_TTL_SECONDS)
+            pipe.sadd(DIRTY_CARTS_KEY, str(user_id))
+            await pipe.execute()
+
+    async def get_line_states(
+        self,
+        user_id: uuid.UUID,
+        product_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, CartLineState]:
+        lines = await self._load_lines(user_id)
+        states = await self._get_product_states(product_ids)
+        return {
+            product_id: CartLineState(
+                product_id=product_id,
+                product_exists=product_id in states,
+                is_active=states.get(product_id, (False, 0))[0],
+                stock=states.get(product_id, (False, 0))[1],
+                cart_quantity=lines.get(product_id),
+            )
+            for product_id in product_ids
+        }
+
+    async def persist_dirty_carts(self, batch_size: int = 500) -> int:
+        """
+        Write up to `batch_size` dirty carts back to cart_items. A cart
+        changed while it is being written is marked dirty again by that
+        change, so it is picked up by the next run.
+        """
+        user_ids = await self.redis.spop(DIRTY_CARTS_KEY, batch_size) or []
+        persisted = 0
+        for raw_user_id in user_ids:
+            user_id = uuid.UUID(raw_user_id)
+            lines = await self._read_lines(user_id)
+            if lines is None:
+                # Expired from Redis; PostgreSQL already has the last copy.
+                continue
+            try:
+                await self.db_repo.sync_cart(user_id, lines)
+            except Exception:
+                await self.db.rollback()
+                await self.redis.sadd(DIRTY_CARTS_KEY, raw_user_id)
+                logger.exception("Failed to persist cart user_id=%s", user_id)
+                continue
+            persisted += 1
+        return persisted
@@ -1,16 +1,27 @@
 import uuid
-from sqlalchemy import and_, func, select
+from collections.abc import Sequence
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy import RowMapping, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from app.models.order import Order
-from app.models.order_item import OrderItem
+from app.models.product import Product
 from app.models.review import Review
+from app.repositories.verified_purchase import VerifiedPurchaseRepository
+
+RATINGS = range(1, 6)
+
+
+def rating_histogram(product: Product | sa.Row) -> dict[int, int]:
+    """Review counts per star rating, from a product or a row with its counts."""
+    return {rating: getattr(product, f"rating_{rating}_count") for rating in RATINGS}
 
 
 class ReviewRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.purchase_repo = VerifiedPurchaseRepository(db)
 
     async def create_review(
         self,
@@ -18,14 +29,40 @@ class ReviewRepository:
         product_id: uuid.UUID,
         rating: int,
         comment: str | None,
+        reviewer_name: str,
     ) -> Review:
         review = Review(
             user_id=user_id,
             product_id=product_id,
             rating=rating,
             comment=comment,
+            reviewer_name=reviewer_name,
         )
         self.db.add(review)
+        await self.db.flush()
+
+        # One statement, so concurrent reviews of the product queue on its row.
+        # SET expressions see the old values.
+        rating_column = getattr(Product, f"rating_{rating}_count")
+        rating_sum = sum(
+            getattr(Product, f"rating_{value}_count") * value for value in RATINGS
+        )
+        await self.db.execute(
+            update(Product)
+            .where(Product.id == product_id)
+            .values(
+                {
+                    rating_column: rating_column + 1,
+                    Product.review_count: Product.review_count + 1,
+                    Product.average_rating: func.round(
+                        sa.cast(rating_sum + rating, sa.Numeric)
+                        / (Product.review_count + 1),
+                        2,
+                    ),
+                }
+            )
+            .execution_options(synchronize_session=False)
+        )
         await self.db.commit()
         await self.db.refresh(review)
         return review
@@ -33,33 +70,49 @@ class ReviewRepository:
     async def get_product_reviews(
         self,
         product_id: uuid.UUID,
-        skip: int,
         limit: int,
-    ) -> tuple[list[Review], int]:
-        total_result = await self.db.execute(
-            select(func.count(Review.id)).where(Review.product_id == product_id)
-        )
-        total = total_result.scalar_one()
-
+        before: tuple[datetime, uuid.UUID] | None = None,
+        offset: int = 0,
+    ) -> Sequence[RowMapping]:
+        """
+        Up to `limit` of a product's reviews, newest first, as plain rows.
+        `before` is the (created_at, id) of the last review of the previous
+        page; the (product_id, created_at, id) index serves every page.
+        `offset` only backs the deprecated page parameter.
+        """
+        query = select(
+            Review.id,
+            Review.user_id,
+            Review.product_id,
+            Review.reviewer_name,
+            Review.rating,
+            Review.comment,
+            Review.created_at,
+        ).where(Review.product_id == product_id)
+        if before is not None:
+            query = query.where(tuple_(Review.created_at, Review.id) < tuple_(*before))
         result = await self.db.execute(
-            select(Review)
-            .options(joinedload(Review.user))
-            .where(Review.product_id == product_id)
-            .order_by(Review.created_at.desc())
-            .offset(skip)
+            query.order_by(Review.created_at.desc(), Review.id.desc())
+            .offset(offset)
             .limit(limit)
         )
-        return list(result.unique().scalars().all()), total
+        return list(result.mappings())
 
-    async def get_review_aggregates(self, product_id: uuid.UUID) -> tuple[float, int]:
+    async def get_product_review_summary(
+        self, product_id: uuid.UUID
+    ) -> sa.Row | None:
+        """
+        The product's stored `average_rating`, `review_count` and
+        `rating_{1..5}_count`; None if it does not exist.
+        """
         result = await self.db.execute(
-            select(func.avg(Review.rating), func.count(Review.id)).where(
-                Review.product_id == product_id
-            )
+            select(
+                Product.average_rating,
+                Product.review_count,
+                *(getattr(Product, f"rating_{rating}_count") for rating in RATINGS),
+            ).where(Product.id == product_id)
         )
-        avg_rating, review_count = result.one()
-        average_rating = round(float(avg_rating), 1) if avg_rating is not None else 0.0
-        return average_rating, int(review_count or 0)
+        return result.one_or_none()
 
     async def review_exists(self, user_id: uuid.UUID, product_id: uuid.UUID) -> bool:
         result = await self.db.execute(
@@ -71,16 +124,4 @@ class ReviewRepository:
         return result.scalar_one_or_none() is not None
 
     async def user_purchased_product(self, user_id: uuid.UUID, product_id: uuid.UUID) -> bool:
-        result = await self.db.execute(
-            select(OrderItem.id)
-            .join(Order, Order.id == OrderItem.order_id)
-            .where(
-                and_(
-                    Order.user_id == user_id,
-                    OrderItem.product_id == product_id,
-                    func.upper(Order.status) == "DELIVERED",
-                )
-            )
-            .limit(1)
-        )
-        return result.scalar_one_or_none() is not None
+        return await self.purchase_repo.exists(user_id, product_id)
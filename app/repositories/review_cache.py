@@ -0,0 +1,48 @@
+import logging
+import uuid
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# A hash per product: page size -> JSON of the first page of reviews.
+FIRST_PAGE_KEY = "reviews:first-page:{product_id}"
+# Bounds staleness from changes that do not invalidate (reviewer renames).
+FIRST_PAGE_TTL_SECONDS = 300
+
+
+class ReviewPageCache:
+    """
+    The first (newest) page of each product's reviews, stored as the
+    response JSON. Creating a review deletes the product's entry. Redis
+    errors are logged and treated as cache misses.
+    """
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+
+    async def get_first_page(self, product_id: uuid.UUID, size: int) -> str | None:
+        try:
+            return await self.redis.hget(FIRST_PAGE_KEY.format(product_id=product_id), size)
+        except RedisError:
+            logger.warning("Review page cache unavailable; reading from database")
+            return None
+
+    async def set_first_page(self, product_id: uuid.UUID, size: int, payload: str) -> None:
+        key = FIRST_PAGE_KEY.format(product_id=product_id)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, size, payload)
+                pipe.expire(key, FIRST_PAGE_TTL_SECONDS)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Failed to cache first review page product_id=%s", product_id)
+
+    async def invalidate(self, product_id: uuid.UUID) -> None:
+        try:
+            await self.redis.delete(FIRST_PAGE_KEY.format(product_id=product_id))
+        except RedisError:
+            logger.exception(
+                "Failed to invalidate review page cache product_id=%s", product_id
+            )
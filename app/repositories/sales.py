@@ -0,0 +1,157 @@
+import uuid
+from collections.abc import Sequence
+from datetime import date
+
+import sqlalchemy as sa
+from sqlalchemy import RowMapping, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.order import OrderStatus
+from app.models.order_item import OrderItem
+from app.models.product import Product
+from app.models.sales_rollup import ProductSalesDaily, StoreSalesDaily
+
+
+def _order_day() -> sa.ColumnElement[date]:
+    return sa.cast(func.timezone("UTC", OrderItem.created_at), sa.Date)
+
+
+class SalesRollupRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record(self, order_item_ids: Sequence[uuid.UUID], sign: int = 1) -> None:
+        """
+        Add (`sign=1`) or remove (`sign=-1`) order items from the daily
+        rollups, with one statement per table. Items count on the UTC day
+        they were placed.
+
+        Remove items only after marking them cancelled: a store's order stops
+        counting once none of its items in that order are left. Does not commit.
+        """
+        if not order_item_ids:
+            return
+        day = _order_day().label("day")
+        orders = func.count(sa.distinct(OrderItem.order_id))
+        if sign < 0:
+            other = aliased(OrderItem)
+            still_counted = (
+                select(other.id)
+                .where(
+                    other.order_id == OrderItem.order_id,
+                    other.store_id == OrderItem.store_id,
+                    other.status != OrderStatus.CANCELLED,
+                )
+                .exists()
+            )
+            store_orders = orders.filter(~still_counted)
+        else:
+            store_orders = orders
+
+        def totals(*keys, order_count):
+            return (
+                select(
+                    *keys,
+                    func.sum(OrderItem.quantity).label("units"),
+                    func.sum(OrderItem.subtotal).label("revenue"),
+                    order_count.label("order_count"),
+                )
+                .where(OrderItem.id.in_(order_item_ids))
+                .group_by(*keys)
+                # Rows are written in key order so concurrent writers cannot
+                # deadlock.
+                .order_by(*keys)
+            )
+
+        await self._apply(
+            ProductSalesDaily,
+            totals(OrderItem.store_id, day, OrderItem.product_id, order_count=orders),
+            ("store_id", "day", "product_id"),
+            sign,
+        )
+        await self._apply(
+            StoreSalesDaily,
+            totals(OrderItem.store_id, day, order_count=store_orders),
+            ("store_id", "day"),
+            sign,
+        )
+
+    async def _apply(self, model, totals: sa.Select, keys: tuple[str, ...], sign: int) -> None:
+        measures = ("units", "revenue", "order_count")
+        if sign > 0:
+            statement = insert(model).from_select([*keys, *measures], totals)
+            await self.db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=list(keys),
+                    set_={
+                        name: getattr(model, name) + getattr(statement.excluded, name)
+                        for name in measures
+                    },
+                )
+            )
+            return
+
+        # Removed items were counted when placed, so their rows exist. (An
+        # upsert cannot subtract: the proposed row fails the >= 0 checks.)
+        removed = totals.subquery("removed")
+        await self.db.execute(
+            update(model)
+            .where(*(getattr(model, key) == removed.c[key] for key in keys))
+            .values(
+                {name: getattr(model, name) - removed.c[name] for name in measures}
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_store_daily(
+        self,
+        store_id: uuid.UUID,
+        date_from: date,
+        date_to: date,
+    ) -> Sequence[RowMapping]:
+        """The store's rollup rows between the two days, inclusive."""
+        result = await self.db.execute(
+            select(
+                StoreSalesDaily.day,
+                StoreSalesDaily.units,
+                StoreSalesDaily.revenue,
+                StoreSalesDaily.order_count,
+            )
+            .where(
+                StoreSalesDaily.store_id == store_id,
+                StoreSalesDaily.day.between(date_from, date_to),
+            )
+            .order_by(StoreSalesDaily.day)
+        )
+        return list(result.mappings())
+
+    async def get_top_products(
+        self,
+        store_id: uuid.UUID,
+        date_from: date,
+        date_to: date,
+        limit: int,
+    ) -> Sequence[RowMapping]:
+        """The store's best-selling products by revenue between the two days."""
+        revenue = func.sum(ProductSalesDaily.revenue)
+        result = await self.db.execute(
+            select(
+                ProductSalesDaily.product_id,
+                Product.name.label("product_name"),
+                func.sum(ProductSalesDaily.units).label("units"),
+                revenue.label("revenue"),
+                func.sum(ProductSalesDaily.order_count).label("order_count"),
+            )
+            .join(Product, Product.id == ProductSalesDaily.product_id)
+            .where(
+                ProductSalesDaily.store_id == store_id,
+                ProductSalesDaily.day.between(date_from, date_to),
+            )
+            .group_by(ProductSalesDaily.product_id, Product.name)
+            .having(func.sum(ProductSalesDaily.units) > 0)
+            .order_by(revenue.desc(), Product.name)
+            .limit(limit)
+        )
+        return list(result.mappings())
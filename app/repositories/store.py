@@ -1,9 +1,10 @@
 import uuid
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.models.product import Product
 from app.models.store import Store
 
 
@@ -70,3 +71,38 @@ class StoreRepository:
     async def delete(self, store: Store) -> None:
         await self.db.delete(store)
         await self.db.commit()
+
+    async def reconcile_product_counts(self, batch_size: int = 500) -> int:
+        """
+        Reset product_count to the number of active products for every store
+        whose counter drifted, `batch_size` stores per transaction. Returns
+        how many stores were corrected.
+        """
+        corrected = 0
+        last_id: uuid.UUID | None = None
+        while True:
+            # Lock the batch first: product writes that already bumped a
+            # counter finish (and become visible to the count below), later
+            # ones wait and apply their change on top of the corrected value.
+            query = select(Store.id).order_by(Store.id).limit(batch_size).with_for_update()
+            if last_id is not None:
+                query = query.where(Store.id > last_id)
+            store_ids = list((await self.db.execute(query)).scalars().all())
+            if not store_ids:
+                break
+
+            active_count = (
+                select(func.count(Product.id))
+                .where(Product.store_id == Store.id, Product.is_active.is_(True))
+                .scalar_subquery()
+            )
+            result = await self.db.execute(
+                update(Store)
+                .where(Store.id.in_(store_ids), Store.product_count != active_count)
+                .values(product_count=active_count)
+                .returning(Store.id)
+            )
+            corrected += len(result.all())
+            await self.db.commit()
+            last_id = store_ids[-1]
+        return corrected
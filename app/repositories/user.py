@@ -1,8 +1,9 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.review import Review
 from app.models.user import User
 
 
@@ -41,6 +42,13 @@ class UserRepository:
         Apply a dict of changes to a User instance, commit, and return
         the refreshed object.
         """
+        if "full_name" in data and data["full_name"] != user.full_name:
+            # Reviews carry a copy of the author's name.
+            await self.db.execute(
+                update(Review)
+                .where(Review.user_id == user.id)
+                .values(reviewer_name=data["full_name"])
+            )
         for field, value in data.items():
             setattr(user, field, value)
         await self.db.commit()
@@ -0,0 +1,42 @@
+import uuid
+from collections.abc import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.order import Order
+from app.models.order_item import OrderItem
+from app.models.verified_purchase import VerifiedPurchase
+
+
+class VerifiedPurchaseRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record(self, order_item_ids: Sequence[uuid.UUID]) -> None:
+        """
+        Mark the buyers of the given (delivered) order items as verified
+        purchasers of their products, with one statement. Does not commit.
+        """
+        if not order_item_ids:
+            return
+        purchases = (
+            select(Order.user_id, OrderItem.product_id)
+            .join(Order, Order.id == OrderItem.order_id)
+            .where(OrderItem.id.in_(order_item_ids))
+        )
+        await self.db.execute(
+            insert(VerifiedPurchase)
+            .from_select(["user_id", "product_id"], purchases)
+            .on_conflict_do_nothing(index_elements=["user_id", "product_id"])
+        )
+
+    async def exists(self, user_id: uuid.UUID, product_id: uuid.UUID) -> bool:
+        result = await self.db.execute(
+            select(VerifiedPurchase.user_id).where(
+                VerifiedPurchase.user_id == user_id,
+                VerifiedPurchase.product_id == product_id,
+            )
+        )
+        return result.scalar_one_or_none() is not None
@@ -1,7 +1,10 @@
 from fastapi import APIRouter, Depends, status
 
+from app.dependencies.admin import get_admin_service
 from app.dependencies.roles import require_admin
 from app.models.user import User
+from app.schemas.admin import PlatformStatsResponse
+from app.services.admin import AdminService
 
 router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
 
@@ -9,3 +12,19 @@ router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def admin_health(_: User = Depends(require_admin)):
     return {"status": "ok", "scope": "admin"}
+
+
+@router.get(
+    "/stats",
+    response_model=PlatformStatsResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_platform_stats(
+    _: User = Depends(require_admin),
+    admin_service: AdminService = Depends(get_admin_service),
+):
+    """
+    Platform-wide dashboard figures as of `computed_at`, refreshed every
+    PLATFORM_STATS_REFRESH_INTERVAL_SECONDS by Celery beat.
+    """
+    return await admin_service.get_platform_stats()
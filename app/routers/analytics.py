@@ -0,0 +1,31 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query, status
+
+from app.dependencies.analytics import get_analytics_service
+from app.dependencies.roles import require_vendor
+from app.models.user import User
+from app.schemas.analytics import SalesAnalyticsResponse
+from app.services.analytics import AnalyticsService
+
+router = APIRouter(prefix="/api/v1/vendor/analytics", tags=["Analytics"])
+
+
+@router.get(
+    "/sales",
+    response_model=SalesAnalyticsResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_vendor_sales(
+    date_from: date | None = Query(default=None),
+    date_to: date | None = Query(default=None),
+    top: int = Query(default=10, ge=1, le=100),
+    current_user: User = Depends(require_vendor),
+    analytics_service: AnalyticsService = Depends(get_analytics_service),
+):
+    return await analytics_service.get_vendor_sales(
+        user=current_user,
+        date_from=date_from,
+        date_to=date_to,
+        top=top,
+    )
@@ -5,7 +5,13 @@ from fastapi import APIRouter, Depends, Response, status
 from app.dependencies.auth import get_current_user
 from app.dependencies.cart import get_cart_service
 from app.models.user import User
-from app.schemas.cart import CartItemCreate, CartItemUpdate, CartResponse
+from app.schemas.cart import (
+    CartBulkResponse,
+    CartBulkUpdate,
+    CartItemCreate,
+    CartItemUpdate,
+    CartResponse,
+)
 from app.services.cart import CartService
 
 router = APIRouter(prefix="/api/v1/cart", tags=["Cart"])
@@ -29,6 +35,23 @@ async def add_cart_item(
     return {"detail": "Item added to cart"}
 
 
+@router.post(
+    "/items/bulk",
+    response_model=CartBulkResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def bulk_update_cart_items(
+    payload: CartBulkUpdate,
+    current_user: User = Depends(get_current_user),
+    cart_service: CartService = Depends(get_cart_service),
+):
+    return await cart_service.bulk_update(
+        current_user,
+        [(item.product_id, item.quantity) for item in payload.items],
+        replace=payload.mode == "replace",
+    )
+
+
 @router.put("/items/{product_id}", status_code=status.HTTP_200_OK)
 async def update_cart_item(
     product_id: uuid.UUID,
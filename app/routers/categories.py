@@ -5,7 +5,13 @@ from fastapi import APIRouter, Depends, Response, status
 from app.dependencies.category import get_category_service
 from app.dependencies.roles import require_admin
 from app.models.user import User
-from app.schemas.category import CategoryCreate, CategoryResponse, CategoryUpdate
+from app.schemas.category import (
+    CategoryBulkCreate,
+    CategoryBulkResponse,
+    CategoryCreate,
+    CategoryResponse,
+    CategoryUpdate,
+)
 from app.services.category import CategoryService
 
 router = APIRouter(prefix="/api/v1/categories", tags=["Categories"])
@@ -27,6 +33,19 @@ async def create_category(
     return await category_service.create_category(category_data)
 
 
+@router.post(
+    "/bulk",
+    response_model=CategoryBulkResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def import_categories(
+    payload: CategoryBulkCreate,
+    _: User = Depends(require_admin),
+    category_service: CategoryService = Depends(get_category_service),
+):
+    return await category_service.import_categories(payload.items)
+
+
 @router.put(
     "/{category_id}",
     response_model=CategoryResponse,
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.dependencies.auth import get_current_user
 from app.dependencies.orders import get_order_service
@@ -16,6 +17,7 @@ from app.schemas.order import (
 )
 from app.schemas.pagination import PaginatedResponse
 from app.services.order import OrderService, log_order_placement_event
+from app.utils.file_export import MEDIA_TYPES, FileFormat
 
 router = APIRouter(prefix="/api/v1", tags=["Orders"])
 
@@ -97,6 +99,33 @@ async def get_vendor_orders(
     )
 
 
+@router.get("/vendor/orders/export", status_code=status.HTTP_200_OK)
+async def export_vendor_orders(
+    format: FileFormat = Query(default="csv"),
+    status: str | None = Query(default=None),
+    created_from: datetime | None = Query(default=None),
+    created_to: datetime | None = Query(default=None),
+    current_user: User = Depends(require_vendor),
+    order_service: OrderService = Depends(get_order_service),
+):
+    """
+    Stream the vendor's order items, optionally filtered by item status and
+    a created_at range (`created_from` inclusive, `created_to` exclusive).
+    """
+    chunks = await order_service.export_vendor_orders(
+        user=current_user,
+        file_format=format,
+        status=status,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="orders.{format}"'},
+    )
+
+
 @router.patch(
     "/vendor/orders/{order_item_id}/status",
     response_model=VendorOrderItemResponse,
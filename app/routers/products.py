@@ -1,7 +1,9 @@
 import uuid
 from decimal import Decimal
+from typing import Literal
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.dependencies.auth import get_current_user_optional
 from app.dependencies.product import get_product_service
@@ -9,12 +11,17 @@ from app.dependencies.roles import require_vendor
 from app.models.user import User
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.product import (
+    InventoryBulkResponse,
+    InventoryBulkUpdate,
     ProductCreate,
+    ProductFacetsResponse,
+    ProductImportResponse,
     ProductListResponse,
     ProductResponse,
     ProductUpdate,
 )
 from app.services.product import ProductService
+from app.utils.file_export import MEDIA_TYPES, FileFormat
 
 router = APIRouter(prefix="/api/v1/products", tags=["Products"])
 
@@ -28,10 +35,70 @@ async def create_product(
     return await product_service.create_product(current_user, product_data)
 
 
+@router.post(
+    "/import",
+    response_model=ProductImportResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_products(
+    request: Request,
+    format: FileFormat = Query(default="csv"),
+    current_user: User = Depends(require_vendor),
+    product_service: ProductService = Depends(get_product_service),
+):
+    """
+    Bulk-create products from a CSV (header: name,description,price,stock,
+    category_id) or NDJSON request body. Invalid rows are reported by row
+    number; valid rows are inserted.
+    """
+    return await product_service.import_products(current_user, request.stream(), format)
+
+
+@router.patch(
+    "/inventory",
+    response_model=InventoryBulkResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def update_inventory(
+    payload: InventoryBulkUpdate,
+    current_user: User = Depends(require_vendor),
+    product_service: ProductService = Depends(get_product_service),
+):
+    return await product_service.update_inventory(current_user, payload.items)
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_products(
+    format: FileFormat = Query(default="csv"),
+    current_user: User = Depends(require_vendor),
+    product_service: ProductService = Depends(get_product_service),
+):
+    chunks = await product_service.export_products(current_user, format)
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="products.{format}"'},
+    )
+
+
 @router.get(
     "",
     response_model=PaginatedResponse[ProductListResponse],
     status_code=status.HTTP_200_OK,
+    responses={
+        200: {
+            "description": "`view=card` returns items shaped like ProductCard instead.",
+        },
+    },
 )
 async def list_products(
     page: int = Query(default=1, ge=1),
@@ -41,8 +108,11 @@ async def list_products(
     min_price: Decimal | None = Query(default=None, gt=0),
     max_price: Decimal | None = Query(default=None, gt=0),
     search: str | None = Query(default=None),
+    min_rating: Decimal | None = Query(default=None, ge=1, le=5),
     sort_by: str = Query(default="created_at"),
     sort_order: str = Query(default="desc"),
+    image_width: int = Query(default=400, ge=1, le=4096),
+    view: Literal["full", "card"] = Query(default="full"),
     current_user: User | None = Depends(get_current_user_optional),
     product_service: ProductService = Depends(get_product_service),
 ):
@@ -51,6 +121,23 @@ async def list_products(
         vendor_store = await product_service.store_repo.get_by_owner_id(current_user.id)
         include_inactive = bool(vendor_store and vendor_store.id == store_id)
 
+    if view == "card":
+        content = await product_service.list_product_cards(
+            page=page,
+            size=size,
+            category_id=category_id,
+            store_id=store_id,
+            min_price=min_price,
+            max_price=max_price,
+            search=search,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            include_inactive=include_inactive,
+            min_rating=min_rating,
+            image_width=image_width,
+        )
+        return Response(content=content, media_type="application/json")
+
     return await product_service.list_products(
         page=page,
         size=size,
@@ -62,6 +149,30 @@ async def list_products(
         sort_by=sort_by,
         sort_order=sort_order,
         include_inactive=include_inactive,
+        min_rating=min_rating,
+        image_width=image_width,
+    )
+
+
+@router.get(
+    "/facets",
+    response_model=ProductFacetsResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_product_facets(
+    category_id: uuid.UUID | None = None,
+    store_id: uuid.UUID | None = None,
+    min_price: Decimal | None = Query(default=None, gt=0),
+    max_price: Decimal | None = Query(default=None, gt=0),
+    search: str | None = Query(default=None),
+    product_service: ProductService = Depends(get_product_service),
+):
+    return await product_service.get_facets(
+        category_id=category_id,
+        store_id=store_id,
+        min_price=min_price,
+        max_price=max_price,
+        search=search,
     )
 
 
@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 
 from app.dependencies.auth import get_current_user
 from app.dependencies.review import get_review_service
@@ -28,12 +28,19 @@ async def create_review(
 @router.get("", response_model=ReviewListResponse, status_code=status.HTTP_200_OK)
 async def list_product_reviews(
     product_id: uuid.UUID,
-    page: int = Query(default=1, ge=1),
     size: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    page: int | None = Query(default=None, ge=1, deprecated=True),
     review_service: ReviewService = Depends(get_review_service),
 ):
-    return await review_service.get_product_reviews(
+    """
+    Newest reviews first. Follow `next_cursor` (passed back as `cursor`) for
+    older pages. `page` (offset paging) is still accepted but deprecated.
+    """
+    content = await review_service.get_product_reviews(
         product_id=product_id,
-        page=page,
         size=size,
+        cursor=cursor,
+        page=page,
     )
+    return Response(content=content, media_type="application/json")
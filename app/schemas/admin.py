@@ -0,0 +1,34 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class NewUserCounts(BaseModel):
+    last_24h: int
+    last_7d: int
+    last_30d: int
+
+
+class TopProductStat(BaseModel):
+    product_id: uuid.UUID
+    product_name: str
+    store_name: str
+    units: int
+    revenue: Decimal
+
+
+class PlatformStats(BaseModel):
+    # GMV counts order items that are not cancelled.
+    gmv: Decimal
+    gmv_last_30d: Decimal
+    orders_by_status: dict[str, int]
+    active_stores: int
+    total_stores: int
+    new_users: NewUserCounts
+    top_products_last_30d: list[TopProductStat]
+
+
+class PlatformStatsResponse(PlatformStats):
+    computed_at: datetime
@@ -0,0 +1,28 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class SalesTotals(BaseModel):
+    units: int
+    revenue: Decimal
+    order_count: int
+
+
+class DailySales(SalesTotals):
+    day: date
+
+
+class ProductSales(SalesTotals):
+    product_id: uuid.UUID
+    product_name: str
+
+
+class SalesAnalyticsResponse(BaseModel):
+    date_from: date
+    date_to: date
+    totals: SalesTotals
+    daily: list[DailySales]
+    top_products: list[ProductSales]
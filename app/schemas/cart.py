@@ -1,5 +1,6 @@
 import uuid
 from decimal import Decimal
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -13,6 +14,23 @@ class CartItemUpdate(BaseModel):
     quantity: int = Field(ge=0)
 
 
+class CartBulkUpdate(BaseModel):
+    # "add" increases existing lines; "replace" sets them to the given quantity.
+    mode: Literal["add", "replace"] = "add"
+    items: list[CartItemCreate] = Field(min_length=1, max_length=100)
+
+
+class CartLineRejection(BaseModel):
+    product_id: uuid.UUID
+    error: str
+    detail: str
+
+
+class CartBulkResponse(BaseModel):
+    updated: list[uuid.UUID]
+    rejected: list[CartLineRejection]
+
+
 class CartItemResponse(BaseModel):
     product_id: uuid.UUID
     product_name: str
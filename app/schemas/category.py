@@ -23,3 +23,18 @@ class CategoryResponse(BaseModel):
     is_active: bool
 
     model_config = {"from_attributes": True}
+
+
+class CategoryBulkCreate(BaseModel):
+    items: list[CategoryCreate] = Field(min_length=1, max_length=500)
+
+
+class CategoryImportRejection(BaseModel):
+    name: str
+    error: str
+    detail: str
+
+
+class CategoryBulkResponse(BaseModel):
+    created: list[CategoryResponse]
+    rejected: list[CategoryImportRejection]
@@ -1,8 +1,11 @@
 import uuid
 from datetime import datetime
 from decimal import Decimal
+from typing import TypedDict
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+
+from app.models.order import OrderStatus
 
 
 class OrderCreate(BaseModel):
@@ -15,7 +18,7 @@ class OrderItemResponse(BaseModel):
     quantity: int
     unit_price: Decimal
     subtotal: Decimal
-    status: str
+    status: OrderStatus
 
 
 class ShippingAddressResponse(BaseModel):
@@ -34,7 +37,7 @@ class ShippingAddressResponse(BaseModel):
 class OrderResponse(BaseModel):
     id: uuid.UUID
     order_number: str
-    status: str
+    status: OrderStatus
     total_amount: Decimal
     created_at: datetime
 
@@ -42,7 +45,7 @@ class OrderResponse(BaseModel):
 class OrderDetailResponse(BaseModel):
     id: uuid.UUID
     order_number: str
-    status: str
+    status: OrderStatus
     total_amount: Decimal
     created_at: datetime
     shipping_address: ShippingAddressResponse
@@ -50,6 +53,7 @@ class OrderDetailResponse(BaseModel):
 
 
 class OrderStatusUpdate(BaseModel):
+    # Parsed by OrderService, which reports unknown values as INVALID_STATUS.
     status: str
 
 
@@ -59,5 +63,27 @@ class VendorOrderItemResponse(BaseModel):
     customer_name: str
     product_name: str
     quantity: int
-    item_status: str
+    item_status: OrderStatus
+    created_at: datetime
+
+
+class VendorOrderExportRow(TypedDict):
+    order_item_id: uuid.UUID
+    order_number: str
+    item_status: OrderStatus
     created_at: datetime
+    customer_name: str
+    product_id: uuid.UUID
+    product_name: str
+    quantity: int
+    unit_price: Decimal
+    subtotal: Decimal
+    address_line_1: str
+    address_line_2: str | None
+    city: str
+    state: str
+    postal_code: str
+    country: str
+
+
+vendor_order_export_row_adapter = TypeAdapter(VendorOrderExportRow)
@@ -1,8 +1,9 @@
 import uuid
 from datetime import datetime
 from decimal import Decimal
+from typing import TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
 
 from app.schemas.product_image import ProductImageResponse
 
@@ -51,6 +52,8 @@ class ProductResponse(BaseModel):
     images: list[ProductImageResponse]
     average_rating: float = 0.0
     review_count: int = 0
+    # Number of reviews per star rating, 1 to 5.
+    rating_histogram: dict[int, int] = Field(default_factory=dict)
     created_at: datetime
     updated_at: datetime
 
@@ -66,10 +69,118 @@ class ProductListResponse(BaseModel):
     is_active: bool
     store: StoreInfo
     category: CategoryInfo
-    images: list[ProductImageResponse]
+    primary_image_url: str | None = None
+    image_count: int = 0
+    thumbnail_url: str | None = None
     average_rating: float = 0.0
     review_count: int = 0
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class FacetValue(BaseModel):
+    id: uuid.UUID
+    name: str
+    count: int
+
+
+class PriceBucketFacet(BaseModel):
+    min_price: Decimal
+    max_price: Decimal | None  # exclusive; None for the top bucket
+    count: int
+
+
+class ProductFacetsResponse(BaseModel):
+    total: int
+    categories: list[FacetValue]
+    stores: list[FacetValue]
+    price_buckets: list[PriceBucketFacet]
+
+
+class ProductCard(TypedDict):
+    id: uuid.UUID
+    name: str
+    price: Decimal
+    in_stock: bool
+    thumbnail_url: str | None
+    average_rating: float
+    review_count: int
+
+
+class ProductCardPage(TypedDict):
+    items: list[ProductCard]
+    total: int
+    page: int
+    size: int
+    pages: int
+
+
+# Built once at import: dump_json serializes plain dicts straight to bytes,
+# without constructing or validating a model per card.
+product_card_page_adapter = TypeAdapter(ProductCardPage)
+
+
+class ProductImportRejection(BaseModel):
+    row: int
+    error: str
+    detail: str
+
+
+class ProductImportResponse(BaseModel):
+    created: int
+    rejected: list[ProductImportRejection]
+
+
+class ProductExportRow(TypedDict):
+    id: uuid.UUID
+    name: str
+    description: str | None
+    price: Decimal
+    stock: int
+    category_id: uuid.UUID
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+product_export_row_adapter = TypeAdapter(ProductExportRow)
+
+
+class InventoryChange(BaseModel):
+    # Absolute (`stock`, `price`) or relative (`stock_delta`, `price_delta`)
+    # values; at most one of each pair.
+    product_id: uuid.UUID
+    stock: int | None = Field(default=None, ge=0)
+    stock_delta: int | None = Field(default=None, ge=-(2**31 - 1), le=2**31 - 1)
+    price: Decimal | None = Field(default=None, gt=0, max_digits=10, decimal_places=2)
+    price_delta: Decimal | None = Field(default=None, max_digits=10, decimal_places=2)
+
+    @model_validator(mode="after")
+    def check_changes(self):
+        if self.stock is not None and self.stock_delta is not None:
+            raise ValueError("Set either stock or stock_delta, not both")
+        if self.price is not None and self.price_delta is not None:
+            raise ValueError("Set either price or price_delta, not both")
+        if all(
+            value is None
+            for value in (self.stock, self.stock_delta, self.price, self.price_delta)
+        ):
+            raise ValueError("Set at least one of stock, stock_delta, price, price_delta")
+        return self
+
+
+class InventoryBulkUpdate(BaseModel):
+    items: list[InventoryChange] = Field(min_length=1, max_length=10000)
+
+
+class InventoryRejection(BaseModel):
+    product_id: uuid.UUID
+    error: str
+    detail: str
+
+
+class InventoryBulkResponse(BaseModel):
+    updated: list[uuid.UUID]
+    rejected: list[InventoryRejection]
@@ -9,6 +9,7 @@ class ProductImageResponse(BaseModel):
     image_url: str
     is_primary: bool
     sort_order: int
+    variants: dict[str, dict[str, str]] = {}
     created_at: datetime
 
     model_config = {"from_attributes": True}
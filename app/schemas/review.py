@@ -21,8 +21,13 @@ class ReviewResponse(BaseModel):
 
 class ReviewListResponse(BaseModel):
     items: list[ReviewResponse]
-    page: int
     size: int
     total: int
     average_rating: float
     review_count: int
+    # Number of reviews per star rating, 1 to 5.
+    rating_histogram: dict[int, int]
+    # Pass as `cursor` to fetch the next page; None on the last page.
+    next_cursor: str | None = None
+    # Only set for the deprecated `page` parameter.
+    page: int | None = None
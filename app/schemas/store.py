@@ -6,13 +6,11 @@ from pydantic import BaseModel, Field
 class StoreCreate(BaseModel):
     name: str = Field(min_length=1, max_length=255)
     description: str | None = Field(default=None, max_length=500)
-    product_count: int = Field(default=0, ge=0)
 
 
 class StoreUpdate(BaseModel):
     name: str | None = Field(default=None, min_length=1, max_length=255)
     description: str | None = Field(default=None, max_length=500)
-    product_count: int | None = Field(default=None, ge=0)
 
 
 class StoreStatusUpdate(BaseModel):
@@ -34,7 +32,7 @@ class StoreResponse(BaseModel):
     is_active: bool
     owner_id: uuid.UUID
     owner: StoreOwnerInfo
-    product_count: int
+    product_count: int  # active products, maintained by ProductRepository
 
     model_config = {"from_attributes": True}
 
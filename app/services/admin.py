@@ -0,0 +1,20 @@
+from app.exceptions import NotFoundException
+from app.repositories.platform_stats import PlatformStatsRepository
+from app.schemas.admin import PlatformStatsResponse
+
+
+class AdminService:
+    def __init__(self, platform_stats_repo: PlatformStatsRepository):
+        self.platform_stats_repo = platform_stats_repo
+
+    async def get_platform_stats(self) -> PlatformStatsResponse:
+        """The latest background-computed snapshot; never aggregates live."""
+        snapshot = await self.platform_stats_repo.get_snapshot()
+        if not snapshot:
+            raise NotFoundException(
+                detail="Platform stats have not been computed yet",
+                error_code="PLATFORM_STATS_NOT_READY",
+            )
+        return PlatformStatsResponse.model_validate(
+            {**snapshot.stats, "computed_at": snapshot.computed_at}
+        )
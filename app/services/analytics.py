@@ -0,0 +1,89 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from app.exceptions import BadRequestException, NotFoundException
+from app.models.user import User
+from app.repositories.sales import SalesRollupRepository
+from app.repositories.store import StoreRepository
+from app.schemas.analytics import (
+    DailySales,
+    ProductSales,
+    SalesAnalyticsResponse,
+    SalesTotals,
+)
+
+DEFAULT_SALES_WINDOW_DAYS = 30
+MAX_SALES_WINDOW_DAYS = 366
+
+
+class AnalyticsService:
+    def __init__(self, store_repo: StoreRepository, sales_repo: SalesRollupRepository):
+        self.store_repo = store_repo
+        self.sales_repo = sales_repo
+
+    async def get_vendor_sales(
+        self,
+        user: User,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        top: int = 10,
+    ) -> SalesAnalyticsResponse:
+        """
+        Units, revenue and orders per day and for the best-selling products
+        of the vendor's store, read from the daily rollups. Days are UTC;
+        the default range is the last 30 days.
+        """
+        store = await self.store_repo.get_by_owner_id(user.id)
+        if not store:
+            raise NotFoundException(
+                detail="Vendor store not found",
+                error_code="VENDOR_STORE_NOT_FOUND",
+            )
+
+        if date_to is None:
+            date_to = datetime.now(timezone.utc).date()
+        if date_from is None:
+            date_from = date_to - timedelta(days=DEFAULT_SALES_WINDOW_DAYS - 1)
+        if date_from > date_to:
+            raise BadRequestException(
+                detail="date_from must not be after date_to",
+                error_code="INVALID_DATE_RANGE",
+            )
+        if (date_to - date_from).days >= MAX_SALES_WINDOW_DAYS:
+            raise BadRequestException(
+                detail=f"Date range cannot exceed {MAX_SALES_WINDOW_DAYS} days",
+                error_code="INVALID_DATE_RANGE",
+            )
+
+        rows = {
+            row["day"]: row
+            for row in await self.sales_repo.get_store_daily(store.id, date_from, date_to)
+        }
+        daily = []
+        day = date_from
+        while day <= date_to:
+            row = rows.get(day)
+            daily.append(
+                DailySales(
+                    day=day,
+                    units=row["units"] if row else 0,
+                    revenue=row["revenue"] if row else Decimal("0.00"),
+                    order_count=row["order_count"] if row else 0,
+                )
+            )
+            day += timedelta(days=1)
+
+        top_products = await self.sales_repo.get_top_products(
+            store.id, date_from, date_to, limit=top
+        )
+        return SalesAnalyticsResponse(
+            date_from=date_from,
+            date_to=date_to,
+            totals=SalesTotals(
+                units=sum(item.units for item in daily),
+                revenue=sum((item.revenue for item in daily), Decimal("0.00")),
+                order_count=sum(item.order_count for item in daily),
+            ),
+            daily=daily,
+            top_products=[ProductSales(**row) for row in top_products],
+        )
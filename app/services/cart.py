@@ -1,32 +1,27 @@
 import uuid
 from decimal import Decimal
 
-from app.exceptions import BadRequestException, NotFoundException
+from app.exceptions import AppException, BadRequestException, NotFoundException
 from app.models.user import User
-from app.repositories.cart import CartRepository
-from app.repositories.product import ProductRepository
-from app.schemas.cart import CartItemResponse, CartResponse
+from app.repositories.cart import CartStore
+from app.schemas.cart import (
+    CartBulkResponse,
+    CartItemResponse,
+    CartLineRejection,
+    CartResponse,
+)
 
 
 class CartService:
-    def __init__(self, cart_repo: CartRepository, product_repo: ProductRepository):
+    def __init__(self, cart_repo: CartStore):
         self.cart_repo = cart_repo
-        self.product_repo = product_repo
-
-    def _get_primary_image(self, product) -> str | None:
-        if not product.images:
-            return None
-        primary = next((img for img in product.images if img.is_primary), None)
-        if primary:
-            return primary.image_url
-        return product.images[0].image_url
-
-    def _is_available(self, product, quantity: int) -> bool:
-        if not product.is_active:
+
+    def _is_available(self, is_active: bool, stock: int, quantity: int) -> bool:
+        if not is_active:
             return False
-        if product.stock <= 0:
+        if stock <= 0:
             return False
-        if quantity > product.stock:
+        if quantity > stock:
             return False
         return True
 
@@ -37,42 +32,71 @@ class CartService:
                 error_code="INVALID_QUANTITY",
             )
 
-        product = await self.product_repo.get_by_id(product_id, include_inactive=True)
-        if not product:
-            raise NotFoundException(
-                detail="Product not found",
-                error_code="PRODUCT_NOT_FOUND",
-            )
-
-        if not product.is_active:
-            raise BadRequestException(
-                detail="Cannot add inactive product to cart",
-                error_code="PRODUCT_INACTIVE",
-            )
-
-        cart_item = await self.cart_repo.get_cart_item(user.id, product_id)
-        target_quantity = quantity if not cart_item else cart_item.quantity + quantity
-
-        if target_quantity > product.stock:
-            raise BadRequestException(
-                detail="Requested quantity exceeds available stock",
-                error_code="INSUFFICIENT_STOCK",
-            )
-
-        if cart_item:
-            await self.cart_repo.update_cart_item_quantity(cart_item, target_quantity)
-            return
-
-        await self.cart_repo.create_cart_item(user.id, product_id, quantity)
+        written = await self.cart_repo.upsert_cart_items(user.id, {product_id: quantity})
+        if product_id not in written:
+            rejections = await self._explain_rejections(user, [product_id])
+            raise rejections[product_id]
+
+    async def bulk_update(
+        self,
+        user: User,
+        lines: list[tuple[uuid.UUID, int]],
+        replace: bool = False,
+    ) -> CartBulkResponse:
+        # One statement cannot touch the same row twice, so merge repeats:
+        # quantities add up in add mode, the last one wins in replace mode.
+        merged: dict[uuid.UUID, int] = {}
+        for product_id, quantity in lines:
+            if quantity <= 0:
+                raise BadRequestException(
+                    detail="Quantity must be greater than 0",
+                    error_code="INVALID_QUANTITY",
+                )
+            merged[product_id] = quantity if replace else merged.get(product_id, 0) + quantity
+
+        written = await self.cart_repo.upsert_cart_items(user.id, merged, replace=replace)
+        skipped = [product_id for product_id in merged if product_id not in written]
+        rejections = await self._explain_rejections(user, skipped) if skipped else {}
+
+        return CartBulkResponse(
+            updated=[product_id for product_id in merged if product_id in written],
+            rejected=[
+                CartLineRejection(
+                    product_id=product_id,
+                    error=exc.error_code,
+                    detail=exc.detail,
+                )
+                for product_id, exc in rejections.items()
+            ],
+        )
+
+    async def _explain_rejections(
+        self,
+        user: User,
+        product_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, AppException]:
+        # Only runs when a write was skipped, so the happy path stays one query.
+        states = await self.cart_repo.get_line_states(user.id, product_ids)
+        rejections: dict[uuid.UUID, AppException] = {}
+        for product_id, state in states.items():
+            if not state.product_exists:
+                rejections[product_id] = NotFoundException(
+                    detail="Product not found",
+                    error_code="PRODUCT_NOT_FOUND",
+                )
+            elif not state.is_active:
+                rejections[product_id] = BadRequestException(
+                    detail="Cannot add inactive product to cart",
+                    error_code="PRODUCT_INACTIVE",
+                )
+            else:
+                rejections[product_id] = BadRequestException(
+                    detail="Requested quantity exceeds available stock",
+                    error_code="INSUFFICIENT_STOCK",
+                )
+        return rejections
 
     async def update_item(self, user: User, product_id: uuid.UUID, quantity: int) -> None:
-        cart_item = await self.cart_repo.get_cart_item(user.id, product_id)
-        if not cart_item:
-            raise NotFoundException(
-                detail="Cart item not found",
-                error_code="CART_ITEM_NOT_FOUND",
-            )
-
         if quantity < 0:
             raise BadRequestException(
                 detail="Quantity must be 0 or greater",
@@ -80,59 +104,56 @@ class CartService:
             )
 
         if quantity == 0:
-            await self.cart_repo.delete_cart_item(cart_item)
+            await self.remove_item(user, product_id)
             return
 
-        product = cart_item.product
-        if not product:
-            raise NotFoundException(
-                detail="Product not found",
-                error_code="PRODUCT_NOT_FOUND",
-            )
+        updated = await self.cart_repo.set_cart_item_quantity(user.id, product_id, quantity)
+        if updated:
+            return
 
-        if quantity > product.stock:
-            raise BadRequestException(
-                detail="Requested quantity exceeds available stock",
-                error_code="INSUFFICIENT_STOCK",
+        states = await self.cart_repo.get_line_states(user.id, [product_id])
+        if states[product_id].cart_quantity is None:
+            raise NotFoundException(
+                detail="Cart item not found",
+                error_code="CART_ITEM_NOT_FOUND",
             )
-
-        await self.cart_repo.update_cart_item_quantity(cart_item, quantity)
+        raise BadRequestException(
+            detail="Requested quantity exceeds available stock",
+            error_code="INSUFFICIENT_STOCK",
+        )
 
     async def remove_item(self, user: User, product_id: uuid.UUID) -> None:
-        cart_item = await self.cart_repo.get_cart_item(user.id, product_id)
-        if not cart_item:
+        deleted = await self.cart_repo.delete_cart_item(user.id, product_id)
+        if not deleted:
             raise NotFoundException(
                 detail="Cart item not found",
                 error_code="CART_ITEM_NOT_FOUND",
             )
-        await self.cart_repo.delete_cart_item(cart_item)
 
     async def clear_cart(self, user: User) -> None:
         await self.cart_repo.clear_cart(user.id)
 
     async def get_cart(self, user: User) -> CartResponse:
-        cart_items = await self.cart_repo.get_cart_items(user.id)
+        cart_lines = await self.cart_repo.get_cart_lines(user.id)
 
         items: list[CartItemResponse] = []
         cart_total = Decimal("0")
 
-        for cart_item in cart_items:
-            product = cart_item.product
-            if not product:
-                continue
-
-            line_subtotal = product.price * cart_item.quantity
+        for line in cart_lines:
+            line_subtotal = line["product_price"] * line["quantity"]
             cart_total += line_subtotal
 
             items.append(
                 CartItemResponse(
-                    product_id=product.id,
-                    product_name=product.name,
-                    product_price=product.price,
-                    product_image=self._get_primary_image(product),
-                    quantity=cart_item.quantity,
+                    product_id=line["product_id"],
+                    product_name=line["product_name"],
+                    product_price=line["product_price"],
+                    product_image=line["product_image"],
+                    quantity=line["quantity"],
                     line_subtotal=line_subtotal,
-                    available=self._is_available(product, cart_item.quantity),
+                    available=self._is_available(
+                        line["is_active"], line["stock"], line["quantity"]
+                    ),
                 )
             )
 
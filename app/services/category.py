@@ -1,17 +1,45 @@
 import re
 import uuid
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
 
-from app.exceptions import BadRequestException, ConflictException, NotFoundException
+from sqlalchemy.exc import IntegrityError
+
+from app.exceptions import (
+    AppException,
+    BadRequestException,
+    ConflictException,
+    NotFoundException,
+)
 from app.models.category import Category
 from app.repositories.category import CategoryRepository
-from app.schemas.category import CategoryCreate, CategoryResponse, CategoryUpdate
+from app.repositories.category_cache import CachedCategory, CachedCategoryRepository
+from app.schemas.category import (
+    CategoryBulkResponse,
+    CategoryCreate,
+    CategoryImportRejection,
+    CategoryResponse,
+    CategoryUpdate,
+)
+
+T = TypeVar("T")
+
+# Allocation is retried when a concurrent write takes the same slug.
+SLUG_ALLOCATION_ATTEMPTS = 3
 
 
 class CategoryService:
-    def __init__(self, category_repo: CategoryRepository):
+    def __init__(
+        self,
+        category_repo: CategoryRepository,
+        category_cache: CachedCategoryRepository,
+    ):
         self.category_repo = category_repo
+        self.category_cache = category_cache
 
-    def _to_category_response(self, category: Category) -> CategoryResponse:
+    def _to_category_response(
+        self, category: Category | CachedCategory
+    ) -> CategoryResponse:
         return CategoryResponse(
             id=category.id,
             name=category.name,
@@ -31,27 +59,58 @@ class CategoryService:
             )
         return slug
 
+    async def _allocate_slugs(
+        self,
+        names: list[str],
+        exclude_category_id: uuid.UUID | None = None,
+    ) -> list[str]:
+        """
+        Unique slugs for `names`, in order: the bare slug when free, else the
+        next suffix after the highest in use (`garden`, `garden-1`, ...).
+        One query for the whole batch.
+        """
+        bases = [self._slugify(name) for name in names]
+        usage = await self.category_repo.get_slug_usage(bases, exclude_category_id)
+
+        slugs: list[str] = []
+        allocated: set[str] = set()
+        for base in bases:
+            base_taken, last_suffix = usage.get(base, (False, 0))
+            slug = base
+            if base_taken or slug in allocated:
+                # Skip suffixes another base in this batch already produced,
+                # e.g. "item-1" requested alongside a second "item".
+                last_suffix += 1
+                slug = f"{base}-{last_suffix}"
+                while slug in allocated:
+                    last_suffix += 1
+                    slug = f"{base}-{last_suffix}"
+            usage[base] = (True, last_suffix)
+            allocated.add(slug)
+            slugs.append(slug)
+        return slugs
+
     async def _generate_unique_slug(
         self,
         name: str,
         exclude_category_id: uuid.UUID | None = None,
     ) -> str:
-        base_slug = self._slugify(name)
-        slug = base_slug
-        suffix = 1
-
-        while True:
-            existing = await self.category_repo.get_by_slug(slug)
-            if not existing or (
-                exclude_category_id is not None and existing.id == exclude_category_id
-            ):
-                break
-            slug = f"{base_slug}-{suffix}"
-            suffix += 1
+        return (await self._allocate_slugs([name], exclude_category_id))[0]
 
-        return slug
+    async def _retry_slug_race(self, write: Callable[[], Awaitable[T]]) -> T:
+        # A concurrent write can take the allocated slug between allocation
+        # and commit; the unique constraint catches it and we allocate again.
+        for _ in range(SLUG_ALLOCATION_ATTEMPTS):
+            try:
+                return await write()
+            except IntegrityError:
+                await self.category_repo.db.rollback()
+        raise ConflictException(
+            detail="Could not allocate a unique category slug",
+            error_code="CATEGORY_SLUG_CONFLICT",
+        )
 
-    async def create_category(self, data: CategoryCreate) -> CategoryResponse:
+    async def _create_category(self, data: CategoryCreate) -> Category:
         existing = await self.category_repo.get_by_name(data.name)
         if existing:
             raise ConflictException(
@@ -60,7 +119,7 @@ class CategoryService:
             )
 
         slug = await self._generate_unique_slug(data.name)
-        category = await self.category_repo.create(
+        return await self.category_repo.create(
             {
                 "name": data.name,
                 "slug": slug,
@@ -68,13 +127,103 @@ class CategoryService:
                 "is_active": data.is_active,
             }
         )
+
+    async def create_category(self, data: CategoryCreate) -> CategoryResponse:
+        category = await self._retry_slug_race(lambda: self._create_category(data))
+        await self.category_cache.bump_version()
         return self._to_category_response(category)
 
-    async def update_category(
+    async def import_categories(self, items: list[CategoryCreate]) -> CategoryBulkResponse:
+        """
+        Create many categories at once. Names that already exist, repeat an
+        earlier item or produce no slug are rejected; the rest are inserted
+        in one statement with slugs from one allocation query.
+        """
+        rejected: list[CategoryImportRejection] = []
+
+        def reject(name: str, exc: AppException) -> None:
+            rejected.append(
+                CategoryImportRejection(name=name, error=exc.error_code, detail=exc.detail)
+            )
+
+        pending: dict[str, CategoryCreate] = {}
+        for item in items:
+            if item.name in pending:
+                reject(
+                    item.name,
+                    BadRequestException(
+                        detail="Category name is repeated in this import",
+                        error_code="CATEGORY_NAME_REPEATED",
+                    ),
+                )
+                continue
+            try:
+                self._slugify(item.name)
+            except BadRequestException as exc:
+                reject(item.name, exc)
+                continue
+            pending[item.name] = item
+
+        created: list[Category] = []
+        for _ in range(SLUG_ALLOCATION_ATTEMPTS):
+            for name in await self.category_repo.get_existing_names(pending):
+                del pending[name]
+                reject(
+                    name,
+                    ConflictException(
+                        detail="Category name is already in use",
+                        error_code="CATEGORY_NAME_NOT_UNIQUE",
+                    ),
+                )
+            if not pending:
+                break
+
+            names = list(pending)
+            slugs = await self._allocate_slugs(names)
+            # Rows that lost a race on name or slug are skipped by the insert
+            # and go around again.
+            inserted = await self.category_repo.create_many(
+                [
+                    {
+                        "name": name,
+                        "slug": slug,
+                        "description": pending[name].description,
+                        "is_active": pending[name].is_active,
+                    }
+                    for name, slug in zip(names, slugs)
+                ]
+            )
+            for category in inserted:
+                del pending[category.name]
+            created.extend(inserted)
+
+        for name in pending:
+            reject(
+                name,
+                ConflictException(
+                    detail="Could not allocate a unique category slug",
+                    error_code="CATEGORY_SLUG_CONFLICT",
+                ),
+            )
+        if created:
+            await self.category_cache.bump_version()
+
+        order: dict[str, int] = {}
+        for position, item in enumerate(items):
+            order.setdefault(item.name, position)
+        return CategoryBulkResponse(
+            created=[
+                self._to_category_response(category)
+                for category in sorted(created, key=lambda category: order[category.name])
+            ],
+            rejected=rejected,
+        )
+
+    async def _update_category(
         self,
         category_id: uuid.UUID,
         data: CategoryUpdate,
-    ) -> CategoryResponse:
+    ) -> Category:
         category = await self.category_repo.get_by_id(category_id)
         if not category:
             raise NotFoundException(
@@ -84,7 +233,7 @@ class CategoryService:
 
         update_data = data.model_dump(exclude_unset=True)
         if not update_data:
-            return self._to_category_response(category)
+            return category
 
         new_name = update_data.get("name")
         if new_name and new_name != category.name:
@@ -99,15 +248,26 @@ class CategoryService:
                 exclude_category_id=category.id,
             )
 
-        updated = await self.category_repo.update(category, update_data)
+        return await self.category_repo.update(category, update_data)
+
+    async def update_category(
+        self,
+        category_id: uuid.UUID,
+        data: CategoryUpdate,
+    ) -> CategoryResponse:
+        updated = await self._retry_slug_race(
+            lambda: self._update_category(category_id, data)
+        )
+        if data.model_fields_set:
+            await self.category_cache.bump_version()
         return self._to_category_response(updated)
 
     async def list_categories(self) -> list[CategoryResponse]:
-        categories = await self.category_repo.list_active()
+        categories = await self.category_cache.list_active()
         return [self._to_category_response(category) for category in categories]
 
     async def get_category(self, category_id: uuid.UUID) -> CategoryResponse:
-        category = await self.category_repo.get_by_id(category_id)
+        category = await self.category_cache.get_by_id(category_id)
         if not category:
             raise NotFoundException(
                 detail="Category not found",
@@ -124,3 +284,4 @@ class CategoryService:
             )
 
         await self.category_repo.delete(category)
+        await self.category_cache.bump_version()
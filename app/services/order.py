@@ -1,18 +1,19 @@
 import logging
 import random
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from decimal import Decimal
 
 from app.websockets.manager import connection_manager
-from sqlalchemy import delete, select
+from sqlalchemy import select
 
 from app.exceptions import BadRequestException, ForbiddenException, NotFoundException
 from app.models.address import Address
-from app.models.cart_item import CartItem
+from app.models.order import OrderStatus
 from app.models.product import Product
 from app.models.user import User
-from app.repositories.cart import CartRepository
+from app.repositories.cart import CartStore
 from app.repositories.order import OrderItemRepository, OrderRepository
 from app.repositories.store import StoreRepository
 from app.schemas.order import (
@@ -20,19 +21,23 @@ from app.schemas.order import (
     OrderItemResponse,
     OrderResponse,
     ShippingAddressResponse,
+    VendorOrderExportRow,
     VendorOrderItemResponse,
+    vendor_order_export_row_adapter,
 )
 from app.schemas.pagination import PaginatedResponse
 from app.tasks.email import send_order_confirmation, send_status_update
-
-VALID_ORDER_STATUSES = {"pending", "confirmed", "shipped", "delivered", "cancelled"}
-VALID_TRANSITIONS = {
-    "pending": {"confirmed", "cancelled"},
-    "confirmed": {"shipped", "cancelled"},
-    "shipped": {"delivered"},
-    "delivered": set(),
-    "cancelled": set(),
+from app.utils.file_export import FileFormat, encode_rows
+
+VALID_TRANSITIONS: dict[OrderStatus, set[OrderStatus]] = {
+    OrderStatus.PENDING: {OrderStatus.CONFIRMED, OrderStatus.CANCELLED},
+    OrderStatus.CONFIRMED: {OrderStatus.SHIPPED, OrderStatus.CANCELLED},
+    OrderStatus.SHIPPED: {OrderStatus.DELIVERED},
+    OrderStatus.DELIVERED: set(),
+    OrderStatus.CANCELLED: set(),
 }
+VENDOR_ORDER_EXPORT_COLUMNS = tuple(VendorOrderExportRow.__annotations__)
+VENDOR_ORDER_EXPORT_BATCH_SIZE = 1000
 logger = logging.getLogger(__name__)
 
 
@@ -66,7 +71,7 @@ class OrderService:
         self,
         order_repo: OrderRepository,
         order_item_repo: OrderItemRepository,
-        cart_repo: CartRepository,
+        cart_repo: CartStore,
         store_repo: StoreRepository,
     ):
         self.order_repo = order_repo
@@ -88,16 +93,19 @@ class OrderService:
             error_code="ORDER_NUMBER_GENERATION_FAILED",
         )
 
-    def _validate_transition(self, current: str, target: str) -> None:
-        if target not in VALID_ORDER_STATUSES:
+    def _parse_status(self, value: str) -> OrderStatus:
+        try:
+            return OrderStatus(value)
+        except ValueError:
             raise BadRequestException(
                 detail="Invalid status",
                 error_code="INVALID_STATUS",
-            )
+            ) from None
 
-        if target not in VALID_TRANSITIONS.get(current, set()):
+    def _validate_transition(self, current: OrderStatus, target: OrderStatus) -> None:
+        if target not in VALID_TRANSITIONS[current]:
             raise BadRequestException(
-                detail=f"Invalid status transition: {current} -> {target}",
+                detail=f"Invalid status transition: {current.value} -> {target.value}",
                 error_code="INVALID_STATUS_TRANSITION",
             )
 
@@ -165,7 +173,7 @@ class OrderService:
                         "quantity": cart_item.quantity,
                         "unit_price": unit_price,
                         "subtotal": subtotal,
-                        "status": "pending",
+                        "status": OrderStatus.PENDING,
                     }
                 )
 
@@ -182,11 +190,12 @@ class OrderService:
                 payload["order_id"] = order.id
 
             await self.order_item_repo.create_order_items(order_items_payload)
-            await self.db.execute(delete(CartItem).where(CartItem.user_id == user.id))
+            await self.cart_repo.clear_cart(user.id, commit=False)
             await self.db.commit()
         except Exception:
             await self.db.rollback()
             raise
+        await self.cart_repo.clear_cached_cart(user.id)
 
         order = await self.order_repo.get_order_by_id(order.id)
         order_response = self._to_order_detail_response(order)
@@ -211,7 +220,7 @@ class OrderService:
             user_id=user.id,
             page=page,
             size=size,
-            status=status,
+            status=self._parse_status(status) if status is not None else None,
         )
         items = [
             OrderResponse(
@@ -280,6 +289,54 @@ class OrderService:
             size=size,
         )
 
+    async def export_vendor_orders(
+        self,
+        user: User,
+        file_format: FileFormat,
+        status: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        The vendor's order items as CSV or NDJSON chunks for a
+        StreamingResponse, read with a server-side cursor so memory stays
+        flat however many items match. Validation runs before the first
+        chunk, so errors are still regular error responses.
+        """
+        store = await self.store_repo.get_by_owner_id(user.id)
+        if not store:
+            raise NotFoundException(
+                detail="Vendor store not found",
+                error_code="VENDOR_STORE_NOT_FOUND",
+            )
+        item_status = self._parse_status(status) if status is not None else None
+        # Naive bounds are taken as UTC so they compare with aware ones.
+        created_from, created_to = (
+            bound.replace(tzinfo=timezone.utc)
+            if bound is not None and bound.tzinfo is None
+            else bound
+            for bound in (created_from, created_to)
+        )
+        if created_from and created_to and created_from >= created_to:
+            raise BadRequestException(
+                detail="created_from must be before created_to",
+                error_code="INVALID_DATE_RANGE",
+            )
+
+        return encode_rows(
+            self.order_item_repo.stream_vendor_order_items(
+                store_id=store.id,
+                status=item_status,
+                created_from=created_from,
+                created_to=created_to,
+                batch_size=VENDOR_ORDER_EXPORT_BATCH_SIZE,
+            ),
+            VENDOR_ORDER_EXPORT_COLUMNS,
+            file_format,
+            vendor_order_export_row_adapter,
+            batch_size=VENDOR_ORDER_EXPORT_BATCH_SIZE,
+        )
+
     async def update_vendor_order_item_status(
         self,
         user: User,
@@ -294,7 +351,9 @@ class OrderService:
             )
 
         try:
-            order_item = await self.order_item_repo.get_order_item_by_id(order_item_id)
+            order_item = await self.order_item_repo.get_order_item_by_id(
+                order_item_id, for_update=True
+            )
             if not order_item:
                 raise NotFoundException(
                     detail="Order item not found",
@@ -307,24 +366,19 @@ class OrderService:
                     error_code="ORDER_ITEM_FORBIDDEN",
                 )
 
-            self._validate_transition(order_item.status, status)
-            await self.order_item_repo.update_item_status(order_item, status)
+            target = self._parse_status(status)
+            self._validate_transition(order_item.status, target)
+            await self.order_item_repo.update_item_status(order_item, target)
 
             sibling_items = await self.order_item_repo.get_order_items_by_order_id(
                 order_item.order_id
             )
-            if sibling_items and all(item.status == status for item in sibling_items):
+            if sibling_items and all(item.status == target for item in sibling_items):
                 order = await self.order_repo.get_order_by_id(order_item.order_id)
-                if (
-                    order
-                    and order.status in VALID_TRANSITIONS
-                    and status in VALID_ORDER_STATUSES
+                if order and (
+                    target in VALID_TRANSITIONS[order.status] or order.status == target
                 ):
-                    if (
-                        status in VALID_TRANSITIONS.get(order.status, set())
-                        or order.status == status
-                    ):
-                        await self.order_repo.update_order_status(order, status)
+                    await self.order_repo.update_order_status(order, target)
             await self.db.commit()
         except Exception:
             await self.db.rollback()
@@ -335,23 +389,23 @@ class OrderService:
             send_status_update.delay(
                 str(order_item.order.id),
                 order_item.order.user.email,
-                order_item.status,
+                order_item.status.value,
             )
         except Exception:
             logger.exception(
                 "Failed to enqueue send_status_update order_id=%s user_email=%s status=%s",
                 order_item.order.id,
                 order_item.order.user.email,
-                order_item.status,
+                order_item.status.value,
             )
         await connection_manager.send_to_user(
             str(order_item.order.user.id),
             {
                 "order_id": str(order_item.order.id),
-                "status": order_item.status,
+                "status": order_item.status.value,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "message": (
-                    f"Your order status has been updated to {order_item.status.upper()}"
+                    f"Your order status has been updated to {order_item.status.value.upper()}"
                 ),
             },
         )
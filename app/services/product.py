@@ -1,20 +1,59 @@
+import math
 import uuid
+from collections.abc import AsyncIterable, AsyncIterator
 from decimal import Decimal
 
-from app.exceptions import ForbiddenException, NotFoundException
+from pydantic import ValidationError
+
+from app.config import get_settings
+from app.exceptions import (
+    AppException,
+    BadRequestException,
+    ForbiddenException,
+    NotFoundException,
+)
 from app.models.product import Product
 from app.models.user import User
-from app.repositories.category import CategoryRepository
-from app.repositories.product import ProductRepository
-from app.repositories.review import ReviewRepository
+from app.repositories.category_cache import CachedCategoryRepository
+from app.repositories.product import MAX_PRICE, MAX_STOCK, ProductRepository
+from app.repositories.review import rating_histogram
 from app.repositories.store import StoreRepository
 from app.schemas.pagination import PaginatedResponse
 from app.schemas.product import (
+    FacetValue,
+    InventoryBulkResponse,
+    InventoryChange,
+    InventoryRejection,
     ProductCreate,
+    PriceBucketFacet,
+    ProductCard,
+    ProductFacetsResponse,
+    ProductImportRejection,
+    ProductImportResponse,
     ProductListResponse,
     ProductResponse,
     ProductUpdate,
+    product_card_page_adapter,
+    product_export_row_adapter,
 )
+from app.utils.file_export import FileFormat, encode_rows
+from app.utils.image_utils import select_variant_url
+from app.utils.product_io import EXPORT_COLUMNS, ImportFormatError, iter_import_records
+
+settings = get_settings()
+
+# Rows validated and inserted per transaction during a bulk import.
+IMPORT_CHUNK_SIZE = 500
+EXPORT_BATCH_SIZE = 1000
+# Products changed per UPDATE ... FROM (VALUES ...) statement.
+INVENTORY_CHUNK_SIZE = 1000
+
+
+def _describe_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
 
 
 class ProductService:
@@ -22,18 +61,13 @@ class ProductService:
         self,
         product_repo: ProductRepository,
         store_repo: StoreRepository,
-        category_repo: CategoryRepository,
-        review_repo: ReviewRepository,
+        category_repo: CachedCategoryRepository,
     ):
         self.product_repo = product_repo
         self.store_repo = store_repo
         self.category_repo = category_repo
-        self.review_repo = review_repo
 
-    async def _to_product_response(self, product: Product) -> ProductResponse:
-        average_rating, review_count = await self.review_repo.get_review_aggregates(
-            product.id
-        )
+    def _to_product_response(self, product: Product) -> ProductResponse:
         return ProductResponse(
             id=product.id,
             name=product.name,
@@ -44,16 +78,33 @@ class ProductService:
             store=product.store,
             category=product.category,
             images=product.images,
-            average_rating=average_rating,
-            review_count=review_count,
+            average_rating=round(float(product.average_rating), 1),
+            review_count=product.review_count,
+            rating_histogram=rating_histogram(product),
             created_at=product.created_at,
             updated_at=product.updated_at,
         )
 
-    async def _to_product_list_response(self, product: Product) -> ProductListResponse:
-        average_rating, review_count = await self.review_repo.get_review_aggregates(
-            product.id
+    def _get_thumbnail_url(
+        self,
+        primary_image_url: str | None,
+        primary_image_variants: dict[str, dict[str, str]],
+        image_width: int,
+    ) -> str | None:
+        if primary_image_url is None:
+            return None
+        return select_variant_url(
+            primary_image_url,
+            primary_image_variants,
+            image_width,
+            settings.IMAGE_VARIANT_FORMATS,
         )
+
+    def _to_product_list_response(
+        self,
+        product: Product,
+        image_width: int,
+    ) -> ProductListResponse:
         return ProductListResponse(
             id=product.id,
             name=product.name,
@@ -63,9 +114,15 @@ class ProductService:
             is_active=product.is_active,
             store=product.store,
             category=product.category,
-            images=product.images,
-            average_rating=average_rating,
-            review_count=review_count,
+            primary_image_url=product.primary_image_url,
+            image_count=product.image_count,
+            thumbnail_url=self._get_thumbnail_url(
+                product.primary_image_url,
+                product.primary_image_variants,
+                image_width,
+            ),
+            average_rating=round(float(product.average_rating), 1),
+            review_count=product.review_count,
             created_at=product.created_at,
             updated_at=product.updated_at,
         )
@@ -106,7 +163,109 @@ class ProductService:
         )
 
         product = await self.product_repo.get_by_id(product.id, include_inactive=True)
-        return await self._to_product_response(product)
+        return self._to_product_response(product)
+
+    async def import_products(
+        self,
+        current_user: User,
+        chunks: AsyncIterable[bytes],
+        file_format: FileFormat,
+    ) -> ProductImportResponse:
+        """
+        Create products in the vendor's store from a CSV or NDJSON stream.
+
+        Rows are parsed as they arrive and validated against ProductCreate;
+        every IMPORT_CHUNK_SIZE valid rows go in as one multi-row INSERT in
+        their own transaction. Invalid rows are reported, not inserted.
+        """
+        store = await self._get_vendor_store(current_user)
+        created = 0
+        rejected: list[ProductImportRejection] = []
+        batch: list[tuple[int, ProductCreate]] = []
+        try:
+            async for record in iter_import_records(chunks, file_format):
+                if record.error is not None:
+                    rejected.append(
+                        ProductImportRejection(
+                            row=record.row, error="INVALID_ROW", detail=record.error
+                        )
+                    )
+                    continue
+                try:
+                    batch.append((record.row, ProductCreate.model_validate(record.data)))
+                except ValidationError as exc:
+                    rejected.append(
+                        ProductImportRejection(
+                            row=record.row,
+                            error="INVALID_ROW",
+                            detail=_describe_validation_error(exc),
+                        )
+                    )
+                    continue
+                if len(batch) >= IMPORT_CHUNK_SIZE:
+                    created += await self._import_batch(store.id, batch, rejected)
+                    batch = []
+            created += await self._import_batch(store.id, batch, rejected)
+        except ImportFormatError as exc:
+            detail = str(exc)
+            if created:
+                detail += f" ({created} products were imported before the error)"
+            raise BadRequestException(detail=detail, error_code="INVALID_IMPORT_FILE")
+
+        rejected.sort(key=lambda rejection: rejection.row)
+        return ProductImportResponse(created=created, rejected=rejected)
+
+    async def _import_batch(
+        self,
+        store_id: uuid.UUID,
+        batch: list[tuple[int, ProductCreate]],
+        rejected: list[ProductImportRejection],
+    ) -> int:
+        if not batch:
+            return 0
+        categories = await self.category_repo.get_many(
+            {item.category_id for _, item in batch}
+        )
+        rows = []
+        for row, item in batch:
+            if item.category_id not in categories:
+                rejected.append(
+                    ProductImportRejection(
+                        row=row, error="CATEGORY_NOT_FOUND", detail="Category not found"
+                    )
+                )
+                continue
+            rows.append(
+                {
+                    "name": item.name,
+                    "description": item.description,
+                    "price": item.price,
+                    "stock": item.stock,
+                    "store_id": store_id,
+                    "category_id": item.category_id,
+                    "is_active": True,
+                }
+            )
+        return await self.product_repo.create_many(rows)
+
+    async def export_products(
+        self,
+        current_user: User,
+        file_format: FileFormat,
+    ) -> AsyncIterator[bytes]:
+        """
+        Every product in the vendor's store as CSV or NDJSON chunks, for a
+        StreamingResponse. The store is resolved up front so a missing one
+        fails before the response starts.
+        """
+        store = await self._get_vendor_store(current_user)
+        return encode_rows(
+            self.product_repo.stream_for_store(store.id, batch_size=EXPORT_BATCH_SIZE),
+            EXPORT_COLUMNS,
+            file_format,
+            product_export_row_adapter,
+            batch_size=EXPORT_BATCH_SIZE,
+        )
 
     async def list_products(
         self,
@@ -120,6 +279,8 @@ class ProductService:
         sort_by: str = "created_at",
         sort_order: str = "desc",
         include_inactive: bool = False,
+        min_rating: Decimal | None = None,
+        image_width: int = 400,
     ) -> PaginatedResponse[ProductListResponse]:
         items, total = await self.product_repo.list(
             page=page,
@@ -132,14 +293,103 @@ class ProductService:
             sort_by=sort_by,
             sort_order=sort_order,
             include_inactive=include_inactive,
+            min_rating=min_rating,
         )
         return PaginatedResponse[ProductListResponse](
-            items=[await self._to_product_list_response(item) for item in items],
+            items=[
+                self._to_product_list_response(item, image_width) for item in items
+            ],
             total=total,
             page=page,
             size=size,
         )
 
+    async def list_product_cards(
+        self,
+        page: int,
+        size: int,
+        category_id: uuid.UUID | None = None,
+        store_id: uuid.UUID | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        search: str | None = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        include_inactive: bool = False,
+        min_rating: Decimal | None = None,
+        image_width: int = 400,
+    ) -> bytes:
+        """Card view of the product list, already encoded as JSON."""
+        rows, total = await self.product_repo.list_cards(
+            page=page,
+            size=size,
+            category_id=category_id,
+            store_id=store_id,
+            min_price=min_price,
+            max_price=max_price,
+            search=search,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            include_inactive=include_inactive,
+            min_rating=min_rating,
+        )
+        cards: list[ProductCard] = [
+            {
+                "id": row["id"],
+                "name": row["name"],
+                "price": row["price"],
+                "in_stock": row["in_stock"],
+                "thumbnail_url": self._get_thumbnail_url(
+                    row["primary_image_url"],
+                    row["primary_image_variants"],
+                    image_width,
+                ),
+                "average_rating": round(float(row["average_rating"]), 1),
+                "review_count": row["review_count"],
+            }
+            for row in rows
+        ]
+        return product_card_page_adapter.dump_json(
+            {
+                "items": cards,
+                "total": total,
+                "page": page,
+                "size": size,
+                "pages": math.ceil(total / size) if size > 0 else 0,
+            }
+        )
+
+    async def get_facets(
+        self,
+        category_id: uuid.UUID | None = None,
+        store_id: uuid.UUID | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        search: str | None = None,
+    ) -> ProductFacetsResponse:
+        facets = await self.product_repo.get_facets(
+            category_id=category_id,
+            store_id=store_id,
+            min_price=min_price,
+            max_price=max_price,
+            search=search,
+        )
+        bounds = self.product_repo.price_buckets
+        upper_bounds = dict(zip(bounds, bounds[1:]))
+        return ProductFacetsResponse(
+            total=facets["total"],
+            categories=[FacetValue(**row) for row in facets["categories"]],
+            stores=[FacetValue(**row) for row in facets["stores"]],
+            price_buckets=[
+                PriceBucketFacet(
+                    min_price=row["price_bucket"],
+                    max_price=upper_bounds.get(row["price_bucket"]),
+                    count=row["count"],
+                )
+                for row in facets["price_buckets"]
+            ],
+        )
+
     async def get_product(
         self,
         product_id: uuid.UUID,
@@ -166,7 +416,7 @@ class ProductService:
                     error_code="PRODUCT_NOT_FOUND",
                 )
 
-        return await self._to_product_response(product)
+        return self._to_product_response(product)
 
     async def update_product(
         self,
@@ -199,11 +449,99 @@ class ProductService:
                 )
 
         if not update_data:
-            return await self._to_product_response(product)
+            return self._to_product_response(product)
 
         updated = await self.product_repo.update(product, update_data)
         updated = await self.product_repo.get_by_id(updated.id, include_inactive=True)
-        return await self._to_product_response(updated)
+        return self._to_product_response(updated)
+
+    async def update_inventory(
+        self,
+        current_user: User,
+        changes: list[InventoryChange],
+    ) -> InventoryBulkResponse:
+        """
+        Set or adjust stock and price for many of the vendor's products,
+        one set-based UPDATE per INVENTORY_CHUNK_SIZE changes.
+        """
+        store = await self._get_vendor_store(current_user)
+
+        # One statement cannot change the same row twice: the first change
+        # for a product applies, repeats are rejected.
+        unique: dict[uuid.UUID, InventoryChange] = {}
+        rejected: list[InventoryRejection] = []
+        for change in changes:
+            if change.product_id in unique:
+                rejected.append(
+                    InventoryRejection(
+                        product_id=change.product_id,
+                        error="PRODUCT_REPEATED",
+                        detail="Product appears more than once in the request",
+                    )
+                )
+            else:
+                unique[change.product_id] = change
+
+        pending = list(unique.values())
+        updated: set[uuid.UUID] = set()
+        for start in range(0, len(pending), INVENTORY_CHUNK_SIZE):
+            chunk = pending[start : start + INVENTORY_CHUNK_SIZE]
+            updated |= await self.product_repo.update_inventory(
+                store.id, [change.model_dump() for change in chunk]
+            )
+
+        skipped = [change for change in pending if change.product_id not in updated]
+        if skipped:
+            # Only runs when a change was skipped, so a clean sync stays one
+            # statement per chunk.
+            states = await self.product_repo.get_inventory_states(
+                [change.product_id for change in skipped]
+            )
+            for change in skipped:
+                exc = self._explain_inventory_rejection(
+                    store.id, change, states.get(change.product_id)
+                )
+                rejected.append(
+                    InventoryRejection(
+                        product_id=change.product_id,
+                        error=exc.error_code,
+                        detail=exc.detail,
+                    )
+                )
+
+        return InventoryBulkResponse(
+            updated=[product_id for product_id in unique if product_id in updated],
+            rejected=rejected,
+        )
+
+    @staticmethod
+    def _explain_inventory_rejection(
+        store_id: uuid.UUID,
+        change: InventoryChange,
+        state,
+    ) -> AppException:
+        if state is None:
+            return NotFoundException(
+                detail="Product not found",
+                error_code="PRODUCT_NOT_FOUND",
+            )
+        if state["store_id"] != store_id:
+            return ForbiddenException(
+                detail="You do not own this product",
+                error_code="PRODUCT_OWNERSHIP_REQUIRED",
+            )
+        stock = change.stock if change.stock is not None else state["stock"] + (
+            change.stock_delta or 0
+        )
+        if not 0 <= stock <= MAX_STOCK:
+            return BadRequestException(
+                detail=f"Resulting stock must be between 0 and {MAX_STOCK}",
+                error_code="INVALID_STOCK",
+            )
+        return BadRequestException(
+            detail=f"Resulting price must be greater than 0 and at most {MAX_PRICE}",
+            error_code="INVALID_PRICE",
+        )
 
     async def delete_product(
         self,
@@ -1,25 +1,47 @@
+import logging
 import uuid
 
 from fastapi import UploadFile
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
+from starlette.concurrency import run_in_threadpool
 
 from app.exceptions import BadRequestException, ForbiddenException, NotFoundException
 from app.models.product import Product
 from app.models.product_image import ProductImage
 from app.models.user import User
+from app.repositories.image_blob import ImageBlobRepository
+from app.repositories.product import ProductRepository
 from app.repositories.store import StoreRepository
 from app.schemas.product_image import ProductImageResponse
-from app.utils.file_utils import delete_file, save_file, validate_image
+from app.storage import StorageBackend, content_key
+from app.tasks.images import generate_image_variants
+from app.utils.file_utils import (
+    CONTENT_TYPE_TO_EXT,
+    UPLOAD_TEMP_DIR,
+    stream_upload,
+    validate_image,
+)
 
-UPLOAD_DIR = "uploads/products"
+PRODUCT_IMAGE_PREFIX = "products"
+logger = logging.getLogger(__name__)
 
 
 class ProductImageService:
-    def __init__(self, db: AsyncSession, store_repo: StoreRepository):
+    def __init__(
+        self,
+        db: AsyncSession,
+        store_repo: StoreRepository,
+        product_repo: ProductRepository,
+        blob_repo: ImageBlobRepository,
+        storage: StorageBackend,
+    ):
         self.db = db
         self.store_repo = store_repo
+        self.product_repo = product_repo
+        self.blob_repo = blob_repo
+        self.storage = storage
 
     async def _get_owned_product(self, product_id: uuid.UUID, current_user: User) -> Product:
         vendor_store = await self.store_repo.get_by_owner_id(current_user.id)
@@ -55,10 +77,30 @@ class ProductImageService:
     ) -> ProductImageResponse:
         await self._get_owned_product(product_id, current_user)
 
-        file_url = None
+        upload = None
+        stored_key = None
         try:
             validate_image(file)
-            file_url = save_file(file, UPLOAD_DIR)
+            upload = await stream_upload(file, UPLOAD_TEMP_DIR)
+            storage_key = content_key(
+                PRODUCT_IMAGE_PREFIX,
+                upload.content_hash,
+                CONTENT_TYPE_TO_EXT[file.content_type],
+            )
+
+            # Identical content is stored once; only the first reference
+            # writes the blob, later ones just bump the count.
+            created = await self.blob_repo.acquire(
+                content_hash=upload.content_hash,
+                storage_key=storage_key,
+                content_type=file.content_type,
+                size=upload.size,
+            )
+            if created:
+                await run_in_threadpool(
+                    self.storage.save, storage_key, upload.path, file.content_type
+                )
+                stored_key = storage_key
 
             if is_primary:
                 await self.db.execute(
@@ -69,27 +111,45 @@ class ProductImageService:
 
             image = ProductImage(
                 product_id=product_id,
-                image_url=file_url,
+                image_url=self.storage.url(storage_key),
+                content_hash=upload.content_hash,
+                file_size=upload.size,
                 is_primary=is_primary,
                 sort_order=sort_order,
             )
             self.db.add(image)
+            await self.product_repo.sync_image_summary(product_id)
             await self.db.commit()
             await self.db.refresh(image)
-            return ProductImageResponse.model_validate(image)
+            response = ProductImageResponse.model_validate(image)
         except ValueError as exc:
-            if file_url:
-                delete_file(file_url)
-            await self.db.rollback()
+            await self._discard_blob(stored_key)
             raise BadRequestException(
                 detail=str(exc),
                 error_code="INVALID_IMAGE_UPLOAD",
             )
         except Exception:
-            if file_url:
-                delete_file(file_url)
-            await self.db.rollback()
+            await self._discard_blob(stored_key)
             raise
+        finally:
+            if upload:
+                await run_in_threadpool(upload.path.unlink, missing_ok=True)
+
+        try:
+            generate_image_variants.delay(str(response.id))
+        except Exception:
+            logger.exception(
+                "Failed to enqueue generate_image_variants image_id=%s",
+                response.id,
+            )
+        return response
+
+    async def _discard_blob(self, stored_key: str | None) -> None:
+        # Remove a blob this upload created before rolling back: until then
+        # the new image_blobs row stays locked, so nobody else can claim it.
+        if stored_key:
+            await run_in_threadpool(self.storage.delete, stored_key)
+        await self.db.rollback()
 
     async def delete_image(self, image_id: uuid.UUID, current_user: User) -> None:
         vendor_store = await self.store_repo.get_by_owner_id(current_user.id)
@@ -117,8 +177,65 @@ class ProductImageService:
                 error_code="PRODUCT_OWNERSHIP_REQUIRED",
             )
 
+        product_id = image.product_id
         image_url = image.image_url
-        await self.db.delete(image)
-        await self.db.commit()
+        content_hash = image.content_hash
+        variant_urls = [
+            url for formats in image.variants.values() for url in formats.values()
+        ]
+
+        try:
+            await self.db.delete(image)
+            await self.product_repo.sync_image_summary(product_id)
+            remaining = (
+                await self.blob_repo.release(content_hash) if content_hash else None
+            )
 
-        delete_file(image_url)
+            # remaining is None for images stored before content addressing,
+            # which own their file outright.
+            stale_urls = []
+            if remaining is None:
+                stale_urls.append(image_url)
+                if not await self._content_hash_in_use(content_hash, image.id):
+                    stale_urls.extend(variant_urls)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        # Files are only removed once the rows no longer point at them. A
+        # shared blob goes with its last reference, under the lock taken by
+        # purge_unreferenced, so a concurrent upload of the same content
+        # cannot have its fresh copy deleted.
+        try:
+            if remaining == 0:
+                if await self.blob_repo.purge_unreferenced(content_hash):
+                    stale_urls.extend([image_url, *variant_urls])
+            await self._delete_stored(stale_urls)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            logger.exception("Failed to remove stored files for image_id=%s", image_id)
+
+    async def _delete_stored(self, urls: list[str]) -> None:
+        for url in urls:
+            key = self.storage.key_for_url(url)
+            if key:
+                await run_in_threadpool(self.storage.delete, key)
+
+    async def _content_hash_in_use(
+        self,
+        content_hash: str | None,
+        exclude_image_id: uuid.UUID,
+    ) -> bool:
+        if content_hash is None:
+            return False
+        result = await self.db.execute(
+            select(ProductImage.id)
+            .where(
+                ProductImage.content_hash == content_hash,
+                ProductImage.id != exclude_image_id,
+            )
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
@@ -1,18 +1,45 @@
+import base64
+import binascii
 import uuid
+from datetime import datetime
 
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 
 from app.models.user import User
 from app.repositories.product import ProductRepository
-from app.repositories.review import ReviewRepository
+from app.repositories.review import ReviewRepository, rating_histogram
+from app.repositories.review_cache import ReviewPageCache
 from app.schemas.review import ReviewCreate, ReviewListResponse, ReviewResponse
 
 
+def encode_review_cursor(created_at: datetime, review_id: uuid.UUID) -> str:
+    raw = f"{created_at.isoformat()}|{review_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_review_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, review_id = raw.split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(review_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
 class ReviewService:
-    def __init__(self, review_repo: ReviewRepository, product_repo: ProductRepository):
+    def __init__(
+        self,
+        review_repo: ReviewRepository,
+        product_repo: ProductRepository,
+        review_cache: ReviewPageCache,
+    ):
         self.review_repo = review_repo
         self.product_repo = product_repo
+        self.review_cache = review_cache
 
     async def create_review(
         self,
@@ -47,6 +74,7 @@ class ReviewService:
                 product_id=product_id,
                 rating=payload.rating,
                 comment=payload.comment,
+                reviewer_name=user.full_name,
             )
         except IntegrityError:
             await self.review_repo.db.rollback()
@@ -54,12 +82,13 @@ class ReviewService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="You have already reviewed this product",
             )
+        await self.review_cache.invalidate(product_id)
 
         return ReviewResponse(
             id=review.id,
             user_id=review.user_id,
             product_id=review.product_id,
-            reviewer_name=user.full_name,
+            reviewer_name=review.reviewer_name,
             rating=review.rating,
             comment=review.comment,
             created_at=review.created_at,
@@ -68,44 +97,56 @@ class ReviewService:
     async def get_product_reviews(
         self,
         product_id: uuid.UUID,
-        page: int,
         size: int,
-    ) -> ReviewListResponse:
-        product = await self.product_repo.get_by_id(product_id, include_inactive=True)
-        if not product:
+        cursor: str | None = None,
+        page: int | None = None,
+    ) -> str:
+        """
+        A page of reviews as response JSON, newest first. The first page
+        comes from the cache when present; otherwise one query for the
+        product's rating summary (which also checks it exists) and one for
+        the page. `page` is the deprecated offset paging, never cached.
+        """
+        if page is not None and cursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use either page or cursor, not both",
+            )
+        before = decode_review_cursor(cursor) if cursor else None
+        if before is None and page is None:
+            cached = await self.review_cache.get_first_page(product_id, size)
+            if cached is not None:
+                return cached
+
+        summary = await self.review_repo.get_product_review_summary(product_id)
+        if summary is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Product not found",
             )
 
-        skip = (page - 1) * size
-        reviews, total = await self.review_repo.get_product_reviews(
+        # One extra row tells whether there is a next page.
+        rows = await self.review_repo.get_product_reviews(
             product_id=product_id,
-            skip=skip,
-            limit=size,
+            limit=size + 1,
+            before=before,
+            offset=(page - 1) * size if page else 0,
         )
-        average_rating, review_count = await self.review_repo.get_review_aggregates(
-            product_id
-        )
-
-        items = [
-            ReviewResponse(
-                id=review.id,
-                user_id=review.user_id,
-                product_id=review.product_id,
-                reviewer_name=review.user.full_name,
-                rating=review.rating,
-                comment=review.comment,
-                created_at=review.created_at,
-            )
-            for review in reviews
-        ]
+        items = [ReviewResponse(**row) for row in rows[:size]]
+        next_cursor = None
+        if len(rows) > size:
+            next_cursor = encode_review_cursor(items[-1].created_at, items[-1].id)
 
-        return ReviewListResponse(
+        content = ReviewListResponse(
             items=items,
-            page=page,
             size=size,
-            total=total,
-            average_rating=average_rating,
-            review_count=review_count,
-        )
+            total=summary.review_count,
+            average_rating=round(float(summary.average_rating), 1),
+            review_count=summary.review_count,
+            rating_histogram=rating_histogram(summary),
+            next_cursor=next_cursor,
+            page=page,
+        ).model_dump_json()
+        if before is None and page is None:
+            await self.review_cache.set_first_page(product_id, size, content)
+        return content
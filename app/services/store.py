@@ -49,7 +49,6 @@ class StoreService:
             {
                 "name": store_data.name,
                 "description": store_data.description,
-                "product_count": store_data.product_count,
                 "owner_id": current_user.id,
             }
         )
@@ -0,0 +1,42 @@
+from functools import lru_cache
+
+from app.config import get_settings
+from app.storage.base import StorageBackend, content_key
+from app.storage.local import LocalStorageBackend
+from app.storage.s3 import S3StorageBackend
+
+__all__ = [
+    "LocalStorageBackend",
+    "S3StorageBackend",
+    "StorageBackend",
+    "content_key",
+    "get_storage_backend",
+]
+
+
+@lru_cache
+def get_storage_backend() -> StorageBackend:
+    settings = get_settings()
+    if settings.STORAGE_BACKEND == "s3":
+        missing = [
+            name
+            for name in ("S3_BUCKET", "S3_PUBLIC_BASE_URL")
+            if not getattr(settings, name)
+        ]
+        if missing:
+            raise ValueError(f"STORAGE_BACKEND=s3 requires {', '.join(missing)} to be set")
+        # boto3 is only needed when S3 storage is enabled (the "s3" extra).
+        try:
+            import boto3
+        except ImportError as exc:
+            raise ValueError(
+                "STORAGE_BACKEND=s3 requires boto3; install fastapi-marketplace[s3]"
+            ) from exc
+
+        client = boto3.client("s3", endpoint_url=settings.S3_ENDPOINT_URL)
+        return S3StorageBackend(
+            client=client,
+            bucket=settings.S3_BUCKET,
+            public_base_url=settings.S3_PUBLIC_BASE_URL,
+        )
+    return LocalStorageBackend()
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO
+
+
+class StorageBackend(ABC):
+    """
+    Blob store for uploaded media, addressed by opaque keys such as
+    "products/ab/<sha256>.png".
+
+    Methods are blocking; async callers should go through run_in_threadpool.
+    """
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def save(self, key: str, source_path: Path, content_type: str) -> None:
+        """Move a local file into the store, consuming `source_path`."""
+
+    @abstractmethod
+    def save_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        ...
+
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        ...
+
+    @abstractmethod
+    def key_for_url(self, url: str) -> str | None:
+        ...
+
+
+def content_key(prefix: str, content_hash: str, extension: str) -> str:
+    # Fan out by hash prefix to keep directories (and S3 listings) small.
+    return f"{prefix}/{content_hash[:2]}/{content_hash}{extension}"
@@ -0,0 +1,42 @@
+import os
+from pathlib import Path
+from typing import BinaryIO
+
+from app.storage.base import StorageBackend
+
+
+class LocalStorageBackend(StorageBackend):
+    def __init__(self, root: str = "uploads", url_prefix: str = "/uploads"):
+        self.root = Path(root)
+        self.url_prefix = url_prefix.rstrip("/")
+
+    def _path(self, key: str) -> Path:
+        return self.root / key
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def save(self, key: str, source_path: Path, content_type: str) -> None:
+        target = self._path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(source_path, target)
+
+    def save_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        target = self._path(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{target.name}.part")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, target)
+
+    def open(self, key: str) -> BinaryIO:
+        return self._path(key).open("rb")
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def url(self, key: str) -> str:
+        return f"{self.url_prefix}/{key}"
+
+    def key_for_url(self, url: str) -> str | None:
+        prefix = f"{self.url_prefix}/"
+        return url[len(prefix):] if url.startswith(prefix) else None
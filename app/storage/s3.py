@@ -0,0 +1,59 @@
+import io
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from app.storage.base import StorageBackend
+
+
+class S3StorageBackend(StorageBackend):
+    """
+    Storage on any S3-compatible service (AWS S3, MinIO, R2, ...).
+
+    `client` only needs the boto3 methods used below, so tests can pass an
+    in-memory stand-in instead of a real boto3 client.
+    """
+
+    def __init__(self, client: Any, bucket: str, public_base_url: str):
+        self.client = client
+        self.bucket = bucket
+        self.public_base_url = public_base_url.rstrip("/")
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+        except self.client.exceptions.ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return False
+            raise
+        return True
+
+    def save(self, key: str, source_path: Path, content_type: str) -> None:
+        self.client.upload_file(
+            Filename=str(source_path),
+            Bucket=self.bucket,
+            Key=key,
+            ExtraArgs={"ContentType": content_type},
+        )
+        source_path.unlink(missing_ok=True)
+
+    def save_bytes(self, key: str, data: bytes, content_type: str) -> None:
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+        )
+
+    def open(self, key: str) -> BinaryIO:
+        response = self.client.get_object(Bucket=self.bucket, Key=key)
+        return io.BytesIO(response["Body"].read())
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def url(self, key: str) -> str:
+        return f"{self.public_base_url}/{key}"
+
+    def key_for_url(self, url: str) -> str | None:
+        prefix = f"{self.public_base_url}/"
+        return url[len(prefix):] if url.startswith(prefix) else None
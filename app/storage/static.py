@@ -0,0 +1,133 @@
+import os
+import stat
+from mimetypes import guess_type
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# Every upload lives under a content-hash (or legacy uuid4) filename, so a
+# given URL never changes content and can be cached indefinitely.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Precompressed siblings, in order of preference: photo.svg.br, photo.svg.gz.
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+OFFLOAD_HEADERS = {
+    "x-accel-redirect": "X-Accel-Redirect",
+    "x-sendfile": "X-Sendfile",
+}
+
+
+class UploadStaticFiles(StaticFiles):
+    """
+    StaticFiles for the uploads directory.
+
+    On top of Starlette's defaults (Range requests, If-None-Match) it:
+    - sends far-future immutable Cache-Control and a filename-based ETag,
+    - serves `<file>.br` / `<file>.gz` siblings to clients that accept them,
+    - hides dot-paths such as in-flight uploads in `.incoming/`,
+    - with `offload` set, answers with an X-Accel-Redirect (nginx) or
+      X-Sendfile (Apache/lighttpd) header and no body, so the proxy in front
+      streams the bytes instead of this process.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str,
+        offload: str | None = None,
+        accel_redirect_prefix: str = "/_uploads",
+        **kwargs,
+    ):
+        if offload and offload not in OFFLOAD_HEADERS:
+            raise ValueError(f"Unsupported uploads offload mode: {offload}")
+        super().__init__(directory=directory, **kwargs)
+        self.offload = offload
+        self.accel_redirect_prefix = accel_redirect_prefix.rstrip("/")
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+        if any(part.startswith(".") for part in path.replace("\\", "/").split("/")):
+            raise HTTPException(status_code=404)
+
+        request_headers = Headers(scope=scope)
+        accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+        served_path, full_path, stat_result, encoding, has_siblings = (
+            await anyio.to_thread.run_sync(self._lookup_with_encoding, path, accepted)
+        )
+        if not stat_result or not stat.S_ISREG(stat_result.st_mode):
+            raise HTTPException(status_code=404)
+
+        tag = os.path.basename(path) + (f"-{encoding}" if encoding else "")
+        headers = {
+            "cache-control": IMMUTABLE_CACHE_CONTROL,
+            "etag": f'"{tag}"',
+        }
+        if has_siblings:
+            headers["vary"] = "Accept-Encoding"
+        if encoding:
+            headers["content-encoding"] = encoding
+        media_type = guess_type(path)[0] or "application/octet-stream"
+
+        if self.offload:
+            response = self._offload_response(served_path, full_path, media_type, headers)
+        else:
+            response = FileResponse(
+                full_path,
+                headers=headers,
+                media_type=media_type,
+                stat_result=stat_result,
+            )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _lookup_with_encoding(
+        self, path: str, accepted: set[str]
+    ) -> tuple[str, str, os.stat_result | None, str | None, bool]:
+        # One threadpool hop for the original and its precompressed siblings.
+        full_path, stat_result = self.lookup_path(path)
+        chosen = None
+        has_siblings = False
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            sibling_path, sibling_stat = self.lookup_path(path + suffix)
+            if not sibling_stat or not stat.S_ISREG(sibling_stat.st_mode):
+                continue
+            has_siblings = True
+            if chosen is None and encoding in accepted:
+                chosen = (path + suffix, sibling_path, sibling_stat, encoding)
+
+        if chosen and stat_result:
+            return (*chosen, has_siblings)
+        return path, full_path, stat_result, None, has_siblings
+
+    def _offload_response(
+        self,
+        served_path: str,
+        full_path: str,
+        media_type: str,
+        headers: dict[str, str],
+    ) -> Response:
+        if self.offload == "x-accel-redirect":
+            # An nginx `internal` location aliased to the uploads directory.
+            target = f"{self.accel_redirect_prefix}/{served_path}"
+        else:
+            target = os.path.abspath(full_path)
+        headers[OFFLOAD_HEADERS[self.offload]] = target
+        return Response(headers=headers, media_type=media_type)
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if name:
+            accepted.add(name.strip().lower())
+    return accepted
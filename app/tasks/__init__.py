@@ -1,3 +1,16 @@
+from app.tasks.carts import persist_carts
+from app.tasks.catalog import rebuild_catalog_facets
 from app.tasks.email import send_order_confirmation, send_status_update
+from app.tasks.images import generate_image_variants
+from app.tasks.stats import refresh_platform_stats
+from app.tasks.stores import reconcile_store_product_counts
 
-__all__ = ["send_order_confirmation", "send_status_update"]
+__all__ = [
+    "generate_image_variants",
+    "persist_carts",
+    "rebuild_catalog_facets",
+    "reconcile_store_product_counts",
+    "refresh_platform_stats",
+    "send_order_confirmation",
+    "send_status_update",
+]
@@ -0,0 +1,32 @@
+import asyncio
+import logging
+
+from redis.asyncio import from_url
+
+from app.config import get_settings
+from app.database import task_session
+from app.repositories.redis_cart import RedisCartRepository
+from app.worker import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+async def _persist_carts() -> int:
+    settings = get_settings()
+    if settings.CART_BACKEND != "redis":
+        return 0
+
+    # A fresh client per run: the cached one is bound to the API's event loop.
+    redis = from_url(settings.REDIS_URL, decode_responses=True)
+    try:
+        async with task_session() as session:
+            return await RedisCartRepository(session, redis).persist_dirty_carts()
+    finally:
+        await redis.aclose()
+
+
+@celery_app.task(name="app.tasks.carts.persist_carts")
+def persist_carts() -> None:
+    logger.info("task_start persist_carts")
+    persisted = asyncio.run(_persist_carts())
+    logger.info("task_end persist_carts persisted=%s", persisted)
@@ -0,0 +1,20 @@
+import asyncio
+import logging
+
+from app.database import task_session
+from app.repositories.product import ProductRepository
+from app.worker import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+async def _rebuild_catalog_facets() -> None:
+    async with task_session() as session:
+        await ProductRepository(session).rebuild_facet_counts()
+
+
+@celery_app.task(name="app.tasks.catalog.rebuild_catalog_facets")
+def rebuild_catalog_facets() -> None:
+    logger.info("task_start rebuild_catalog_facets")
+    asyncio.run(_rebuild_catalog_facets())
+    logger.info("task_end rebuild_catalog_facets")
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+import uuid
+
+from sqlalchemy import select, update
+
+from app.config import get_settings
+from app.database import task_session
+from app.models.product_image import ProductImage
+from app.repositories.product import ProductRepository
+from app.storage import get_storage_backend
+from app.utils.image_utils import generate_variants
+from app.worker import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+async def _generate_image_variants(image_id: uuid.UUID) -> None:
+    settings = get_settings()
+    storage = get_storage_backend()
+
+    async with task_session() as session:
+        result = await session.execute(
+            select(
+                ProductImage.product_id,
+                ProductImage.image_url,
+                ProductImage.content_hash,
+            ).where(ProductImage.id == image_id)
+        )
+        row = result.one_or_none()
+        # Release the connection before encoding; it can take a while.
+        await session.commit()
+
+        if not row:
+            logger.info("Skipping variants for deleted image image_id=%s", image_id)
+            return
+
+        source_key = storage.key_for_url(row.image_url)
+        if source_key is None:
+            logger.warning(
+                "Skipping variants for image outside storage image_id=%s url=%s",
+                image_id,
+                row.image_url,
+            )
+            return
+
+        variants = generate_variants(
+            storage=storage,
+            source_key=source_key,
+            content_hash=row.content_hash or image_id.hex,
+            widths=settings.IMAGE_VARIANT_WIDTHS,
+            formats=settings.IMAGE_VARIANT_FORMATS,
+        )
+
+        await session.execute(
+            update(ProductImage)
+            .where(ProductImage.id == image_id)
+            .values(variants=variants)
+        )
+        await ProductRepository(session).sync_image_summary(row.product_id)
+        await session.commit()
+
+
+@celery_app.task(name="app.tasks.images.generate_image_variants")
+def generate_image_variants(image_id: str) -> None:
+    logger.info("task_start generate_image_variants image_id=%s", image_id)
+    asyncio.run(_generate_image_variants(uuid.UUID(image_id)))
+    logger.info("task_end generate_image_variants image_id=%s", image_id)
@@ -0,0 +1,29 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from app.config import get_settings
+from app.database import task_session
+from app.repositories.platform_stats import PlatformStatsRepository
+from app.schemas.admin import PlatformStats
+from app.worker import celery_app
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+async def _refresh_platform_stats() -> None:
+    computed_at = datetime.now(timezone.utc)
+    # Aggregate on the replica when one is configured; write on the primary.
+    async with task_session(settings.STATS_DATABASE_URL) as session:
+        stats = await PlatformStatsRepository(session).compute(now=computed_at)
+    payload = PlatformStats.model_validate(stats).model_dump(mode="json")
+    async with task_session() as session:
+        await PlatformStatsRepository(session).save(payload, computed_at)
+
+
+@celery_app.task(name="app.tasks.stats.refresh_platform_stats")
+def refresh_platform_stats() -> None:
+    logger.info("task_start refresh_platform_stats")
+    asyncio.run(_refresh_platform_stats())
+    logger.info("task_end refresh_platform_stats")
@@ -0,0 +1,20 @@
+import asyncio
+import logging
+
+from app.database import task_session
+from app.repositories.store import StoreRepository
+from app.worker import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+async def _reconcile_store_product_counts() -> int:
+    async with task_session() as session:
+        return await StoreRepository(session).reconcile_product_counts()
+
+
+@celery_app.task(name="app.tasks.stores.reconcile_store_product_counts")
+def reconcile_store_product_counts() -> None:
+    logger.info("task_start reconcile_store_product_counts")
+    corrected = asyncio.run(_reconcile_store_product_counts())
+    logger.info("task_end reconcile_store_product_counts corrected=%s", corrected)
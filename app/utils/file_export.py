@@ -0,0 +1,58 @@
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Mapping, Sequence
+from datetime import datetime
+from typing import Any, Literal
+
+from pydantic import TypeAdapter
+
+FileFormat = Literal["csv", "ndjson"]
+
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_csv_rows(rows: Iterable[Iterable[Any]]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+async def encode_rows(
+    rows: AsyncIterable[Mapping[str, Any]],
+    columns: Sequence[str],
+    file_format: FileFormat,
+    adapter: TypeAdapter,
+    batch_size: int = 1000,
+) -> AsyncIterator[bytes]:
+    """
+    Encode `rows` as CSV (header first) or NDJSON, one chunk per
+    `batch_size` rows, for a StreamingResponse. NDJSON lines are dumped
+    with `adapter`, a TypeAdapter of the row TypedDict.
+    """
+
+    def encode(batch: list[Mapping[str, Any]]) -> bytes:
+        if file_format == "csv":
+            return encode_csv_rows([row[column] for column in columns] for row in batch)
+        return b"".join(adapter.dump_json(dict(row)) + b"\n" for row in batch)
+
+    if file_format == "csv":
+        yield encode_csv_rows([columns])
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield encode(batch)
+            batch = []
+    if batch:
+        yield encode(batch)
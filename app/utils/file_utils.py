@@ -1,11 +1,15 @@
-import os
+import hashlib
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 
 from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
 
 ALLOWED_TYPES = {"image/jpeg", "image/png", "image/webp"}
 MAX_FILE_SIZE = 5 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 256 * 1024
+UPLOAD_TEMP_DIR = "uploads/.incoming"
 
 CONTENT_TYPE_TO_EXT = {
     "image/jpeg": ".jpg",
@@ -14,44 +18,47 @@ CONTENT_TYPE_TO_EXT = {
 }
 
 
-def validate_image(file: UploadFile) -> None:
-    if file.content_type not in ALLOWED_TYPES:
-        raise ValueError("Invalid image type")
-
-    data = file.file.read(MAX_FILE_SIZE + 1)
-    if len(data) > MAX_FILE_SIZE:
-        raise ValueError("File too large")
+@dataclass(frozen=True)
+class StreamedUpload:
+    path: Path
+    size: int
+    content_hash: str
 
-    file.file.seek(0)
 
-
-def save_file(file: UploadFile, upload_dir: str) -> str:
-    upload_path = Path(upload_dir)
-    upload_path.mkdir(parents=True, exist_ok=True)
-
-    extension = CONTENT_TYPE_TO_EXT.get(file.content_type)
-    if not extension:
+def validate_image(file: UploadFile) -> None:
+    # Size is enforced while streaming in stream_upload, so nothing is read here.
+    if file.content_type not in ALLOWED_TYPES:
         raise ValueError("Invalid image type")
 
-    filename = f"{uuid.uuid4()}{extension}"
-    disk_path = upload_path / filename
-
-    with disk_path.open("wb") as output:
-        output.write(file.file.read())
-
-    file.file.seek(0)
-
-    relative_parts = disk_path.parts
-    uploads_index = relative_parts.index("uploads") if "uploads" in relative_parts else None
-    if uploads_index is None:
-        raise ValueError("Upload path must be under uploads directory")
-
-    relative_url = "/" + "/".join(relative_parts[uploads_index:])
-    return relative_url
-
 
-def delete_file(path: str) -> None:
-    normalized = path.lstrip("/")
-    disk_path = Path(normalized)
-    if disk_path.exists() and disk_path.is_file():
-        os.remove(disk_path)
+async def stream_upload(file: UploadFile, temp_dir: str) -> StreamedUpload:
+    """
+    Stream an upload to a temp file in fixed-size chunks.
+
+    The size limit is enforced and the SHA-256 digest computed in the same
+    pass, and every blocking file operation runs in the threadpool, so memory
+    per upload stays at one chunk and the event loop is never blocked. The
+    caller owns the returned file and must move or remove it.
+    """
+    temp_path = Path(temp_dir)
+    await run_in_threadpool(temp_path.mkdir, parents=True, exist_ok=True)
+
+    disk_path = temp_path / f"{uuid.uuid4()}.part"
+    digest = hashlib.sha256()
+    size = 0
+
+    output = await run_in_threadpool(disk_path.open, "wb")
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_FILE_SIZE:
+                raise ValueError("File too large")
+            digest.update(chunk)
+            await run_in_threadpool(output.write, chunk)
+    except BaseException:
+        await run_in_threadpool(output.close)
+        await run_in_threadpool(disk_path.unlink, missing_ok=True)
+        raise
+
+    await run_in_threadpool(output.close)
+    return StreamedUpload(path=disk_path, size=size, content_hash=digest.hexdigest())
@@ -0,0 +1,111 @@
+import io
+import logging
+
+from PIL import Image, ImageOps, features
+
+from app.storage import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+VARIANT_PREFIX = "products/variants"
+
+FORMAT_SAVE_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "avif": {"format": "AVIF", "quality": 55, "speed": 6},
+}
+
+FORMAT_CONTENT_TYPES = {
+    "webp": "image/webp",
+    "avif": "image/avif",
+}
+
+
+def supported_variant_formats(formats: list[str]) -> list[str]:
+    supported = []
+    for fmt in formats:
+        if fmt not in FORMAT_SAVE_OPTIONS:
+            logger.warning("Skipping unknown image variant format=%s", fmt)
+        elif not features.check(fmt):
+            logger.warning("Skipping image variant format=%s (no codec support)", fmt)
+        else:
+            supported.append(fmt)
+    return supported
+
+
+def generate_variants(
+    storage: StorageBackend,
+    source_key: str,
+    content_hash: str,
+    widths: list[int],
+    formats: list[str],
+) -> dict[str, dict[str, str]]:
+    """
+    Encode downscaled copies of a stored image and return their URLs keyed
+    by width and format, e.g. {"400": {"webp": "/uploads/.../<hash>_400.webp"}}.
+
+    Keys are derived from the source content hash, so variants that already
+    exist are reused instead of re-encoded; if all of them exist the image is
+    never decoded. Widths at or above the source width are skipped; the
+    original upload already serves those.
+    """
+    formats = supported_variant_formats(formats)
+
+    with storage.open(source_key) as source, Image.open(source) as original:
+        # Image.open only parses the header, so sizing this plan is cheap.
+        source_width = original.width
+        if original.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+            source_width = original.height
+        targets = {
+            width: {fmt: f"{VARIANT_PREFIX}/{content_hash}_{width}.{fmt}" for fmt in formats}
+            for width in sorted(set(widths), reverse=True)
+            if width < source_width
+        }
+        missing = {
+            key for keys in targets.values() for key in keys.values()
+            if not storage.exists(key)
+        }
+
+        if missing:
+            image = ImageOps.exif_transpose(original)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+            # Downscale from the largest width so each step resizes a smaller image.
+            for width, keys in targets.items():
+                height = max(1, round(image.height * width / image.width))
+                image = image.resize((width, height), Image.Resampling.LANCZOS)
+
+                for fmt, key in keys.items():
+                    if key not in missing:
+                        continue
+                    buffer = io.BytesIO()
+                    image.save(buffer, **FORMAT_SAVE_OPTIONS[fmt])
+                    storage.save_bytes(key, buffer.getvalue(), FORMAT_CONTENT_TYPES[fmt])
+
+    return {
+        str(width): {fmt: storage.url(key) for fmt, key in keys.items()}
+        for width, keys in targets.items()
+    }
+
+
+def select_variant_url(
+    image_url: str,
+    variants: dict[str, dict[str, str]] | None,
+    width: int,
+    preferred_formats: list[str],
+) -> str:
+    """
+    Pick the smallest variant at least `width` pixels wide, in the first
+    preferred format it exists in. Falls back to the original upload when no
+    variant is wide enough (or none were generated yet).
+    """
+    wide_enough = sorted(int(key) for key in variants or {} if int(key) >= width)
+    if not wide_enough:
+        return image_url
+
+    chosen = variants[str(wide_enough[0])]
+
+    for fmt in preferred_formats:
+        if fmt in chosen:
+            return chosen[fmt]
+    return next(iter(chosen.values()), image_url)
@@ -0,0 +1,201 @@
+import codecs
+import csv
+import json
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from app.utils.file_export import FileFormat
+
+IMPORT_COLUMNS = ("name", "description", "price", "stock", "category_id")
+REQUIRED_IMPORT_COLUMNS = {"name", "price", "stock", "category_id"}
+EXPORT_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "price",
+    "stock",
+    "category_id",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
+# An unterminated quoted field would otherwise buffer the rest of the file
+# as one record.
+MAX_CSV_RECORD_LINES = 100
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """A data row of an import (numbered from 1) with its fields or parse error."""
+
+    row: int
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class ImportFormatError(ValueError):
+    """The file as a whole cannot be read (bad header or encoding)."""
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decode UTF-8 chunks and yield complete lines without their newline."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.removesuffix("\r")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise ImportFormatError("File is not valid UTF-8") from exc
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+class _NeedMoreLines(Exception):
+    """The record being parsed continues past the lines received so far."""
+
+
+class _LineFeed:
+    """
+    Input iterator of a csv.reader, refilled from the async line source
+    between records. Running dry mid-record interrupts the reader; the
+    record's lines are then put back and parsed again once more have arrived.
+    """
+
+    def __init__(self) -> None:
+        self.pending: deque[str] = deque()
+        self.consumed: list[str] = []
+
+    def __iter__(self) -> "_LineFeed":
+        return self
+
+    def __next__(self) -> str:
+        if not self.pending:
+            raise _NeedMoreLines
+        line = self.pending.popleft()
+        self.consumed.append(line)
+        return line + "\n"
+
+    def rewind(self) -> None:
+        self.pending.extendleft(reversed(self.consumed))
+        self.consumed.clear()
+
+
+def _parse_csv_records(
+    reader: Iterator[list[str]], feed: _LineFeed, final: bool
+) -> Iterator[list[str] | str]:
+    """Yield the fields (or an error message) of each complete record in `feed`."""
+    while feed.pending:
+        try:
+            fields = next(reader)
+        except _NeedMoreLines:
+            feed.rewind()
+            if not final and len(feed.pending) < MAX_CSV_RECORD_LINES:
+                return
+            # Give up on the line that opened the quote only: the lines after
+            # it are parsed again as records of their own.
+            feed.pending.popleft()
+            yield "Unterminated quoted field"
+            continue
+        except csv.Error as exc:
+            feed.consumed.clear()
+            yield f"Invalid CSV: {exc}"
+            continue
+        feed.consumed.clear()
+        yield fields
+
+
+async def iter_csv_records(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRecord]:
+    """
+    Parse a CSV with a header row, one record at a time. Quoted fields may
+    span lines; a quote inside an unquoted field is a literal character.
+    """
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    header: list[str] | None = None
+    row = 0
+
+    def to_record(parsed: list[str] | str) -> ImportRecord | None:
+        nonlocal header, row
+        if header is None:
+            if isinstance(parsed, str):
+                raise ImportFormatError(f"CSV header could not be read: {parsed}")
+            if _is_blank(parsed):
+                return None
+            header = [field.strip() for field in parsed]
+            missing = REQUIRED_IMPORT_COLUMNS - set(header)
+            if missing:
+                raise ImportFormatError(
+                    f"CSV header is missing columns: {', '.join(sorted(missing))}"
+                )
+            return None
+
+        if isinstance(parsed, str):
+            row += 1
+            return ImportRecord(row=row, error=parsed)
+        if _is_blank(parsed):
+            return None
+        row += 1
+        if len(parsed) != len(header):
+            return ImportRecord(
+                row=row, error=f"Expected {len(header)} columns, got {len(parsed)}"
+            )
+        data = {
+            column: value
+            for column, value in zip(header, parsed)
+            if column in IMPORT_COLUMNS
+        }
+        # CSV has no null: an empty optional column means "not set".
+        if not data.get("description"):
+            data.pop("description", None)
+        return ImportRecord(row=row, data=data)
+
+    async for line in iter_lines(chunks):
+        feed.pending.append(line)
+        for parsed in _parse_csv_records(reader, feed, final=False):
+            record = to_record(parsed)
+            if record is not None:
+                yield record
+    for parsed in _parse_csv_records(reader, feed, final=True):
+        record = to_record(parsed)
+        if record is not None:
+            yield record
+
+    if header is None:
+        raise ImportFormatError("CSV file is empty")
+
+
+def _is_blank(fields: list[str]) -> bool:
+    return len(fields) <= 1 and not "".join(fields).strip()
+
+
+async def iter_ndjson_records(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRecord]:
+    """Parse newline-delimited JSON objects; blank lines are skipped."""
+    row = 0
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield ImportRecord(row=row, error=f"Invalid JSON: {exc.msg}")
+            continue
+        if not isinstance(data, dict):
+            yield ImportRecord(row=row, error="Each line must be a JSON object")
+            continue
+        yield ImportRecord(row=row, data=data)
+
+
+def iter_import_records(
+    chunks: AsyncIterable[bytes], file_format: FileFormat
+) -> AsyncIterator[ImportRecord]:
+    if file_format == "csv":
+        return iter_csv_records(chunks)
+    return iter_ndjson_records(chunks)
@@ -14,3 +14,27 @@ celery_app.conf.update(
     timezone="UTC",
 )
 celery_app.autodiscover_tasks(["app.tasks"])
+
+# Periodic tasks (run with `celery -A app.worker beat`).
+celery_app.conf.beat_schedule = {
+    # Facet counts are maintained incrementally; this only repairs drift.
+    "rebuild-catalog-facets": {
+        "task": "app.tasks.catalog.rebuild_catalog_facets",
+        "schedule": settings.CATALOG_FACETS_REBUILD_INTERVAL_SECONDS,
+    },
+    # Store.product_count is maintained incrementally; this repairs drift.
+    "reconcile-store-product-counts": {
+        "task": "app.tasks.stores.reconcile_store_product_counts",
+        "schedule": settings.STORE_PRODUCT_COUNT_RECONCILE_INTERVAL_SECONDS,
+    },
+    # Admin dashboard snapshot; the stats endpoint only reads it.
+    "refresh-platform-stats": {
+        "task": "app.tasks.stats.refresh_platform_stats",
+        "schedule": settings.PLATFORM_STATS_REFRESH_INTERVAL_SECONDS,
+    },
+}
+if settings.CART_BACKEND == "redis":
+    celery_app.conf.beat_schedule["persist-carts"] = {
+        "task": "app.tasks.carts.persist_carts",
+        "schedule": settings.CART_PERSIST_INTERVAL_SECONDS,
+    }
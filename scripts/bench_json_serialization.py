@@ -0,0 +1,129 @@
+"""
+Benchmark JSON encoding of a product list page.
+
+Builds a PaginatedResponse[ProductListResponse] in memory (no database) and
+times the ways FastAPI can turn it into response bytes:
+
+- jsonable_encoder + json.dumps: JSONResponse, used by routes without a
+  response model (and by every route on FastAPI < 0.130),
+- model_dump(mode="json") + orjson.dumps: the deprecated ORJSONResponse,
+  only when orjson is installed,
+- TypeAdapter.dump_json: what FastAPI does for routes with a response model
+  while the app keeps its default response class.
+
+Every variant must produce the same document, including Decimal prices
+as strings, or the script exits with an error.
+
+    python scripts/bench_json_serialization.py --items 100 --rounds 2000
+"""
+
+import argparse
+import json
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.schemas.pagination import PaginatedResponse  # noqa: E402
+from app.schemas.product import CategoryInfo, ProductListResponse, StoreInfo  # noqa: E402
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+PAGE_TYPE = PaginatedResponse[ProductListResponse]
+
+
+def _build_page(items: int) -> PaginatedResponse[ProductListResponse]:
+    now = datetime.now(timezone.utc)
+    store = StoreInfo(id=uuid.uuid4(), name="Bench Store")
+    category = CategoryInfo(id=uuid.uuid4(), name="Bench Category", slug="bench-category")
+    return PAGE_TYPE(
+        items=[
+            ProductListResponse(
+                id=uuid.uuid4(),
+                name=f"Product {index}",
+                description="A product used to benchmark response encoding.",
+                price=Decimal("1999.90") + index,
+                stock=index,
+                is_active=True,
+                store=store,
+                category=category,
+                primary_image_url=f"/uploads/products/{index:064x}.jpg",
+                image_count=3,
+                thumbnail_url=f"/uploads/products/{index:064x}_400.webp",
+                average_rating=4.5,
+                review_count=12,
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(items)
+        ],
+        total=items * 10,
+        page=1,
+        size=items,
+    )
+
+
+def _variants(page) -> dict:
+    adapter = TypeAdapter(PAGE_TYPE)
+    variants = {
+        "jsonable_encoder + json.dumps": lambda: json.dumps(
+            jsonable_encoder(page),
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8"),
+    }
+    if orjson is not None:
+        variants["model_dump + orjson.dumps"] = lambda: orjson.dumps(
+            page.model_dump(mode="json")
+        )
+    # FastAPI re-validates the endpoint's return value before dumping it.
+    variants["TypeAdapter.dump_json"] = lambda: adapter.dump_json(
+        adapter.validate_python(page)
+    )
+    return variants
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    page = _build_page(args.items)
+    variants = _variants(page)
+
+    reference = None
+    for label, encode in variants.items():
+        document = json.loads(encode())
+        if reference is None:
+            reference = document
+        elif document != reference:
+            sys.exit(f"{label} produced a different document")
+    if not isinstance(reference["items"][0]["price"], str):
+        sys.exit("prices must be serialized as strings")
+
+    print(f"PaginatedResponse[ProductListResponse], {args.items} items")
+    if orjson is None:
+        print("(orjson not installed; skipping the ORJSONResponse variant)")
+    for label, encode in variants.items():
+        encode()  # warm up
+        started = time.perf_counter()
+        for _ in range(args.rounds):
+            body = encode()
+        elapsed = (time.perf_counter() - started) / args.rounds * 1000
+        print(f"{label:<30} {elapsed:8.3f} ms/page ({len(body)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark the product list query against a realistic catalog.
+
+Seeds products with several images each inside a transaction, times the
+old joined-eager-load query against ProductRepository.list (which reads the
+denormalized primary image columns), then rolls everything back.
+
+    python scripts/bench_product_list.py --products 2000 --images 10 --size 100
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+from app.database import AsyncSessionLocal, ensure_database_schema  # noqa: E402
+from app.models.category import Category  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.models.product_image import ProductImage  # noqa: E402
+from app.models.store import Store  # noqa: E402
+from app.models.user import User, UserRole  # noqa: E402
+from app.repositories.product import ProductRepository  # noqa: E402
+
+
+async def _seed(session, products: int, images: int) -> None:
+    owner_id, store_id, category_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    await session.execute(
+        insert(User).values(
+            id=owner_id,
+            email=f"bench-{owner_id.hex[:8]}@example.com",
+            hashed_password="x",
+            full_name="Bench Vendor",
+            role=UserRole.VENDOR,
+        )
+    )
+    await session.execute(
+        insert(Store).values(id=store_id, owner_id=owner_id, name=f"bench-{store_id.hex[:8]}")
+    )
+    await session.execute(
+        insert(Category).values(
+            id=category_id,
+            name=f"bench-{category_id.hex[:8]}",
+            slug=f"bench-{category_id.hex[:8]}",
+        )
+    )
+
+    product_rows = [
+        {
+            "id": uuid.uuid4(),
+            "name": f"Product {index}",
+            "price": Decimal("9.99"),
+            "stock": 10,
+            "store_id": store_id,
+            "category_id": category_id,
+            "is_active": True,
+        }
+        for index in range(products)
+    ]
+    await session.execute(insert(Product), product_rows)
+    await session.execute(
+        insert(ProductImage),
+        [
+            {
+                "id": uuid.uuid4(),
+                "product_id": row["id"],
+                "image_url": f"/uploads/products/{row['id']}_{position}.jpg",
+                "is_primary": position == 0,
+                "sort_order": position,
+            }
+            for row in product_rows
+            for position in range(images)
+        ],
+    )
+    await session.flush()
+    repo = ProductRepository(session)
+    for row in product_rows:
+        await repo.sync_image_summary(row["id"])
+
+
+async def _joined_list(session, size: int) -> int:
+    result = await session.execute(
+        select(Product)
+        .options(
+            joinedload(Product.store),
+            joinedload(Product.category),
+            joinedload(Product.images),
+        )
+        .order_by(Product.created_at.desc())
+        .limit(size)
+    )
+    return len(result.unique().scalars().all())
+
+
+async def _batched_list(session, size: int) -> int:
+    items, _ = await ProductRepository(session).list(page=1, size=size)
+    return len(items)
+
+
+async def _time(label: str, func, session, size: int, rounds: int) -> None:
+    await func(session, size)  # warm up
+    started = time.perf_counter()
+    for _ in range(rounds):
+        session.expunge_all()
+        count = await func(session, size)
+    elapsed = (time.perf_counter() - started) / rounds * 1000
+    print(f"{label:<28} {elapsed:8.2f} ms/page ({count} products)")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--images", type=int, default=10)
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    await ensure_database_schema()
+    async with AsyncSessionLocal() as session:
+        try:
+            await _seed(session, args.products, args.images)
+            print(f"{args.products} products x {args.images} images, page size {args.size}")
+            await _time("joinedload(images)", _joined_list, session, args.size, args.rounds)
+            await _time("list (denormalized image)", _batched_list, session, args.size, args.rounds)
+        finally:
+            await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
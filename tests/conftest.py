@@ -7,6 +7,7 @@ import asyncpg
 import pytest
 import pytest_asyncio
 from dotenv import dotenv_values
+from fakeredis import FakeAsyncRedis
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
 from sqlalchemy.engine import make_url
@@ -53,6 +54,7 @@ from app.database import (  # noqa: E402
     get_db,
 )
 from app.main import app  # noqa: E402
+from app.repositories.category_cache import reset_category_cache  # noqa: E402
 
 
 async def _ensure_test_database_exists() -> None:
@@ -101,6 +103,36 @@ def disable_async_side_effects(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         "app.services.order.send_status_update.delay", lambda *args, **kwargs: None
     )
+    monkeypatch.setattr(
+        "app.services.product_image.generate_image_variants.delay",
+        lambda *args, **kwargs: None,
+    )
+
+
+@pytest.fixture(autouse=True)
+def category_cache_redis(monkeypatch: pytest.MonkeyPatch) -> FakeAsyncRedis:
+    """Category cache version counter in an in-memory fake, per test."""
+    redis = FakeAsyncRedis(decode_responses=True)
+    reset_category_cache()
+    monkeypatch.setattr("app.dependencies.category.get_redis_client", lambda: redis)
+    return redis
+
+
+@pytest.fixture(autouse=True)
+def review_cache_redis(monkeypatch: pytest.MonkeyPatch) -> FakeAsyncRedis:
+    """First review pages cached in an in-memory fake, per test."""
+    redis = FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr("app.dependencies.review.get_redis_client", lambda: redis)
+    return redis
+
+
+@pytest.fixture
+def redis_cart_backend(monkeypatch: pytest.MonkeyPatch) -> FakeAsyncRedis:
+    """Switch carts to the Redis backend, backed by an in-memory fake."""
+    redis = FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(get_settings(), "CART_BACKEND", "redis")
+    monkeypatch.setattr("app.dependencies.cart.get_redis_client", lambda: redis)
+    return redis
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -71,7 +71,6 @@ async def create_test_store(
     payload = {
         "name": overrides.pop("name", _uniq("store")),
         "description": overrides.pop("description", "Test store"),
-        "product_count": overrides.pop("product_count", 0),
     }
     payload.update(overrides)
 
@@ -0,0 +1,64 @@
+import pytest
+
+from app.tasks.stats import _refresh_platform_stats
+from tests.factories import (
+    create_test_address,
+    create_test_category,
+    create_test_product,
+    create_test_store,
+    create_test_user,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_platform_stats_are_served_from_the_refreshed_snapshot(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    customer = await create_test_user(client, role="customer")
+    category = await create_test_category(client, admin["headers"], name="Stats")
+    await create_test_store(client, vendor["headers"], name="Stats Store")
+    product = await create_test_product(
+        client, vendor["headers"], category_id=category["id"], name="Globe", price="25.00"
+    )
+    address = await create_test_address(client, customer["headers"])
+
+    not_ready = await client.get("/api/v1/admin/stats", headers=admin["headers"])
+    assert not_ready.status_code == 404
+    assert not_ready.json()["error"] == "PLATFORM_STATS_NOT_READY"
+
+    add_resp = await client.post(
+        "/api/v1/cart/items",
+        json={"product_id": product["id"], "quantity": 3},
+        headers=customer["headers"],
+    )
+    assert add_resp.status_code == 200
+    place_resp = await client.post(
+        "/api/v1/orders",
+        json={"shipping_address_id": address["id"]},
+        headers=customer["headers"],
+    )
+    assert place_resp.status_code == 201
+
+    await _refresh_platform_stats()
+
+    resp = await client.get("/api/v1/admin/stats", headers=admin["headers"])
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["gmv"] == "75.00"
+    assert body["gmv_last_30d"] == "75.00"
+    assert body["orders_by_status"] == {"pending": 1}
+    assert (body["active_stores"], body["total_stores"]) == (1, 1)
+    assert body["new_users"] == {"last_24h": 3, "last_7d": 3, "last_30d": 3}
+    assert [
+        (item["product_name"], item["store_name"], item["units"], item["revenue"])
+        for item in body["top_products_last_30d"]
+    ] == [("Globe", "Stats Store", 3, "75.00")]
+
+    # Later activity shows up only after the next refresh.
+    await create_test_user(client, role="customer")
+    again = await client.get("/api/v1/admin/stats", headers=admin["headers"])
+    assert again.json() == body
+
+    forbidden = await client.get("/api/v1/admin/stats", headers=customer["headers"])
+    assert forbidden.status_code == 403
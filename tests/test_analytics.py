@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from tests.factories import (
+    create_test_address,
+    create_test_category,
+    create_test_product,
+    create_test_store,
+    create_test_user,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _place_order(client, customer, address, lines):
+    for product, quantity in lines:
+        add_resp = await client.post(
+            "/api/v1/cart/items",
+            json={"product_id": product["id"], "quantity": quantity},
+            headers=customer["headers"],
+        )
+        assert add_resp.status_code == 200
+    place_resp = await client.post(
+        "/api/v1/orders",
+        json={"shipping_address_id": address["id"]},
+        headers=customer["headers"],
+    )
+    assert place_resp.status_code == 201
+    return place_resp.json()
+
+
+async def test_vendor_sales_analytics_follow_orders_and_cancellations(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    customer = await create_test_user(client, role="customer")
+    category = await create_test_category(client, admin["headers"], name="Sales")
+    await create_test_store(client, vendor["headers"], name="Sales Store")
+    lamp = await create_test_product(
+        client, vendor["headers"], category_id=category["id"], name="Lamp", price="40.00"
+    )
+    rug = await create_test_product(
+        client, vendor["headers"], category_id=category["id"], name="Rug", price="100.00"
+    )
+    address = await create_test_address(client, customer["headers"])
+
+    await _place_order(client, customer, address, [(lamp, 2), (rug, 1)])
+    await _place_order(client, customer, address, [(lamp, 1)])
+
+    resp = await client.get("/api/v1/vendor/analytics/sales", headers=vendor["headers"])
+    assert resp.status_code == 200
+    body = resp.json()
+    assert len(body["daily"]) == 30
+    assert body["totals"] == {"units": 4, "revenue": "220.00", "order_count": 2}
+    assert body["daily"][-1]["order_count"] == 2
+    assert [
+        (item["product_name"], item["units"], item["revenue"], item["order_count"])
+        for item in body["top_products"]
+    ] == [("Lamp", 3, "120.00", 2), ("Rug", 1, "100.00", 1)]
+
+    # Cancelling the only item of the second order drops that order; the
+    # first order still counts while its lamp line remains.
+    vendor_orders = (
+        await client.get("/api/v1/vendor/orders", headers=vendor["headers"])
+    ).json()["items"]
+    for item in vendor_orders:
+        if item["product_name"] == "Rug" or item["quantity"] == 1:
+            cancel_resp = await client.patch(
+                f"/api/v1/vendor/orders/{item['order_item_id']}/status",
+                json={"status": "cancelled"},
+                headers=vendor["headers"],
+            )
+            assert cancel_resp.status_code == 200
+
+    body = (
+        await client.get("/api/v1/vendor/analytics/sales", headers=vendor["headers"])
+    ).json()
+    assert body["totals"] == {"units": 2, "revenue": "80.00", "order_count": 1}
+    assert [(item["product_name"], item["units"]) for item in body["top_products"]] == [
+        ("Lamp", 2)
+    ]
+
+    invalid = await client.get(
+        "/api/v1/vendor/analytics/sales?date_from=2026-01-10&date_to=2026-01-01",
+        headers=vendor["headers"],
+    )
+    assert invalid.status_code == 400
+    assert invalid.json()["error"] == "INVALID_DATE_RANGE"
+
+
+async def test_concurrent_cancellations_drop_the_store_order_once(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    customer = await create_test_user(client, role="customer")
+    category = await create_test_category(client, admin["headers"], name="Race")
+    await create_test_store(client, vendor["headers"], name="Race Store")
+    products = [
+        await create_test_product(
+            client, vendor["headers"], category_id=category["id"], name=name
+        )
+        for name in ("Mug", "Bowl", "Plate")
+    ]
+    address = await create_test_address(client, customer["headers"])
+    await _place_order(client, customer, address, [(product, 1) for product in products])
+
+    vendor_orders = (
+        await client.get("/api/v1/vendor/orders", headers=vendor["headers"])
+    ).json()["items"]
+    # Unserialized, each cancellation would still see its siblings as live,
+    # and none of them would drop the order from the store's count.
+    responses = await asyncio.gather(
+        *(
+            client.patch(
+                f"/api/v1/vendor/orders/{item['order_item_id']}/status",
+                json={"status": "cancelled"},
+                headers=vendor["headers"],
+            )
+            for item in vendor_orders
+        )
+    )
+    assert [resp.status_code for resp in responses] == [200, 200, 200]
+
+    body = (
+        await client.get("/api/v1/vendor/analytics/sales", headers=vendor["headers"])
+    ).json()
+    assert body["totals"] == {"units": 0, "revenue": "0.00", "order_count": 0}
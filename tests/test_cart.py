@@ -1,5 +1,13 @@
+import uuid
+
 import pytest
+from sqlalchemy import select
 
+from app.database import AsyncSessionLocal
+from app.models.cart_item import CartItem
+from app.models.product_image import ProductImage
+from app.repositories.product import ProductRepository
+from app.repositories.redis_cart import RedisCartRepository
 from tests.factories import (
     create_test_category,
     create_test_product,
@@ -10,6 +18,14 @@ from tests.factories import (
 pytestmark = pytest.mark.asyncio
 
 
+@pytest.fixture(params=["database", "redis"], autouse=True)
+def cart_backend(request):
+    # Every cart test runs against both cart stores.
+    if request.param == "redis":
+        request.getfixturevalue("redis_cart_backend")
+    return request.param
+
+
 async def test_cart_add_update_remove_flow(client):
     admin = await create_test_user(client, role="admin")
     vendor = await create_test_user(client, role="vendor")
@@ -115,3 +131,224 @@ async def test_cart_update_to_zero_removes_item(client):
     cart_resp = await client.get("/api/v1/cart", headers=customer["headers"])
     assert cart_resp.status_code == 200
     assert cart_resp.json()["items"] == []
+
+
+async def test_cart_add_accumulates_up_to_stock(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    customer = await create_test_user(client, role="customer")
+
+    category = await create_test_category(client, admin["headers"])
+    await create_test_store(client, vendor["headers"])
+    product = await create_test_product(
+        client,
+        vendor["headers"],
+        category_id=category["id"],
+        stock=5,
+    )
+
+    for _ in range(2):
+        resp = await client.post(
+            "/api/v1/cart/items",
+            json={"product_id": product["id"], "quantity": 2},
+            headers=customer["headers"],
+        )
+        assert resp.status_code == 200
+
+    resp = await client.post(
+        "/api/v1/cart/items",
+        json={"product_id": product["id"], "quantity": 2},
+        headers=customer["headers"],
+    )
+    assert resp.status_code == 400
+    assert resp.json()["error"] == "INSUFFICIENT_STOCK"
+
+    cart_resp = await client.get("/api/v1/cart", headers=customer["headers"])
+    assert cart_resp.json()["items"][0]["quantity"] == 4
+
+
+async def test_cart_bulk_add_and_replace_report_rejected_lines(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    customer = await create_test_user(client, role="customer")
+
+    category = await create_test_category(client, admin["headers"])
+    await create_test_store(client, vendor["headers"])
+    first = await create_test_product(
+        client, vendor["headers"], category_id=category["id"], stock=10
+    )
+    second = await create_test_product(
+        client, vendor["headers"], category_id=category["id"], stock=3
+    )
+    missing_id = "00000000-0000-0000-0000-000000000000"
+
+    resp = await client.post(
+        "/api/v1/cart/items/bulk",
+        json={
+            "items": [
+                {"product_id": first["id"], "quantity": 2},
+                {"product_id": second["id"], "quantity": 4},
+                {"product_id": missing_id, "quantity": 1},
+                {"product_id": first["id"], "quantity": 1},
+            ]
+        },
+        headers=customer["headers"],
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["updated"] == [first["id"]]
+    assert {line["product_id"]: line["error"] for line in body["rejected"]} == {
+        second["id"]: "INSUFFICIENT_STOCK",
+        missing_id: "PRODUCT_NOT_FOUND",
+    }
+
+    resp = await client.post(
+        "/api/v1/cart/items/bulk",
+        json={
+            "mode": "replace",
+            "items": [
+                {"product_id": first["id"], "quantity": 1},
+                {"product_id": second["id"], "quantity": 3},
+            ],
+        },
+        headers=customer["headers"],
+    )
+    assert resp.status_code == 200
+    assert resp.json()["rejected"] == []
+
+    cart_resp = await client.get("/api/v1/cart", headers=customer["headers"])
+    quantities = {
+        item["product_id"]: item["quantity"] for item in cart_resp.json()["items"]
+    }
+    assert quantities == {first["id"]: 1, second["id"]: 3}
+
+
+async def test_cart_lines_show_primary_image(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    customer = await create_test_user(client, role="customer")
+
+    category = await create_test_category(client, admin["headers"])
+    await create_test_store(client, vendor["headers"])
+    product = await create_test_product(
+        client, vendor["headers"], category_id=category["id"], price="12.50", stock=3
+    )
+    plain = await create_test_product(
+        client, vendor["headers"], category_id=category["id"], stock=3
+    )
+
+    async with AsyncSessionLocal() as session:
+        session.add_all(
+            [
+                ProductImage(
+                    product_id=product["id"],
+                    image_url=f"/uploads/products/{index}.png",
+                    is_primary=index == 2,
+                    sort_order=index,
+                )
+                for index in range(4)
+            ]
+        )
+        await ProductRepository(session).sync_image_summary(product["id"])
+        await session.commit()
+
+    for item in (product, plain):
+        resp = await client.post(
+            "/api/v1/cart/items",
+            json={"product_id": item["id"], "quantity": 2},
+            headers=customer["headers"],
+        )
+        assert resp.status_code == 200
+
+    cart = (await client.get("/api/v1/cart", headers=customer["headers"])).json()
+    lines = {item["product_id"]: item for item in cart["items"]}
+    assert lines[product["id"]]["product_image"] == "/uploads/products/2.png"
+    assert lines[product["id"]]["line_subtotal"] == "25.00"
+    assert lines[product["id"]]["available"] is True
+    assert lines[plain["id"]]["product_image"] is None
+
+
+async def test_redis_cart_is_written_back_to_database(
+    client, cart_backend, redis_cart_backend
+):
+    if cart_backend != "redis":
+        pytest.skip("Redis cart only")
+
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    customer = await create_test_user(client, role="customer")
+
+    category = await create_test_category(client, admin["headers"])
+    await create_test_store(client, vendor["headers"])
+    product = await create_test_product(
+        client, vendor["headers"], category_id=category["id"], stock=5
+    )
+
+    resp = await client.post(
+        "/api/v1/cart/items",
+        json={"product_id": product["id"], "quantity": 2},
+        headers=customer["headers"],
+    )
+    assert resp.status_code == 200
+
+    async def stored_quantities():
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(CartItem.product_id, CartItem.quantity)
+            )
+            return {str(product_id): quantity for product_id, quantity in result}
+
+    assert await stored_quantities() == {}
+
+    async with AsyncSessionLocal() as session:
+        repo = RedisCartRepository(session, redis_cart_backend)
+        assert await repo.persist_dirty_carts() == 1
+    assert await stored_quantities() == {product["id"]: 2}
+
+    resp = await client.delete("/api/v1/cart", headers=customer["headers"])
+    assert resp.status_code == 204
+    cart_resp = await client.get("/api/v1/cart", headers=customer["headers"])
+    assert cart_resp.json()["items"] == []
+
+    async with AsyncSessionLocal() as session:
+        await RedisCartRepository(session, redis_cart_backend).persist_dirty_carts()
+    assert await stored_quantities() == {}
+
+
+async def test_rolled_back_checkout_keeps_redis_cart(
+    client, cart_backend, redis_cart_backend
+):
+    if cart_backend != "redis":
+        pytest.skip("Redis cart only")
+
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    customer = await create_test_user(client, role="customer")
+
+    category = await create_test_category(client, admin["headers"])
+    await create_test_store(client, vendor["headers"])
+    product = await create_test_product(
+        client, vendor["headers"], category_id=category["id"], stock=5
+    )
+    resp = await client.post(
+        "/api/v1/cart/items",
+        json={"product_id": product["id"], "quantity": 2},
+        headers=customer["headers"],
+    )
+    assert resp.status_code == 200
+
+    # Checkout deletes the rows in its transaction; Redis is only cleared
+    # after that commits, so a rollback leaves the cart as it was.
+    user_id = uuid.UUID(customer["user"]["id"])
+    async with AsyncSessionLocal() as session:
+        repo = RedisCartRepository(session, redis_cart_backend)
+        await repo.clear_cart(user_id, commit=False)
+        await session.rollback()
+
+    cart_resp = await client.get("/api/v1/cart", headers=customer["headers"])
+    assert [item["quantity"] for item in cart_resp.json()["items"]] == [2]
+
+    async with AsyncSessionLocal() as session:
+        await RedisCartRepository(session, redis_cart_backend).persist_dirty_carts()
+        result = await session.execute(select(CartItem.quantity))
+        assert list(result.scalars()) == [2]
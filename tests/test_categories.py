@@ -0,0 +1,153 @@
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import event, update
+
+from app.database import AsyncSessionLocal, engine
+from app.models.category import Category
+from app.repositories.category import CategoryRepository
+from app.repositories.category_cache import CATEGORY_VERSION_KEY
+from tests.factories import (
+    create_test_category,
+    create_test_product,
+    create_test_store,
+    create_test_user,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def category_queries():
+    """Statements against the categories table, as executed."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM categories" in statement:
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def test_category_reads_are_served_from_the_cache(client, category_queries):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    await create_test_store(client, vendor["headers"])
+    category = await create_test_category(client, admin["headers"], name="Garden")
+
+    first = await client.get("/api/v1/categories")
+    assert [item["name"] for item in first.json()] == ["Garden"]
+    assert category_queries  # the snapshot load
+
+    category_queries.clear()
+    second = await client.get("/api/v1/categories")
+    await create_test_product(client, vendor["headers"], category_id=category["id"])
+    assert second.json() == first.json()
+    assert category_queries == []
+
+    update_resp = await client.put(
+        f"/api/v1/categories/{category['id']}",
+        json={"name": "Garden Tools"},
+        headers=admin["headers"],
+    )
+    assert update_resp.status_code == 200
+    listed = await client.get("/api/v1/categories")
+    assert [item["slug"] for item in listed.json()] == ["garden-tools"]
+
+
+async def test_category_cache_follows_version_bumps_from_other_processes(
+    client, category_cache_redis
+):
+    admin = await create_test_user(client, role="admin")
+    category = await create_test_category(client, admin["headers"], name="Books")
+    assert [item["name"] for item in (await client.get("/api/v1/categories")).json()] == [
+        "Books"
+    ]
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(Category).where(Category.id == category["id"]).values(is_active=False)
+        )
+        await session.commit()
+
+    # Not bumped yet: this process still serves its snapshot.
+    assert len((await client.get("/api/v1/categories")).json()) == 1
+
+    await category_cache_redis.incr(CATEGORY_VERSION_KEY)
+    assert (await client.get("/api/v1/categories")).json() == []
+
+
+async def test_category_reads_fall_back_to_database_without_redis(
+    client, category_cache_redis, monkeypatch
+):
+    admin = await create_test_user(client, role="admin")
+    await create_test_category(client, admin["headers"], name="Toys")
+
+    async def unavailable(*args, **kwargs):
+        raise RedisConnectionError("Redis is down")
+
+    monkeypatch.setattr(category_cache_redis, "get", unavailable)
+    resp = await client.get("/api/v1/categories")
+    assert resp.status_code == 200
+    assert [item["name"] for item in resp.json()] == ["Toys"]
+
+
+async def test_category_slugs_take_the_next_free_suffix(client, monkeypatch):
+    admin = await create_test_user(client, role="admin")
+    slugs = [
+        (await create_test_category(client, admin["headers"], name=name))["slug"]
+        for name in ("Garden", "Garden!", "Garden?")
+    ]
+    assert slugs == ["garden", "garden-1", "garden-2"]
+
+    # A stale allocation (as if a concurrent insert took the slug) hits the
+    # unique constraint and is retried with a fresh one.
+    calls = []
+    original = CategoryRepository.get_slug_usage
+
+    async def get_slug_usage(self, bases, exclude_category_id=None):
+        calls.append(bases)
+        if len(calls) == 1:
+            return {}
+        return await original(self, bases, exclude_category_id)
+
+    monkeypatch.setattr(CategoryRepository, "get_slug_usage", get_slug_usage)
+    category = await create_test_category(client, admin["headers"], name="Garden.")
+    assert category["slug"] == "garden-3"
+    assert len(calls) == 2
+
+
+async def test_bulk_category_import(client):
+    admin = await create_test_user(client, role="admin")
+    await create_test_category(client, admin["headers"], name="Garden")
+
+    resp = await client.post(
+        "/api/v1/categories/bulk",
+        json={
+            "items": [
+                {"name": "Tools"},
+                {"name": "Tools!"},
+                {"name": "Tools"},
+                {"name": "Garden"},
+                {"name": "Garden & Patio"},
+                {"name": "!!!"},
+            ]
+        },
+        headers=admin["headers"],
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [(item["name"], item["slug"]) for item in body["created"]] == [
+        ("Tools", "tools"),
+        ("Tools!", "tools-1"),
+        ("Garden & Patio", "garden-patio"),
+    ]
+    assert sorted((item["name"], item["error"]) for item in body["rejected"]) == [
+        ("!!!", "INVALID_CATEGORY_NAME"),
+        ("Garden", "CATEGORY_NAME_NOT_UNIQUE"),
+        ("Tools", "CATEGORY_NAME_REPEATED"),
+    ]
+
+    listed = await client.get("/api/v1/categories")
+    assert len(listed.json()) == 4
@@ -1,3 +1,7 @@
+import csv
+import io
+import json
+
 import pytest
 
 from tests.factories import (
@@ -37,7 +41,12 @@ async def _setup_order_context(client):
     }
 
 
-async def test_order_placement_success_stock_decrement_snapshot_and_cart_clear(client):
+@pytest.mark.parametrize("cart_backend", ["database", "redis"])
+async def test_order_placement_success_stock_decrement_snapshot_and_cart_clear(
+    client, request, cart_backend
+):
+    if cart_backend == "redis":
+        request.getfixturevalue("redis_cart_backend")
     ctx = await _setup_order_context(client)
 
     add_resp = await client.post(
@@ -172,6 +181,30 @@ async def test_order_status_transition_rules(client):
     assert invalid_transition.status_code == 400
     assert invalid_transition.json()["error"] == "INVALID_STATUS_TRANSITION"
 
+    unknown_status = await client.patch(
+        f"/api/v1/vendor/orders/{order_item_id}/status",
+        json={"status": "CONFIRMED"},
+        headers=ctx["vendor"]["headers"],
+    )
+    assert unknown_status.status_code == 400
+    assert unknown_status.json()["error"] == "INVALID_STATUS"
+
+    # Existence and ownership are checked before the status value.
+    missing_item = await client.patch(
+        "/api/v1/vendor/orders/00000000-0000-0000-0000-000000000000/status",
+        json={"status": "bogus"},
+        headers=ctx["vendor"]["headers"],
+    )
+    assert missing_item.status_code == 404
+    other_vendor = await create_test_user(client, role="vendor")
+    await create_test_store(client, other_vendor["headers"], name="Other Order Store")
+    not_owner = await client.patch(
+        f"/api/v1/vendor/orders/{order_item_id}/status",
+        json={"status": "bogus"},
+        headers=other_vendor["headers"],
+    )
+    assert not_owner.status_code == 403
+
     confirmed = await client.patch(
         f"/api/v1/vendor/orders/{order_item_id}/status",
         json={"status": "confirmed"},
@@ -199,3 +232,90 @@ async def test_order_status_transition_rules(client):
     )
     assert order_detail.status_code == 200
     assert order_detail.json()["status"] == "delivered"
+
+    delivered_orders = await client.get(
+        "/api/v1/me/orders",
+        params={"status": "delivered"},
+        headers=ctx["customer"]["headers"],
+    )
+    assert delivered_orders.status_code == 200
+    assert [item["id"] for item in delivered_orders.json()["items"]] == [order["id"]]
+
+    invalid_filter = await client.get(
+        "/api/v1/me/orders",
+        params={"status": "lost"},
+        headers=ctx["customer"]["headers"],
+    )
+    assert invalid_filter.status_code == 400
+    assert invalid_filter.json()["error"] == "INVALID_STATUS"
+
+
+async def test_vendor_order_export_streams_filtered_items(client):
+    ctx = await _setup_order_context(client)
+    vendor_headers = ctx["vendor"]["headers"]
+
+    for quantity in (1, 2):
+        add_resp = await client.post(
+            "/api/v1/cart/items",
+            json={"product_id": ctx["product"]["id"], "quantity": quantity},
+            headers=ctx["customer"]["headers"],
+        )
+        assert add_resp.status_code == 200
+        place_resp = await client.post(
+            "/api/v1/orders",
+            json={"shipping_address_id": ctx["address"]["id"]},
+            headers=ctx["customer"]["headers"],
+        )
+        assert place_resp.status_code == 201
+
+    vendor_orders = await client.get("/api/v1/vendor/orders", headers=vendor_headers)
+    first_item = next(
+        item for item in vendor_orders.json()["items"] if item["quantity"] == 1
+    )
+    confirmed = await client.patch(
+        f"/api/v1/vendor/orders/{first_item['order_item_id']}/status",
+        json={"status": "confirmed"},
+        headers=vendor_headers,
+    )
+    assert confirmed.status_code == 200
+
+    export = await client.get(
+        "/api/v1/vendor/orders/export",
+        params={"status": "pending"},
+        headers=vendor_headers,
+    )
+    assert export.status_code == 200
+    assert export.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(export.text)))
+    assert [(row["quantity"], row["item_status"]) for row in rows] == [("2", "pending")]
+    assert rows[0]["product_name"] == "Order Product"
+    assert rows[0]["subtotal"] == "200.00"
+    assert rows[0]["city"] == "Austin"
+
+    export = await client.get(
+        "/api/v1/vendor/orders/export",
+        params={"format": "ndjson"},
+        headers=vendor_headers,
+    )
+    lines = [json.loads(line) for line in export.text.splitlines()]
+    assert [line["quantity"] for line in lines] == [1, 2]
+    assert lines[0]["order_item_id"] == first_item["order_item_id"]
+
+    export = await client.get(
+        "/api/v1/vendor/orders/export",
+        params={"created_to": "2000-01-01T00:00:00+00:00"},
+        headers=vendor_headers,
+    )
+    assert export.text.splitlines() == [
+        "order_item_id,order_number,item_status,created_at,customer_name,product_id,"
+        "product_name,quantity,unit_price,subtotal,address_line_1,address_line_2,"
+        "city,state,postal_code,country"
+    ]
+
+    invalid = await client.get(
+        "/api/v1/vendor/orders/export",
+        params={"status": "lost"},
+        headers=vendor_headers,
+    )
+    assert invalid.status_code == 400
+    assert invalid.json()["error"] == "INVALID_STATUS"
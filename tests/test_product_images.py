@@ -0,0 +1,406 @@
+import gzip
+import hashlib
+import io
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from PIL import Image
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.main import app
+from app.models.image_blob import ImageBlob
+from app.models.product_image import ProductImage
+from app.storage import S3StorageBackend, get_storage_backend
+from app.storage.static import UploadStaticFiles
+from app.tasks.images import _generate_image_variants
+from tests.factories import (
+    create_test_category,
+    create_test_product,
+    create_test_store,
+    create_test_user,
+)
+
+pytestmark = pytest.mark.asyncio
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 2048
+
+
+@pytest.fixture(autouse=True)
+def isolated_uploads(tmp_path, monkeypatch):
+    # Uploads are written relative to the working directory.
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+async def _setup_vendor_product(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+
+    category = await create_test_category(client, admin["headers"])
+    await create_test_store(client, vendor["headers"])
+    product = await create_test_product(
+        client,
+        vendor["headers"],
+        category_id=category["id"],
+    )
+    return vendor, product
+
+
+async def test_upload_streams_file_and_records_hash(client, isolated_uploads):
+    vendor, product = await _setup_vendor_product(client)
+
+    resp = await client.post(
+        f"/api/v1/products/{product['id']}/images",
+        files={"file": ("photo.png", PNG_BYTES, "image/png")},
+        data={"is_primary": "true"},
+        headers=vendor["headers"],
+    )
+    assert resp.status_code == 201, resp.text
+    body = resp.json()
+    assert body["is_primary"] is True
+
+    content_hash = hashlib.sha256(PNG_BYTES).hexdigest()
+    assert body["image_url"] == (
+        f"/uploads/products/{content_hash[:2]}/{content_hash}.png"
+    )
+
+    disk_path = isolated_uploads / body["image_url"].lstrip("/")
+    assert disk_path.read_bytes() == PNG_BYTES
+    assert list((isolated_uploads / "uploads" / ".incoming").iterdir()) == []
+
+    async with AsyncSessionLocal() as session:
+        image = (
+            await session.execute(
+                select(ProductImage).where(ProductImage.id == body["id"])
+            )
+        ).scalar_one()
+    assert image.content_hash == content_hash
+    assert image.file_size == len(PNG_BYTES)
+
+
+async def test_upload_rejects_oversized_file_without_leftovers(
+    client, isolated_uploads, monkeypatch
+):
+    monkeypatch.setattr("app.utils.file_utils.MAX_FILE_SIZE", 1024)
+    vendor, product = await _setup_vendor_product(client)
+
+    resp = await client.post(
+        f"/api/v1/products/{product['id']}/images",
+        files={"file": ("photo.png", PNG_BYTES, "image/png")},
+        headers=vendor["headers"],
+    )
+    assert resp.status_code == 400
+    assert resp.json()["error"] == "INVALID_IMAGE_UPLOAD"
+
+    assert list((isolated_uploads / "uploads" / ".incoming").iterdir()) == []
+    assert not (isolated_uploads / "uploads" / "products").exists()
+
+
+async def test_identical_uploads_share_one_blob(client, isolated_uploads):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    category = await create_test_category(client, admin["headers"])
+    await create_test_store(client, vendor["headers"])
+
+    image_ids = []
+    image_urls = set()
+    for _ in range(2):
+        product = await create_test_product(
+            client,
+            vendor["headers"],
+            category_id=category["id"],
+        )
+        resp = await client.post(
+            f"/api/v1/products/{product['id']}/images",
+            files={"file": ("photo.png", PNG_BYTES, "image/png")},
+            headers=vendor["headers"],
+        )
+        assert resp.status_code == 201, resp.text
+        image_ids.append(resp.json()["id"])
+        image_urls.add(resp.json()["image_url"])
+
+    assert len(image_urls) == 1
+    disk_path = isolated_uploads / image_urls.pop().lstrip("/")
+
+    async with AsyncSessionLocal() as session:
+        blob = (await session.execute(select(ImageBlob))).scalar_one()
+    assert blob.ref_count == 2
+
+    resp = await client.delete(
+        f"/api/v1/product-images/{image_ids[0]}", headers=vendor["headers"]
+    )
+    assert resp.status_code == 204
+    assert disk_path.exists()
+
+    resp = await client.delete(
+        f"/api/v1/product-images/{image_ids[1]}", headers=vendor["headers"]
+    )
+    assert resp.status_code == 204
+    assert not disk_path.exists()
+
+    async with AsyncSessionLocal() as session:
+        assert (await session.execute(select(ImageBlob))).first() is None
+
+
+async def test_failed_delete_keeps_stored_files(client, isolated_uploads, monkeypatch):
+    vendor, product = await _setup_vendor_product(client)
+    resp = await client.post(
+        f"/api/v1/products/{product['id']}/images",
+        files={"file": ("photo.png", PNG_BYTES, "image/png")},
+        headers=vendor["headers"],
+    )
+    assert resp.status_code == 201, resp.text
+    image = resp.json()
+    disk_path = isolated_uploads / image["image_url"].lstrip("/")
+
+    async def failing_commit(self):
+        raise RuntimeError("commit failed")
+
+    with monkeypatch.context() as patch, pytest.raises(RuntimeError):
+        patch.setattr(AsyncSession, "commit", failing_commit)
+        await client.delete(
+            f"/api/v1/product-images/{image['id']}", headers=vendor["headers"]
+        )
+
+    # The rolled-back rows still reference the file, so it must still be there.
+    assert disk_path.exists()
+    async with AsyncSessionLocal() as session:
+        assert await session.get(ProductImage, uuid.UUID(image["id"])) is not None
+        blob = (
+            await session.execute(
+                select(ImageBlob).where(
+                    ImageBlob.content_hash == hashlib.sha256(PNG_BYTES).hexdigest()
+                )
+            )
+        ).scalar_one()
+    assert blob.ref_count == 1
+
+
+class _FakeS3Client:
+    class exceptions:
+        class ClientError(Exception):
+            def __init__(self, code):
+                self.response = {"Error": {"Code": code}}
+
+    def __init__(self):
+        self.objects = {}
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise self.exceptions.ClientError("404")
+        return {}
+
+    def upload_file(self, Filename, Bucket, Key, ExtraArgs):
+        with open(Filename, "rb") as source:
+            self.objects[Key] = source.read()
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        self.objects[Key] = Body
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+
+async def test_upload_to_s3_backend(client, isolated_uploads):
+    s3_client = _FakeS3Client()
+    storage = S3StorageBackend(
+        client=s3_client,
+        bucket="media",
+        public_base_url="https://cdn.example.com",
+    )
+    app.dependency_overrides[get_storage_backend] = lambda: storage
+    try:
+        vendor, product = await _setup_vendor_product(client)
+
+        resp = await client.post(
+            f"/api/v1/products/{product['id']}/images",
+            files={"file": ("photo.png", PNG_BYTES, "image/png")},
+            headers=vendor["headers"],
+        )
+        assert resp.status_code == 201, resp.text
+        body = resp.json()
+
+        content_hash = hashlib.sha256(PNG_BYTES).hexdigest()
+        key = f"products/{content_hash[:2]}/{content_hash}.png"
+        assert body["image_url"] == f"https://cdn.example.com/{key}"
+        assert s3_client.objects == {key: PNG_BYTES}
+
+        resp = await client.delete(
+            f"/api/v1/product-images/{body['id']}", headers=vendor["headers"]
+        )
+        assert resp.status_code == 204
+        assert s3_client.objects == {}
+    finally:
+        app.dependency_overrides.pop(get_storage_backend, None)
+
+
+async def test_s3_backend_requires_bucket_and_public_url(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "STORAGE_BACKEND", "s3")
+    monkeypatch.setattr(settings, "S3_BUCKET", "media")
+    monkeypatch.setattr(settings, "S3_PUBLIC_BASE_URL", None)
+    get_storage_backend.cache_clear()
+    try:
+        with pytest.raises(ValueError, match="S3_PUBLIC_BASE_URL"):
+            get_storage_backend()
+    finally:
+        get_storage_backend.cache_clear()
+
+
+async def test_variants_generated_and_list_returns_smallest_fit(
+    client, isolated_uploads
+):
+    vendor, product = await _setup_vendor_product(client)
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (1600, 900), color=(200, 40, 40)).save(buffer, format="PNG")
+
+    upload_resp = await client.post(
+        f"/api/v1/products/{product['id']}/images",
+        files={"file": ("photo.png", buffer.getvalue(), "image/png")},
+        data={"is_primary": "true"},
+        headers=vendor["headers"],
+    )
+    assert upload_resp.status_code == 201, upload_resp.text
+    image = upload_resp.json()
+
+    await _generate_image_variants(uuid.UUID(image["id"]))
+
+    list_resp = await client.get("/api/v1/products?image_width=300")
+    assert list_resp.status_code == 200
+    item = list_resp.json()["items"][0]
+    assert item["image_count"] == 1
+    assert item["primary_image_url"] == image["image_url"]
+    assert item["thumbnail_url"].endswith("_400.avif")
+
+    with Image.open(isolated_uploads / item["thumbnail_url"].lstrip("/")) as thumb:
+        assert thumb.size == (400, 225)
+
+    wide_resp = await client.get("/api/v1/products?image_width=2000")
+    assert wide_resp.json()["items"][0]["thumbnail_url"] == image["image_url"]
+
+
+async def test_product_primary_image_kept_in_sync(client, isolated_uploads):
+    vendor, product = await _setup_vendor_product(client)
+
+    async def upload(payload: bytes, is_primary: bool) -> dict:
+        resp = await client.post(
+            f"/api/v1/products/{product['id']}/images",
+            files={"file": ("photo.png", payload, "image/png")},
+            data={"is_primary": str(is_primary).lower(), "sort_order": "0"},
+            headers=vendor["headers"],
+        )
+        assert resp.status_code == 201, resp.text
+        return resp.json()
+
+    async def listed() -> dict:
+        resp = await client.get("/api/v1/products")
+        return resp.json()["items"][0]
+
+    first = await upload(PNG_BYTES, is_primary=False)
+    item = await listed()
+    assert item["primary_image_url"] == first["image_url"]
+    assert item["image_count"] == 1
+
+    second = await upload(PNG_BYTES + b"\x01", is_primary=True)
+    item = await listed()
+    assert item["primary_image_url"] == second["image_url"]
+    assert item["image_count"] == 2
+
+    resp = await client.delete(
+        f"/api/v1/product-images/{second['id']}", headers=vendor["headers"]
+    )
+    assert resp.status_code == 204
+    item = await listed()
+    assert item["primary_image_url"] == first["image_url"]
+    assert item["image_count"] == 1
+
+    resp = await client.delete(
+        f"/api/v1/product-images/{first['id']}", headers=vendor["headers"]
+    )
+    assert resp.status_code == 204
+    item = await listed()
+    assert item["primary_image_url"] is None
+    assert item["image_count"] == 0
+
+
+async def test_uploads_served_with_immutable_caching(client, isolated_uploads):
+    vendor, product = await _setup_vendor_product(client)
+    upload_resp = await client.post(
+        f"/api/v1/products/{product['id']}/images",
+        files={"file": ("photo.png", PNG_BYTES, "image/png")},
+        headers=vendor["headers"],
+    )
+    image_url = upload_resp.json()["image_url"]
+
+    resp = await client.get(image_url)
+    assert resp.status_code == 200
+    assert resp.content == PNG_BYTES
+    assert resp.headers["cache-control"] == "public, max-age=31536000, immutable"
+    etag = resp.headers["etag"]
+
+    resp = await client.get(image_url, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+    resp = await client.get(image_url, headers={"Range": "bytes=0-7"})
+    assert resp.status_code == 206
+    assert resp.content == PNG_BYTES[:8]
+
+
+async def test_uploads_serve_precompressed_and_hide_temp_files(
+    client, isolated_uploads
+):
+    asset = isolated_uploads / "uploads" / "products" / "logo.svg"
+    asset.parent.mkdir(parents=True)
+    svg = b"<svg xmlns='http://www.w3.org/2000/svg'>" + b" " * 512 + b"</svg>"
+    asset.write_bytes(svg)
+    asset.with_name("logo.svg.gz").write_bytes(gzip.compress(svg))
+
+    resp = await client.get(
+        "/uploads/products/logo.svg", headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["content-type"].startswith("image/svg+xml")
+    assert "Accept-Encoding" in resp.headers["vary"]
+    assert resp.content == svg
+
+    resp = await client.get(
+        "/uploads/products/logo.svg", headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in resp.headers
+    assert "Accept-Encoding" in resp.headers["vary"]
+
+    incoming = isolated_uploads / "uploads" / ".incoming"
+    incoming.mkdir()
+    (incoming / "pending.part").write_bytes(PNG_BYTES)
+    resp = await client.get("/uploads/.incoming/pending.part")
+    assert resp.status_code == 404
+
+
+async def test_uploads_offload_to_proxy(isolated_uploads):
+    asset = isolated_uploads / "uploads" / "products" / "photo.png"
+    asset.parent.mkdir(parents=True)
+    asset.write_bytes(PNG_BYTES)
+
+    static_app = UploadStaticFiles(
+        directory="uploads",
+        offload="x-accel-redirect",
+        accel_redirect_prefix="/_uploads",
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=static_app), base_url="http://test"
+    ) as static_client:
+        resp = await static_client.get("/products/photo.png")
+
+    assert resp.status_code == 200
+    assert resp.headers["x-accel-redirect"] == "/_uploads/products/photo.png"
+    assert resp.headers["content-type"] == "image/png"
+    assert resp.content == b""
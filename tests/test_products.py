@@ -1,5 +1,14 @@
+import csv
+import io
+import json
+
 import pytest
+from sqlalchemy import select
 
+from app.database import AsyncSessionLocal
+from app.models.catalog_facet import CatalogFacetCount
+from app.models.product_image import ProductImage
+from app.repositories.product import ProductRepository
 from tests.factories import (
     create_test_category,
     create_test_product,
@@ -140,3 +149,352 @@ async def test_create_product_invalid_price_rejected(client):
         headers=vendor["headers"],
     )
     assert resp.status_code == 422
+
+
+async def test_product_list_returns_primary_image_url_and_count(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    category = await create_test_category(client, admin["headers"])
+    await create_test_store(client, vendor["headers"])
+
+    with_images = await create_test_product(
+        client, vendor["headers"], category_id=category["id"]
+    )
+    without_images = await create_test_product(
+        client, vendor["headers"], category_id=category["id"]
+    )
+
+    async with AsyncSessionLocal() as session:
+        session.add_all(
+            [
+                ProductImage(
+                    product_id=with_images["id"],
+                    image_url=f"/uploads/products/{index}.png",
+                    is_primary=index == 7,
+                    sort_order=index,
+                )
+                for index in range(10)
+            ]
+        )
+        await ProductRepository(session).sync_image_summary(with_images["id"])
+        await session.commit()
+
+    resp = await client.get("/api/v1/products")
+    items = {item["id"]: item for item in resp.json()["items"]}
+    assert len(items) == 2
+    assert items[with_images["id"]]["image_count"] == 10
+    assert items[with_images["id"]]["primary_image_url"] == "/uploads/products/7.png"
+    assert "images" not in items[with_images["id"]]
+    assert items[without_images["id"]]["image_count"] == 0
+    assert items[without_images["id"]]["primary_image_url"] is None
+
+
+async def test_product_list_card_view_returns_compact_items(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    category = await create_test_category(client, admin["headers"])
+    await create_test_store(client, vendor["headers"])
+    product = await create_test_product(
+        client,
+        vendor["headers"],
+        category_id=category["id"],
+        price="19.90",
+        stock=0,
+    )
+
+    full_resp = await client.get("/api/v1/products")
+    card_resp = await client.get("/api/v1/products?view=card")
+    assert card_resp.status_code == 200
+    assert len(card_resp.content) < len(full_resp.content)
+
+    body = card_resp.json()
+    assert body["total"] == 1
+    assert body["pages"] == 1
+    assert body["items"] == [
+        {
+            "id": product["id"],
+            "name": product["name"],
+            "price": "19.90",
+            "in_stock": False,
+            "thumbnail_url": None,
+            "average_rating": 0.0,
+            "review_count": 0,
+        }
+    ]
+
+
+
+async def test_product_facets_follow_catalog_changes(client):
+    admin = await create_test_user(client, role="admin")
+    vendor_a = await create_test_user(client, role="vendor")
+    vendor_b = await create_test_user(client, role="vendor")
+    phones = await create_test_category(client, admin["headers"], name="Phones")
+    laptops = await create_test_category(client, admin["headers"], name="Laptops")
+    store_a = await create_test_store(client, vendor_a["headers"], name="A Store")
+    store_b = await create_test_store(client, vendor_b["headers"], name="B Store")
+
+    await create_test_product(
+        client, vendor_a["headers"], category_id=phones["id"], name="Alpha", price="20.00"
+    )
+    beta = await create_test_product(
+        client, vendor_a["headers"], category_id=phones["id"], name="Beta", price="120.00"
+    )
+    gamma = await create_test_product(
+        client, vendor_a["headers"], category_id=laptops["id"], name="Gamma", price="800.00"
+    )
+    await create_test_product(
+        client, vendor_b["headers"], category_id=phones["id"], name="Delta", price="30.00"
+    )
+
+    def counts(values):
+        return {value["name"]: value["count"] for value in values}
+
+    def buckets(body):
+        return [
+            (bucket["min_price"], bucket["max_price"], bucket["count"])
+            for bucket in body["price_buckets"]
+        ]
+
+    resp = await client.get("/api/v1/products/facets")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["total"] == 4
+    assert counts(body["categories"]) == {"Laptops": 1, "Phones": 3}
+    assert counts(body["stores"]) == {"A Store": 3, "B Store": 1}
+    assert buckets(body) == [
+        ("0.00", "25.00", 1),
+        ("25.00", "50.00", 1),
+        ("100.00", "250.00", 1),
+        ("500.00", "1000.00", 1),
+    ]
+
+    # Each facet ignores its own filter but applies the others.
+    body = (await client.get(f"/api/v1/products/facets?category_id={phones['id']}")).json()
+    assert body["total"] == 3
+    assert counts(body["categories"]) == {"Laptops": 1, "Phones": 3}
+    assert counts(body["stores"]) == {"A Store": 2, "B Store": 1}
+
+    # Price changes and deactivation move the stored counts.
+    update_resp = await client.put(
+        f"/api/v1/products/{beta['id']}",
+        json={"price": "30.00"},
+        headers=vendor_a["headers"],
+    )
+    assert update_resp.status_code == 200
+    delete_resp = await client.delete(
+        f"/api/v1/products/{gamma['id']}", headers=vendor_a["headers"]
+    )
+    assert delete_resp.status_code == 204
+
+    body = (await client.get("/api/v1/products/facets")).json()
+    assert body["total"] == 3
+    assert counts(body["categories"]) == {"Phones": 3}
+    assert buckets(body) == [("0.00", "25.00", 1), ("25.00", "50.00", 2)]
+
+    body = (
+        await client.get(f"/api/v1/products/facets?store_id={store_b['id']}&search=delta")
+    ).json()
+    assert body["total"] == 1
+    assert counts(body["stores"]) == {"B Store": 1}
+    assert counts(body["categories"]) == {"Phones": 1}
+
+    body = (await client.get("/api/v1/products/facets?min_price=25")).json()
+    assert body["total"] == 2
+    assert counts(body["stores"]) == {"A Store": 1, "B Store": 1}
+    assert buckets(body) == [("0.00", "25.00", 1), ("25.00", "50.00", 2)]
+
+    async with AsyncSessionLocal() as session:
+        query = select(CatalogFacetCount).where(CatalogFacetCount.product_count > 0)
+
+        def snapshot(rows):
+            return sorted(
+                (row.category_id, row.store_id, row.price_bucket, row.product_count)
+                for row in rows
+            )
+
+        incremental = snapshot((await session.scalars(query)).all())
+        await ProductRepository(session).rebuild_facet_counts()
+        assert snapshot((await session.scalars(query)).all()) == incremental
+    assert store_a["id"] in {str(row[1]) for row in incremental}
+
+
+async def test_vendor_product_import_and_export(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    category = await create_test_category(client, admin["headers"], name="Kitchen")
+    store = await create_test_store(client, vendor["headers"], name="Import Store")
+    category_id = category["id"]
+    missing_category = "00000000-0000-0000-0000-000000000000"
+
+    csv_body = (
+        "name,description,price,stock,category_id\n"
+        f"Kettle,,30.00,4,{category_id}\n"
+        f'"Pan, large","Cast\niron",45.50,2,{category_id}\n'
+        f"Broken,,-1,2,{category_id}\n"
+        f"Orphan,,10.00,1,{missing_category}\n"
+        "Short,row\n"
+    )
+    resp = await client.post(
+        "/api/v1/products/import?format=csv",
+        content=csv_body.encode(),
+        headers={**vendor["headers"], "Content-Type": "text/csv"},
+    )
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["created"] == 2
+    assert [(item["row"], item["error"]) for item in body["rejected"]] == [
+        (3, "INVALID_ROW"),
+        (4, "CATEGORY_NOT_FOUND"),
+        (5, "INVALID_ROW"),
+    ]
+    assert body["rejected"][0]["detail"].startswith("price:")
+
+    ndjson_body = (
+        f'{{"name": "Whisk", "price": "5.00", "stock": 9, "category_id": "{category_id}"}}\n'
+        "not json\n"
+    )
+    resp = await client.post(
+        "/api/v1/products/import?format=ndjson",
+        content=ndjson_body.encode(),
+        headers={**vendor["headers"], "Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["created"] == 1
+    assert [item["row"] for item in resp.json()["rejected"]] == [2]
+
+    bad_header = await client.post(
+        "/api/v1/products/import?format=csv",
+        content=b"title,price\nKettle,1.00\n",
+        headers=vendor["headers"],
+    )
+    assert bad_header.status_code == 400
+    assert bad_header.json()["error"] == "INVALID_IMPORT_FILE"
+
+    # Imported rows are counted like any other product.
+    store_resp = await client.get(f"/api/v1/stores/{store['id']}")
+    assert store_resp.json()["product_count"] == 3
+    facets = (await client.get("/api/v1/products/facets")).json()
+    assert facets["total"] == 3
+
+    export = await client.get("/api/v1/products/export", headers=vendor["headers"])
+    assert export.status_code == 200
+    assert export.headers["content-type"].startswith("text/csv")
+    assert "products.csv" in export.headers["content-disposition"]
+    reader = csv.DictReader(io.StringIO(export.text))
+    exported = {row["name"]: row for row in reader}
+    assert set(exported) == {"Kettle", "Pan, large", "Whisk"}
+    assert exported["Pan, large"]["description"] == "Cast\niron"
+    assert exported["Kettle"]["description"] == ""
+    assert exported["Kettle"]["price"] == "30.00"
+
+    export = await client.get(
+        "/api/v1/products/export?format=ndjson", headers=vendor["headers"]
+    )
+    lines = [json.loads(line) for line in export.text.splitlines()]
+    assert sorted(line["name"] for line in lines) == ["Kettle", "Pan, large", "Whisk"]
+    assert {line["price"] for line in lines} == {"30.00", "45.50", "5.00"}
+
+    customer = await create_test_user(client, role="customer")
+    forbidden = await client.get("/api/v1/products/export", headers=customer["headers"])
+    assert forbidden.status_code == 403
+
+
+
+async def test_csv_import_treats_stray_quotes_per_row(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    category = await create_test_category(client, admin["headers"], name="Workshop")
+    await create_test_store(client, vendor["headers"], name="Quote Store")
+    category_id = category["id"]
+
+    csv_body = (
+        "name,description,price,stock,category_id\n"
+        f'Ruler,12" steel,5.00,3,{category_id}\n'
+        f'Square,6" by 6",7.00,2,{category_id}\n'
+        f'"Unclosed,,1.00,1,{category_id}\n'
+        f"Clamp,,9.00,4,{category_id}\n"
+        f"Vise,,20.00,1,{category_id}\n"
+    )
+    resp = await client.post(
+        "/api/v1/products/import?format=csv",
+        content=csv_body.encode(),
+        headers={**vendor["headers"], "Content-Type": "text/csv"},
+    )
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["created"] == 4
+    assert [(item["row"], item["detail"]) for item in body["rejected"]] == [
+        (3, "Unterminated quoted field")
+    ]
+
+    listed = await client.get("/api/v1/products", params={"search": "Ruler"})
+    assert listed.json()["items"][0]["description"] == '12" steel'
+
+
+async def test_vendor_bulk_inventory_update(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    other_vendor = await create_test_user(client, role="vendor")
+    category = await create_test_category(client, admin["headers"], name="Garden")
+    await create_test_store(client, vendor["headers"], name="Sync Store")
+    await create_test_store(client, other_vendor["headers"], name="Other Store")
+
+    def product(headers, **overrides):
+        return create_test_product(client, headers, category_id=category["id"], **overrides)
+
+    hose = await product(vendor["headers"], name="Hose", price="20.00", stock=10)
+    rake = await product(vendor["headers"], name="Rake", price="30.00", stock=5)
+    spade = await product(vendor["headers"], name="Spade", price="40.00", stock=1)
+    foreign = await product(other_vendor["headers"], name="Foreign", price="10.00")
+    missing = "00000000-0000-0000-0000-000000000000"
+
+    resp = await client.patch(
+        "/api/v1/products/inventory",
+        json={
+            "items": [
+                {"product_id": hose["id"], "stock_delta": -3, "price": "60.00"},
+                {"product_id": rake["id"], "stock": 0, "price_delta": "-5.50"},
+                {"product_id": spade["id"], "stock_delta": -2},
+                {"product_id": foreign["id"], "stock": 1},
+                {"product_id": missing, "stock": 1},
+                {"product_id": hose["id"], "stock": 1},
+            ]
+        },
+        headers=vendor["headers"],
+    )
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["updated"] == [hose["id"], rake["id"]]
+    assert {item["product_id"]: item["error"] for item in body["rejected"]} == {
+        spade["id"]: "INVALID_STOCK",
+        foreign["id"]: "PRODUCT_OWNERSHIP_REQUIRED",
+        missing: "PRODUCT_NOT_FOUND",
+        hose["id"]: "PRODUCT_REPEATED",
+    }
+
+    hose_after = (await client.get(f"/api/v1/products/{hose['id']}")).json()
+    assert (hose_after["stock"], hose_after["price"]) == (7, "60.00")
+    rake_after = (await client.get(f"/api/v1/products/{rake['id']}")).json()
+    assert (rake_after["stock"], rake_after["price"]) == (0, "24.50")
+
+    # Repricing moves the facet buckets.
+    facets = (await client.get("/api/v1/products/facets")).json()
+    assert [
+        (bucket["min_price"], bucket["count"]) for bucket in facets["price_buckets"]
+    ] == [("0.00", 2), ("25.00", 1), ("50.00", 1)]
+
+    # Columns left empty on every row still get their types.
+    resp = await client.patch(
+        "/api/v1/products/inventory",
+        json={"items": [{"product_id": spade["id"], "stock": 4}]},
+        headers=vendor["headers"],
+    )
+    assert resp.json() == {"updated": [spade["id"]], "rejected": []}
+
+    invalid = await client.patch(
+        "/api/v1/products/inventory",
+        json={"items": [{"product_id": hose["id"], "stock": 1, "stock_delta": 1}]},
+        headers=vendor["headers"],
+    )
+    assert invalid.status_code == 422
+
@@ -0,0 +1,87 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import delete, event, text
+
+from app.database import AsyncSessionLocal, engine
+from app.models.cart_item import CartItem
+from app.repositories.order import OrderItemRepository, OrderRepository
+from app.repositories.product import ProductRepository
+from app.repositories.review import ReviewRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _explain(run) -> str:
+    """
+    Run `run(session)`, then EXPLAIN the last statement it issued (the page
+    query itself, not the count that precedes it). Sequential scans are
+    disabled so the planner takes any index matching the query shape, however
+    few rows the test tables hold.
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    async with AsyncSessionLocal() as session:
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            await run(session)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+        connection = await session.connection()
+        await connection.execute(text("SET LOCAL enable_seqscan = off"))
+        statement, parameters = statements[-1]
+        result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plan = "\n".join(row[0] for row in result)
+        await session.rollback()
+    return plan
+
+
+@pytest.mark.parametrize(
+    ("index_name", "run"),
+    [
+        (
+            "ix_orders_user_id_created_at",
+            lambda db: OrderRepository(db).get_user_orders(uuid.uuid4(), page=1, size=20),
+        ),
+        (
+            "ix_order_items_store_id_created_at",
+            lambda db: OrderItemRepository(db).get_vendor_order_items(
+                uuid.uuid4(), page=1, size=20
+            ),
+        ),
+        (
+            "ix_products_category_id_is_active_price",
+            lambda db: ProductRepository(db).list(
+                page=1,
+                size=20,
+                category_id=uuid.uuid4(),
+                min_price=Decimal("10"),
+                sort_by="price",
+                sort_order="asc",
+            ),
+        ),
+        (
+            "ix_products_average_rating_review_count",
+            lambda db: ProductRepository(db).list(
+                page=1, size=20, min_rating=Decimal("4"), sort_by="rating"
+            ),
+        ),
+        (
+            "ix_reviews_product_id_created_at_id",
+            lambda db: ReviewRepository(db).get_product_reviews(uuid.uuid4(), limit=21),
+        ),
+        # What ON DELETE CASCADE runs against cart_items when a product is deleted.
+        (
+            "ix_cart_items_product_id",
+            lambda db: db.execute(delete(CartItem).where(CartItem.product_id == uuid.uuid4())),
+        ),
+    ],
+)
+async def test_query_uses_index(index_name, run):
+    plan = await _explain(run)
+    assert index_name in plan, plan
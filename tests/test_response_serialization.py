@@ -0,0 +1,25 @@
+import importlib
+import pkgutil
+
+from fastapi import APIRouter
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+
+import app.routers
+from app.main import app as fastapi_app
+
+
+def test_api_routes_keep_pydantic_json_serialization():
+    # FastAPI only dumps response models straight to JSON bytes (pydantic-core)
+    # while the route keeps the default response class; a custom class such
+    # as ORJSONResponse falls back to the slower dict + encoder path.
+    assert isinstance(fastapi_app.router.default_response_class, DefaultPlaceholder)
+    for module_info in pkgutil.iter_modules(app.routers.__path__):
+        module = importlib.import_module(f"app.routers.{module_info.name}")
+        router = getattr(module, "router", None)
+        if not isinstance(router, APIRouter):
+            continue
+        assert isinstance(router.default_response_class, DefaultPlaceholder)
+        for route in router.routes:
+            if isinstance(route, APIRoute):
+                assert isinstance(route.response_class, DefaultPlaceholder), route.path
@@ -70,3 +70,223 @@ async def test_create_and_list_reviews(client):
     body = list_resp.json()
     assert body["total"] == 1
     assert body["items"][0]["rating"] == 5
+
+
+async def _deliver_and_review(client, vendor, product, rating):
+    customer = await create_test_user(client, role="customer")
+    address = await create_test_address(client, customer["headers"])
+    add_cart_resp = await client.post(
+        "/api/v1/cart/items",
+        json={"product_id": product["id"], "quantity": 1},
+        headers=customer["headers"],
+    )
+    assert add_cart_resp.status_code == 200, add_cart_resp.text
+    order_resp = await client.post(
+        "/api/v1/orders",
+        json={"shipping_address_id": address["id"]},
+        headers=customer["headers"],
+    )
+    assert order_resp.status_code == 201, order_resp.text
+    order_number = order_resp.json()["order_number"]
+    vendor_orders_resp = await client.get(
+        "/api/v1/vendor/orders", headers=vendor["headers"]
+    )
+    assert vendor_orders_resp.status_code == 200, vendor_orders_resp.text
+    order_item_id = next(
+        item["order_item_id"]
+        for item in vendor_orders_resp.json()["items"]
+        if item["order_number"] == order_number
+    )
+    for next_status in ("confirmed", "shipped", "delivered"):
+        update_resp = await client.patch(
+            f"/api/v1/vendor/orders/{order_item_id}/status",
+            json={"status": next_status},
+            headers=vendor["headers"],
+        )
+        assert update_resp.status_code == 200, update_resp.text
+
+    create_resp = await client.post(
+        f"/api/v1/products/{product['id']}/reviews",
+        json={"rating": rating},
+        headers=customer["headers"],
+    )
+    assert create_resp.status_code == 201, create_resp.text
+    return customer, create_resp.json()
+
+
+async def test_list_reviews_by_cursor_with_cached_first_page(client, review_cache_redis):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    category = await create_test_category(client, admin["headers"], name="Paged Reviews Cat")
+    await create_test_store(client, vendor["headers"], name="Paged Review Store")
+    product = await create_test_product(
+        client,
+        vendor["headers"],
+        category_id=category["id"],
+        name="Paged Review Product",
+        stock=10,
+    )
+    url = f"/api/v1/products/{product['id']}/reviews"
+
+    customers, reviews = [], []
+    for rating in (3, 4, 5):
+        customer, review = await _deliver_and_review(client, vendor, product, rating)
+        customers.append(customer)
+        reviews.append(review)
+
+    first_resp = await client.get(url, params={"size": 2})
+    assert first_resp.status_code == 200, first_resp.text
+    first = first_resp.json()
+    assert [item["id"] for item in first["items"]] == [reviews[2]["id"], reviews[1]["id"]]
+    assert first["total"] == 3
+    assert first["review_count"] == 3
+    assert first["average_rating"] == 4.0
+    assert first["next_cursor"]
+    assert await review_cache_redis.exists(f"reviews:first-page:{product['id']}")
+
+    second_resp = await client.get(url, params={"size": 2, "cursor": first["next_cursor"]})
+    assert second_resp.status_code == 200, second_resp.text
+    second = second_resp.json()
+    assert [item["id"] for item in second["items"]] == [reviews[0]["id"]]
+    assert second["next_cursor"] is None
+
+    # The deprecated offset parameter still pages, and hands over a cursor.
+    legacy_resp = await client.get(url, params={"size": 2, "page": 2})
+    assert legacy_resp.status_code == 200, legacy_resp.text
+    legacy = legacy_resp.json()
+    assert [item["id"] for item in legacy["items"]] == [reviews[0]["id"]]
+    assert legacy["page"] == 2
+    assert legacy["next_cursor"] is None
+    legacy_first = (await client.get(url, params={"size": 2, "page": 1})).json()
+    assert legacy_first["next_cursor"] == first["next_cursor"]
+    both_resp = await client.get(url, params={"page": 1, "cursor": first["next_cursor"]})
+    assert both_resp.status_code == 400, both_resp.text
+
+    # A new review drops the cached first page.
+    _, newest = await _deliver_and_review(client, vendor, product, 1)
+    refreshed = (await client.get(url, params={"size": 2})).json()
+    assert refreshed["items"][0]["id"] == newest["id"]
+    assert refreshed["total"] == 4
+
+    # Reviews carry the author's current name.
+    rename_resp = await client.put(
+        "/api/v1/auth/me",
+        json={"full_name": "Renamed Reviewer"},
+        headers=customers[0]["headers"],
+    )
+    assert rename_resp.status_code == 200, rename_resp.text
+    page = (await client.get(url, params={"size": 2, "cursor": first["next_cursor"]})).json()
+    assert page["items"][0]["reviewer_name"] == "Renamed Reviewer"
+
+    bad_cursor_resp = await client.get(url, params={"cursor": "not-a-cursor"})
+    assert bad_cursor_resp.status_code == 400, bad_cursor_resp.text
+
+    missing_resp = await client.get(
+        "/api/v1/products/00000000-0000-0000-0000-000000000000/reviews"
+    )
+    assert missing_resp.status_code == 404, missing_resp.text
+
+
+async def test_review_requires_delivered_item(client):
+    admin = await create_test_user(client, role="admin")
+    customer = await create_test_user(client, role="customer")
+    category = await create_test_category(client, admin["headers"], name="Verified Cat")
+    vendors, products = [], []
+    for name in ("Verified Store A", "Verified Store B"):
+        vendor = await create_test_user(client, role="vendor")
+        await create_test_store(client, vendor["headers"], name=name)
+        product = await create_test_product(
+            client, vendor["headers"], category_id=category["id"], name=f"{name} Product"
+        )
+        vendors.append(vendor)
+        products.append(product)
+        add_cart_resp = await client.post(
+            "/api/v1/cart/items",
+            json={"product_id": product["id"], "quantity": 1},
+            headers=customer["headers"],
+        )
+        assert add_cart_resp.status_code == 200, add_cart_resp.text
+
+    address = await create_test_address(client, customer["headers"])
+    order_resp = await client.post(
+        "/api/v1/orders",
+        json={"shipping_address_id": address["id"]},
+        headers=customer["headers"],
+    )
+    assert order_resp.status_code == 201, order_resp.text
+
+    # Only the first store delivers; the order as a whole stays open.
+    vendor_orders_resp = await client.get(
+        "/api/v1/vendor/orders", headers=vendors[0]["headers"]
+    )
+    order_item_id = vendor_orders_resp.json()["items"][0]["order_item_id"]
+    for next_status in ("confirmed", "shipped", "delivered"):
+        update_resp = await client.patch(
+            f"/api/v1/vendor/orders/{order_item_id}/status",
+            json={"status": next_status},
+            headers=vendors[0]["headers"],
+        )
+        assert update_resp.status_code == 200, update_resp.text
+
+    delivered_resp = await client.post(
+        f"/api/v1/products/{products[0]['id']}/reviews",
+        json={"rating": 4},
+        headers=customer["headers"],
+    )
+    assert delivered_resp.status_code == 201, delivered_resp.text
+
+    pending_resp = await client.post(
+        f"/api/v1/products/{products[1]['id']}/reviews",
+        json={"rating": 4},
+        headers=customer["headers"],
+    )
+    assert pending_resp.status_code == 403, pending_resp.text
+
+
+async def test_rating_summary_sorts_and_filters_products(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    category = await create_test_category(client, admin["headers"], name="Rated Cat")
+    store = await create_test_store(client, vendor["headers"], name="Rated Store")
+    products = {
+        name: await create_test_product(
+            client, vendor["headers"], category_id=category["id"], name=name, stock=10
+        )
+        for name in ("Unrated", "Average", "Favourite")
+    }
+    for name, rating in (("Favourite", 5), ("Favourite", 4), ("Average", 3)):
+        await _deliver_and_review(client, vendor, products[name], rating)
+
+    detail_resp = await client.get(f"/api/v1/products/{products['Favourite']['id']}")
+    assert detail_resp.status_code == 200, detail_resp.text
+    detail = detail_resp.json()
+    assert detail["average_rating"] == 4.5
+    assert detail["review_count"] == 2
+    assert detail["rating_histogram"] == {"1": 0, "2": 0, "3": 0, "4": 1, "5": 1}
+
+    reviews_resp = await client.get(
+        f"/api/v1/products/{products['Average']['id']}/reviews"
+    )
+    histogram = reviews_resp.json()["rating_histogram"]
+    assert histogram == {"1": 0, "2": 0, "3": 1, "4": 0, "5": 0}
+
+    for view in ("full", "card"):
+        sorted_resp = await client.get(
+            "/api/v1/products",
+            params={"store_id": store["id"], "sort_by": "rating", "view": view},
+        )
+        assert sorted_resp.status_code == 200, sorted_resp.text
+        assert [item["name"] for item in sorted_resp.json()["items"]] == [
+            "Favourite",
+            "Average",
+            "Unrated",
+        ]
+
+        filtered_resp = await client.get(
+            "/api/v1/products",
+            params={"store_id": store["id"], "min_rating": 4, "view": view},
+        )
+        assert filtered_resp.status_code == 200, filtered_resp.text
+        filtered = filtered_resp.json()
+        assert filtered["total"] == 1
+        assert filtered["items"][0]["average_rating"] == 4.5
@@ -1,6 +1,15 @@
 import pytest
-
-from tests.factories import create_test_user
+from sqlalchemy import update
+
+from app.database import AsyncSessionLocal
+from app.models.store import Store
+from app.repositories.store import StoreRepository
+from tests.factories import (
+    create_test_category,
+    create_test_product,
+    create_test_store,
+    create_test_user,
+)
 
 pytestmark = pytest.mark.asyncio
 
@@ -80,3 +89,46 @@ async def test_admin_can_deactivate_store_and_public_get_returns_404(client):
 
     public_get = await client.get(f"/api/v1/stores/{store['id']}")
     assert public_get.status_code == 404
+
+
+async def test_store_product_count_tracks_active_products(client):
+    admin = await create_test_user(client, role="admin")
+    vendor = await create_test_user(client, role="vendor")
+    category = await create_test_category(client, admin["headers"])
+
+    # Client-supplied counts are ignored.
+    store = await create_test_store(client, vendor["headers"], product_count=42)
+    assert store["product_count"] == 0
+
+    first = await create_test_product(client, vendor["headers"], category_id=category["id"])
+    await create_test_product(client, vendor["headers"], category_id=category["id"])
+
+    async def product_count() -> int:
+        resp = await client.get(f"/api/v1/stores/{store['id']}")
+        assert resp.status_code == 200
+        return resp.json()["product_count"]
+
+    assert await product_count() == 2
+
+    delete_resp = await client.delete(
+        f"/api/v1/products/{first['id']}", headers=vendor["headers"]
+    )
+    assert delete_resp.status_code == 204
+    assert await product_count() == 1
+
+    reactivate = await client.put(
+        f"/api/v1/products/{first['id']}",
+        json={"is_active": True},
+        headers=vendor["headers"],
+    )
+    assert reactivate.status_code == 200
+    assert await product_count() == 2
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(Store).where(Store.id == store["id"]).values(product_count=7)
+        )
+        await session.commit()
+        assert await StoreRepository(session).reconcile_product_counts(batch_size=1) == 1
+        assert await StoreRepository(session).reconcile_product_counts() == 0
+    assert await product_count() == 2
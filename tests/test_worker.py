@@ -0,0 +1,10 @@
+from app.worker import celery_app
+
+
+def test_beat_schedule_tasks_are_registered_on_the_worker():
+    # The worker only imports what autodiscovery finds (the app.tasks package);
+    # a scheduled task living in a module it never imports is rejected by the
+    # worker as unregistered.
+    celery_app.loader.import_default_modules()
+    for entry in celery_app.conf.beat_schedule.values():
+        assert entry["task"] in celery_app.tasks, entry["task"]